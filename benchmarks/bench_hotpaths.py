@@ -0,0 +1,420 @@
+"""
+Benchmarks for the frame reduction, element conversion and IOD hot paths.
+
+Each case is timed at a range of input sizes and the results are written to a
+JSON file so that two runs can be compared:
+
+    python benchmarks/bench_hotpaths.py --out before.json
+    python benchmarks/bench_hotpaths.py --out after.json
+    python benchmarks/bench_hotpaths.py --compare before.json after.json
+
+Vectorized cases are called once with arrays of n inputs. Scalar cases are
+called n times in a loop and are skipped above --max-loop calls. A case that
+raises is recorded with its error and the run carries on, but exits non-zero;
+--compare likewise fails on a case that errored in either file.
+"""
+
+import argparse
+import json
+import os
+import platform
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+SIZES = (1, 100, 10000, 1000000)
+
+CASES = {}
+
+
+def case(name, vectorized=False):
+    """Register a case. The decorated function takes n and returns a callable."""
+    def register(setup):
+        CASES[name] = (setup, vectorized)
+        return setup
+    return register
+
+
+def _epochs(n, seed=0):
+    rng = np.random.default_rng(seed)
+    ttt = rng.uniform(0.0, 0.3, n)
+    jdut1 = 2451545.0 + ttt * 36525.0
+    return ttt, jdut1
+
+
+def _states(n, seed=0):
+    rng = np.random.default_rng(seed)
+    r = rng.normal(size=(n, 3))
+    r *= rng.uniform(6700.0, 42164.0, (n, 1)) / np.linalg.norm(r, axis=1)[:, None]
+    v = rng.normal(size=(n, 3))
+    v *= rng.uniform(0.8, 1.1, (n, 1)) * np.sqrt(398600.4415 / np.linalg.norm(r, axis=1))[:, None] \
+        / np.linalg.norm(v, axis=1)[:, None]
+    return r, v
+
+
+def _sightings(n):
+    """
+    Three right ascension/declination sightings of one pass, repeated n times.
+
+    The pass is fixed rather than random: an 8000 km circular orbit seen from a
+    site at 22.9 deg latitude, well above the horizon at all three sightings and
+    with line-of-sight vectors far from coplanar, so the Gauss polynomial has a
+    real root and every IOD case runs to completion.
+    """
+    mu = 398600.4415
+    re = 6378.1363
+    a, incl, u0, lat = 8000.0, 0.9, 0.1, 0.4
+    t = np.array([-300.0, 0.0, 300.0])
+    u = u0 + np.sqrt(mu / a ** 3) * t
+    r = a * np.stack((np.cos(u), np.sin(u) * np.cos(incl), np.sin(u) * np.sin(incl)), axis=1)
+    theta = 7.292115e-5 * t
+    rs = re * np.stack((np.cos(lat) * np.cos(theta), np.cos(lat) * np.sin(theta),
+                        np.full(3, np.sin(lat))), axis=1)
+    rho = r - rs
+    rtasc = np.arctan2(rho[:, 1], rho[:, 0])
+    decl = np.arcsin(rho[:, 2] / np.linalg.norm(rho, axis=1))
+    jd = 2451545.0 + t / 86400.0
+    return [(decl, rtasc, jd, rs)] * n
+
+
+@case('iau06xys', vectorized=True)
+def _(n):
+    from vallado.frames.iau06xys import iau06xys
+    ttt, _ = _epochs(n)
+    return lambda: iau06xys(ttt, 0.0, 0.0)
+
+
+@case('iau06xys 1mas', vectorized=True)
+def _(n):
+    # only the kept rows are evaluated, so the gain is set by how many terms
+    # of the installed tables fall under the accuracy, see iau06trunc
+    from vallado.frames.iau06xys import iau06xys
+    ttt, _ = _epochs(n)
+    return lambda: iau06xys(ttt, 0.0, 0.0, accuracy=1000.0)
+
+
+@case('iau06xys recurrence', vectorized=True)
+def _(n):
+    from vallado.frames.iau06xys import iau06xys
+    from vallado.frames.iau06trig import iau06trigmethod
+    ttt, _ = _epochs(n)
+
+    def run():
+        iau06trigmethod('recurrence')
+        try:
+            return iau06xys(ttt, 0.0, 0.0)
+        finally:
+            iau06trigmethod('direct')
+    return run
+
+
+@case('iau06xys 16MB budget', vectorized=True)
+def _(n):
+    from vallado import chunking
+    from vallado.frames.iau06xys import iau06xys
+    ttt, _ = _epochs(n)
+
+    def run():
+        budget = chunking.setbudget()
+        chunking.setbudget(16 * 2**20)
+        try:
+            return iau06xys(ttt, 0.0, 0.0)
+        finally:
+            chunking.setbudget(budget)
+    return run
+
+
+@case('fundargvec', vectorized=True)
+def _(n):
+    from vallado.frames.fundarg import fundargvec
+    ttt, _ = _epochs(n)
+    return lambda: fundargvec(ttt, '06')
+
+
+@case('iau06pna', vectorized=True)
+def _(n):
+    from vallado.frames.iau06pna import iau06pna
+    ttt, _ = _epochs(n)
+    return lambda: iau06pna(ttt)
+
+
+@case('iau06pnb', vectorized=True)
+def _(n):
+    from vallado.frames.iau06pnb import iau06pnb
+    ttt, _ = _epochs(n)
+    return lambda: iau06pnb(ttt)
+
+
+@case('xys+pna+gst', vectorized=True)
+def _(n):
+    from vallado.frames.iau06xys import iau06xys
+    from vallado.frames.iau06pna import iau06pna
+    from vallado.frames.iau06gst import iau06gst
+    from vallado.frames.iau06trig import TrigTable
+    from vallado.frames.fundarg import fundargvec
+    ttt, jdut1 = _epochs(n)
+
+    def run():
+        trig = TrigTable(fundargvec(ttt, '06'))
+        iau06xys(ttt, 0.0, 0.0, trig=trig)
+        out = iau06pna(ttt, trig=trig)
+        iau06gst(jdut1, ttt, out[0], *out[4:], trig=trig)
+    return run
+
+
+@case('convtime', vectorized=True)
+def _(n):
+    from vallado.frames.convtime import convtime
+    rng = np.random.default_rng(0)
+    jd = 2451544.5 + np.floor(rng.uniform(0.0, 9000.0, n))
+    jdfrac = rng.uniform(0.0, 1.0, n)
+    return lambda: convtime(jd, jdfrac, -0.2)
+
+
+@case('precess', vectorized=True)
+def _(n):
+    from vallado.frames.precess import precess
+    ttt, _ = _epochs(n)
+    return lambda: precess(ttt, '06')
+
+
+@case('iau06gst', vectorized=True)
+def _(n):
+    from vallado.frames.iau06gst import iau06gst
+    from vallado.frames.fundarg import fundargvec
+    ttt, jdut1 = _epochs(n)
+    fargs = fundargvec(ttt, '06')
+    return lambda: iau06gst(jdut1, ttt, 0.0, *fargs)
+
+
+@case('cirs2ecefiau06')
+def _(n):
+    from vallado.frames.cirs2ecefiau06 import cirs2ecefiau06
+    ttt, jdut1 = _epochs(n)
+    r, v = _states(n)
+    a = np.zeros(3)
+    return lambda: [cirs2ecefiau06(r[i], v[i], a, ttt[i], jdut1[i], 0.0, 0.0, 0.0, 'c', 0.0, 0.0)
+                    for i in range(n)]
+
+
+@case('cirs2ecefiau06 batch', vectorized=True)
+def _(n):
+    from vallado.frames.cirs2ecefiau06 import cirs2ecefiau06
+    ttt, jdut1 = _epochs(n)
+    r, v = _states(n)
+    return lambda: cirs2ecefiau06(r, v, np.zeros_like(r), ttt, jdut1)
+
+
+@case('ecef2cirsiau06 batch', vectorized=True)
+def _(n):
+    from vallado.frames.ecef2cirsiau06 import ecef2cirsiau06
+    ttt, jdut1 = _epochs(n)
+    r, v = _states(n)
+    return lambda: ecef2cirsiau06(r, v, np.zeros_like(r), ttt, jdut1)
+
+
+@case('gcrf2itrf', vectorized=True)
+def _(n):
+    from vallado.frames.gcrf2itrf import gcrf2itrf
+    ttt, jdut1 = _epochs(n)
+    r, v = _states(n)
+    return lambda: gcrf2itrf(r, v, np.zeros_like(r), ttt, jdut1)
+
+
+@case('cirs2ecefiau06 ephem', vectorized=True)
+def _(n):
+    import tempfile
+    from vallado.frames.cirs2ecefiau06 import cirs2ecefiau06
+    from vallado.frames.frameephem import frameephem, FrameEphem
+    path = os.path.join(tempfile.mkdtemp(), 'frames.eph')
+    frameephem(path, 2458849.5, 60.0, 1441)
+    ephem = FrameEphem(path)
+    jdut1 = 2458849.5 + np.random.default_rng(0).uniform(0.0, 1.0, n)
+    ttt = (jdut1 + 69.184 / 86400.0 - 2451545.0) / 36525.0
+    r, v = _states(n)
+    return lambda: cirs2ecefiau06(r, v, np.zeros_like(r), ttt, jdut1, ephem=ephem)
+
+
+@case('cirs2ecefiau06 cache', vectorized=True)
+def _(n):
+    from vallado.frames.cirs2ecefiau06 import cirs2ecefiau06
+    from vallado.frames.framecache import FrameCache
+    ttt, jdut1 = _epochs(max(n // 10, 1))
+    pick = np.arange(n) % ttt.size  # ten sensors reporting at each epoch
+    r, v = _states(n)
+    cache = FrameCache(maxsize=max(n, 1))
+    return lambda: cirs2ecefiau06(r, v, np.zeros_like(r), ttt[pick], jdut1[pick], cache=cache)
+
+
+@case('smallmat', vectorized=True)
+def _(n):
+    from vallado.math import smallmat
+    r, v = _states(n)
+    h = np.empty_like(r)
+    out = np.empty(n)
+    return lambda: (smallmat.cross(r, v, h), smallmat.norm(h, out), smallmat.angle(r, v))
+
+
+@case('smallmat single')
+def _(n):
+    from vallado.math import smallmat
+    r, v = _states(n)
+    return lambda: [smallmat.angle(smallmat.cross(r[i], v[i]), r[i]) for i in range(n)]
+
+
+@case('rv2coe')
+def _(n):
+    from vallado.elements.rv2coe import rv2coe
+    r, v = _states(n)
+    return lambda: [rv2coe(r[i], v[i], 398600.4415) for i in range(n)]
+
+
+@case('newtonnu')
+def _(n):
+    from vallado.elements.newtonnu import newtonnu
+    rng = np.random.default_rng(0)
+    ecc = rng.uniform(0.0, 0.9, n)
+    nu = rng.uniform(-np.pi, np.pi, n)
+    return lambda: [newtonnu(e, x) for e, x in zip(ecc, nu)]
+
+
+@case('elliptic12', vectorized=True)
+def _(n):
+    from vallado.math.elliptic12 import elliptic12
+    rng = np.random.default_rng(0)
+    u = rng.uniform(-np.pi, np.pi, n)
+    m = rng.uniform(0.0, 0.99, n)
+    return lambda: elliptic12(u, m)
+
+
+@case('anglesg')
+def _(n):
+    from vallado.iod.anglesg import anglesg
+    obs = _sightings(n)
+    return lambda: [anglesg(d[0], d[1], d[2], ra[0], ra[1], ra[2], jd[0], 0.0, jd[1], 0.0, jd[2], 0.0,
+                            rs[0], rs[1], rs[2])
+                    for d, ra, jd, rs in obs]
+
+
+@case('anglesl')
+def _(n):
+    from vallado.iod.anglesl import anglesl
+    obs = _sightings(n)
+    return lambda: [anglesl(d[0], d[1], d[2], ra[0], ra[1], ra[2], jd[0], 0.0, jd[1], 0.0, jd[2], 0.0, 'y',
+                            rs[0], rs[1], rs[2])
+                    for d, ra, jd, rs in obs]
+
+
+@case('anglesdr')
+def _(n):
+    from vallado.iod.anglesdr import anglesdr
+    obs = _sightings(n)
+    return lambda: [anglesdr(d[0], d[1], d[2], ra[0], ra[1], ra[2], jd[0], 0.0, jd[1], 0.0, jd[2], 0.0,
+                             rs[0], rs[1], rs[2], 6378.1363, 398600.4415)
+                    for d, ra, jd, rs in obs]
+
+
+def measure(setup, n, mintime):
+    """Time one case at size n. Returns a result dict."""
+    run = setup(n)
+    run()  # warm up tables and caches
+
+    loops = 0
+    best = np.inf
+    start = time.perf_counter()
+    while loops < 3 or time.perf_counter() - start < mintime:
+        t0 = time.perf_counter()
+        run()
+        best = min(best, time.perf_counter() - t0)
+        loops += 1
+
+    tracemalloc.start()
+    run()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {'seconds': best,
+            'throughput': n / best,
+            'latency': best / n,
+            'peak_bytes': peak,
+            'repeats': loops}
+
+
+def runall(names, sizes, maxloop, mintime):
+    results = []
+    for name in names:
+        setup, vectorized = CASES[name]
+        for n in sizes:
+            entry = {'name': name, 'n': n, 'mode': 'vectorized' if vectorized else 'loop'}
+            if not vectorized and n > maxloop:
+                entry['status'] = 'skipped'
+            else:
+                try:
+                    entry.update(measure(setup, n, mintime))
+                    entry['status'] = 'ok'
+                except Exception as err:
+                    entry['status'] = 'error: {}: {}'.format(type(err).__name__, err)
+            results.append(entry)
+            print('{:16s} {:>8d} {:>10s} {}'.format(
+                name, n, entry['mode'],
+                '{:12.3e} s/call'.format(entry['latency']) if entry['status'] == 'ok' else entry['status']))
+    return results
+
+
+def compare(oldpath, newpath):
+    """
+    Print the speedup of every case present in both files.
+
+    A case that errored in either file is printed as FAILED. Returns True when
+    no case failed; cases skipped for size are not failures.
+    """
+    with open(oldpath) as f:
+        old = {(r['name'], r['n']): r for r in json.load(f)['results']}
+    with open(newpath) as f:
+        new = {(r['name'], r['n']): r for r in json.load(f)['results']}
+    print('{:16s} {:>8s} {:>12s} {:>12s} {:>8s}'.format('name', 'n', 'old s/call', 'new s/call', 'speedup'))
+    ok = True
+    for key in sorted(set(old) & set(new)):
+        o, nw = old[key], new[key]
+        if 'skipped' in (o['status'], nw['status']):
+            continue
+        if o['status'] != 'ok' or nw['status'] != 'ok':
+            ok = False
+            bad = nw['status'] if nw['status'] != 'ok' else 'old ' + o['status']
+            print('{:16s} {:>8d} FAILED {}'.format(key[0], key[1], bad))
+            continue
+        print('{:16s} {:>8d} {:12.3e} {:12.3e} {:8.2f}'.format(
+            key[0], key[1], o['latency'], nw['latency'], o['latency'] / nw['latency']))
+    return ok
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--out', default='bench_results.json', help='results file to write')
+    parser.add_argument('--only', nargs='*', choices=sorted(CASES), help='cases to run')
+    parser.add_argument('--sizes', nargs='*', type=int, default=list(SIZES))
+    parser.add_argument('--max-loop', type=int, default=10000, help='largest n run for scalar cases')
+    parser.add_argument('--min-time', type=float, default=0.2, help='seconds to repeat each timing')
+    parser.add_argument('--compare', nargs=2, metavar=('OLD', 'NEW'), help='compare two results files')
+    args = parser.parse_args(argv)
+
+    if args.compare:
+        return 0 if compare(*args.compare) else 1
+
+    names = args.only or list(CASES)
+    results = runall(names, args.sizes, args.max_loop, args.min_time)
+    meta = {'python': platform.python_version(),
+            'numpy': np.__version__,
+            'platform': platform.platform(),
+            'time': time.strftime('%Y-%m-%dT%H:%M:%S')}
+    with open(args.out, 'w') as f:
+        json.dump({'meta': meta, 'results': results}, f, indent=1)
+    return 1 if any(r['status'].startswith('error') for r in results) else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
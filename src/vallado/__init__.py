@@ -0,0 +1,120 @@
+"""
+Astrodynamics routines from Vallado, Fundamentals of Astrodynamics and Applications.
+
+The modules are grouped in subpackages:
+
+    frames          IAU 2006 reduction between the GCRF, CIRS and ITRF, time scales and EOP
+    iod             Initial orbit determination from angles only observations
+    elements        Orbital elements and observation coordinate conversions
+    math            Vector, matrix, polynomial, interpolation and elliptic integral routines
+    spaceweather    Geomagnetic index conversions
+
+Every routine is also an attribute of the package, imported from its module
+the first time it is used (PEP 562), so import vallado loads no subpackage
+and reads no data. The IAU 2006 tables are read on the first call needing them.
+
+    import vallado
+    p, a, ecc, incl, raan, argp, nu, m, arglat, truelon, lonper = vallado.rv2coe(r, v, mu)
+
+    from vallado.frames.cirs2ecefiau06 import cirs2ecefiau06
+
+The IAU data files are looked for in the data directory of the package
+(see iau06in).
+
+Locals:
+    _groups: Subpackage names
+    _core: Modules shared by the subpackages
+    _routines: Module of each routine, relative to the package
+"""
+
+import importlib
+
+_groups = ('frames', 'iod', 'elements', 'math', 'spaceweather')
+_core = ('backend', 'chunking', 'constastro', 'constmath', 'diagnostics', 'instrument', 'timeline')
+_routines = {
+    # frames
+    'cirs2ecefiau06': 'frames.cirs2ecefiau06',
+    'cirs2eciiau06': 'frames.cirs2eciiau06',
+    'convtime': 'frames.convtime',
+    'ecef2cirsiau06': 'frames.ecef2cirsiau06',
+    'eci2cirsiau06': 'frames.eci2cirsiau06',
+    'EOPStore': 'frames.eopstore',
+    'FrameCache': 'frames.framecache',
+    'FrameEphem': 'frames.frameephem',
+    'TrigTable': 'frames.iau06trig',
+    'frameephem': 'frames.frameephem',
+    'fundarg': 'frames.fundarg',
+    'fundargvec': 'frames.fundarg',
+    'gcrf2itrf': 'frames.gcrf2itrf',
+    'iau06era': 'frames.iau06era',
+    'iau06eragrid': 'frames.iau06era',
+    'iau06frame': 'frames.iau06frame',
+    'iau06framerates': 'frames.iau06frame',
+    'iau06pnbselect': 'frames.iau06frame',
+    'iau06gst': 'frames.iau06gst',
+    'iau06in': 'frames.iau06in',
+    'iau06pna': 'frames.iau06pna',
+    'iau06pnb': 'frames.iau06pnb',
+    'iau06args': 'frames.iau06trig',
+    'iau06poisson': 'frames.iau06trig',
+    'iau06poissonsum': 'frames.iau06trig',
+    'iau06trig': 'frames.iau06trig',
+    'iau06trigmethod': 'frames.iau06trig',
+    'iau06trunc': 'frames.iau06trunc',
+    'iau06xys': 'frames.iau06xys',
+    'itrf2gcrf': 'frames.itrf2gcrf',
+    'polarm': 'frames.polarm',
+    'precess': 'frames.precess',
+    # iod
+    'anglesdr': 'iod.anglesdr',
+    'anglesg': 'iod.anglesg',
+    'anglesl': 'iod.anglesl',
+    'checkhitearth': 'iod.checkhitearth',
+    'doubler': 'iod.doubler',
+    # elements
+    'adbar2rv': 'elements.adbar2rv',
+    'arclength_ellipse': 'elements.arclength_ellipse',
+    'azl2radc': 'elements.azl2radc',
+    'biellip': 'elements.biellip',
+    'newtonnu': 'elements.newtonnu',
+    'rv2coe': 'elements.rv2coe',
+    'rv2radec': 'elements.rv2radec',
+    # math
+    'angl': 'math.angl',
+    'cubic': 'math.cubic',
+    'cubicinterp': 'math.cubicinterp',
+    'cubicspl': 'math.cubicspl',
+    'cubicspl1': 'math.cubicspl1',
+    'elliptic12': 'math.elliptic12',
+    'eventstream': 'math.eventstream',
+    'mag': 'math.mag',
+    'matmult': 'math.matmult',
+    'matvecmult': 'math.matmult',
+    'quadric': 'math.quadric',
+    'recovpar': 'math.recovpar',
+    'rot1': 'math.rotations',
+    'rot1mat': 'math.rotations',
+    'rot2': 'math.rotations',
+    'rot2mat': 'math.rotations',
+    'rot3': 'math.rotations',
+    'rot3mat': 'math.rotations',
+    # spaceweather
+    'ap2kp': 'spaceweather.ap2kp',
+}
+
+__all__ = sorted(_routines)
+
+
+def __getattr__(name):
+    if name in _groups or name in _core:
+        return importlib.import_module('.' + name, __name__)
+    module = _routines.get(name)
+    if module is None:
+        raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+    value = getattr(importlib.import_module('.' + module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_groups) | set(_core) | set(_routines))
@@ -0,0 +1,150 @@
+"""
+Registry of compute kernels with a numpy reference and an optional compiled form.
+
+Each kernel is registered with its numpy implementation and, optionally, the
+same computation written as plain loops over floats and arrays. When numba
+is installed the loop form of a kernel that has one is compiled with
+numba.njit on first use and used in place of the numpy form; otherwise, or
+for kernels without loops, the numpy form is used. setbackend or
+VALLADO_BACKEND=numpy|numba in the environment override the choice. numba
+is never required, and a failed import of it falls back to numpy.
+
+    from vallado import backend
+    backend.setbackend('numpy')      # or 'numba', the default with numba installed
+    fn = backend.kernel('poisson')
+    print(backend.parity())          # largest difference of each kernel
+
+Kernels are registered by the modules that use them, iau06trig ('poisson')
+and elliptic12 ('elliptic12').
+
+Locals:
+    _kernels: Dictionary of kernel entries keyed by name
+    _backend: 'numba' or 'numpy'
+"""
+
+import importlib
+import importlib.util
+import os
+
+import numpy as np
+
+# numba is imported on the first compile, it is slow to import
+numba = None
+_hasnumba = importlib.util.find_spec('numba') is not None
+
+_kernels = {}
+_backend = 'numba' if _hasnumba else 'numpy'
+_modules = ('.frames.iau06trig', '.math.elliptic12')
+
+
+def register(name, ref, loop=None, sample=None):
+    """
+    Add a kernel to the registry.
+
+    Inputs:
+        name: Kernel name
+        ref: numpy implementation, the reference
+        loop: Same computation as loops numba can compile (optional)
+        sample: Function returning a tuple of arguments for the parity check (optional)
+    """
+    _kernels[name] = {'ref': ref, 'loop': loop, 'sample': sample, 'jit': None}
+
+
+def setbackend(name=None):
+    """
+    Choose the implementation used by kernel.
+
+    Inputs:
+        name: 'numba' for the compiled loops, 'numpy' for the references, or
+              None to leave the choice unchanged
+
+    Outputs:
+        name: The backend in use
+    """
+    global _backend
+    if name is not None:
+        if name not in ('numba', 'numpy'):
+            raise ValueError("Unknown backend '{}', use 'numba' or 'numpy'.".format(name))
+        if name == 'numba' and not _hasnumba:
+            raise ValueError("The numba backend needs numba installed.")
+        _backend = name
+    return _backend
+
+
+def compiled(name):
+    """True when kernel(name) returns the compiled loops."""
+    return _backend == 'numba' and _kernels[name]['loop'] is not None
+
+
+def kernel(name):
+    """
+    Return the active implementation of a kernel, compiling it on first use.
+
+    Inputs:
+        name: Kernel name
+
+    Outputs:
+        fn: Function taking the kernel arguments
+    """
+    global _backend, _hasnumba
+    entry = _kernels[name]
+    if not compiled(name):
+        return entry['ref']
+    if entry['jit'] is None:
+        try:
+            entry['jit'] = _njit(entry['loop'])
+        except ImportError:
+            # numba found but not importable, e.g. built for another numpy
+            _hasnumba = False
+            _backend = 'numpy'
+            return entry['ref']
+    return entry['jit']
+
+
+def _njit(loop):
+    """Compile a loop function, importing numba on first use."""
+    global numba
+    if numba is None:
+        numba = importlib.import_module('numba')
+    return numba.njit(cache=True)(loop)
+
+
+def parity(names=None):
+    """
+    Compare the loop form of each kernel with its numpy reference.
+
+    The loops are compiled when numba is installed and run as plain Python
+    otherwise, so the check also covers the loop code where numba is absent.
+
+    Inputs:
+        names: Kernel names to check, all registered kernels with loops when None
+
+    Outputs:
+        diffs: Dictionary of the largest absolute difference keyed by kernel name
+    """
+    for module in _modules:
+        importlib.import_module(module, __package__)
+    if names is None:
+        names = [name for name, entry in _kernels.items() if entry['loop'] is not None]
+
+    diffs = {}
+    for name in names:
+        entry = _kernels[name]
+        args = entry['sample']()
+        if not _hasnumba:
+            loop = entry['loop']
+        else:
+            if entry['jit'] is None:
+                entry['jit'] = _njit(entry['loop'])
+            loop = entry['jit']
+        ref = entry['ref'](*args)
+        out = loop(*args)
+        if isinstance(ref, tuple):
+            diffs[name] = max(float(np.max(np.abs(np.asarray(a) - np.asarray(b)))) for a, b in zip(ref, out))
+        else:
+            diffs[name] = float(np.max(np.abs(np.asarray(ref) - np.asarray(out))))
+    return diffs
+
+
+if os.environ.get('VALLADO_BACKEND'):
+    setbackend(os.environ['VALLADO_BACKEND'])
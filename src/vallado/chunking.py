@@ -0,0 +1,197 @@
+"""
+Memory budget for long vectorized runs, split along the epoch axis.
+
+The series routines take scratch memory in proportion to the number of
+epochs, about 100 kB each for the IAU 2006 x, y, s series with numpy. A
+routine decorated with chunked runs arrays longer than the budget allows in
+chunks of near equal length, writing each chunk into outputs allocated once
+for the whole run, so the peak memory is set by the budget and not by the
+number of epochs. Work arrays taken with scratch during a chunked run are
+handed out again on the next chunk instead of being allocated for each.
+
+    from vallado import chunking
+    chunking.setbudget(64 * 2**20)       # bytes of scratch per call
+    x, y, s, nut = iau06xys(ttt, 0.0, 0.0)  # ttt of any length
+
+Locals:
+    _budget: Bytes of scratch allowed per call
+    _minimum: Fewest epochs in a chunk, whatever the budget
+    _sliceable: Classes sliced along the epochs like arrays
+    _local: Scratch pool of the chunked run in progress, per thread
+"""
+
+import functools
+import inspect
+import threading
+
+import numpy as np
+
+_budget = 256 * 2**20
+_minimum = 256
+_sliceable = ()
+_local = threading.local()
+
+
+def setbudget(nbytes=None):
+    """
+    Set the scratch memory allowed to one call of a chunked routine.
+
+    Inputs:
+        nbytes: Budget (bytes), or None to leave it unchanged
+
+    Outputs:
+        nbytes: The budget in use
+    """
+    global _budget
+    if nbytes is not None:
+        if nbytes <= 0:
+            raise ValueError("Memory budget must be positive, got {}.".format(nbytes))
+        _budget = int(nbytes)
+    return _budget
+
+
+def chunks(n, perepoch):
+    """
+    Split n epochs into chunks that fit the budget.
+
+    Inputs:
+        n: Number of epochs
+        perepoch: Scratch memory per epoch (bytes)
+
+    Outputs:
+        slices: List of slices of near equal length covering 0 ... n, none
+                shorter than _minimum unless n itself is
+    """
+    size = max(_minimum, _budget // max(perepoch, 1))
+    count = max(min(-(-n // size), n // _minimum), 1)
+    bounds = (np.arange(count + 1) * n) // count
+    return [slice(lo, hi) for lo, hi in zip(bounds[:-1].tolist(), bounds[1:].tolist())]
+
+
+def sliceable(cls):
+    """Class decorator marking objects that chunked runs slice along the epochs, e.g. TrigTable."""
+    global _sliceable
+    _sliceable = _sliceable + (cls,)
+    return cls
+
+
+def scratch(shape):
+    """
+    Uninitialised work array, reused by the chunks of a chunked run.
+
+    Inside a chunked run the arrays taken during one chunk are handed out
+    again on the next, and dropped when the run returns. Outside one this is
+    np.empty.
+
+    Inputs:
+        shape: Shape of the array, epochs last
+
+    Outputs:
+        buf: float array of that shape
+    """
+    pool = getattr(_local, 'pool', None)
+    if pool is None:
+        return np.empty(shape)
+    return pool.take(tuple(shape))
+
+
+class _Scratch:
+    """Work arrays of one chunked run, keyed by shape without the epoch axis."""
+
+    def __init__(self, size):
+        self.size = size
+        self.free = {}
+        self.used = []
+
+    def take(self, shape):
+        stack = self.free.get(shape[:-1])
+        if stack and shape[-1] <= self.size:
+            buf = stack.pop()
+        else:
+            buf = np.empty(shape[:-1] + (max(shape[-1], self.size),))
+        self.used.append(buf)
+        return buf[..., :shape[-1]]
+
+    def reset(self):
+        for buf in self.used:
+            if buf.shape[-1] == self.size:
+                self.free.setdefault(buf.shape[:-1], []).append(buf)
+        self.used = []
+
+
+def chunked(perepoch, epochs=()):
+    """
+    Decorator running func in chunks of the epoch axis when it is too long for the budget.
+
+    The epoch axis is the first axis of the first argument. Arrays whose
+    first axis has that length, objects of the classes marked sliceable, and
+    the parameters named in epochs, which may also be lists, are sliced with
+    it. Everything else is passed whole. Outputs with the epoch axis are
+    written into arrays allocated on the first chunk, other outputs are taken
+    from the first chunk. Each run has its own scratch pool, so runs in
+    different threads or nested runs do not share work arrays.
+
+    Inputs:
+        perepoch: Function returning the scratch memory per epoch (bytes),
+                  called on each long call so it can follow the backend
+        epochs: Names of further parameters given per epoch (optional)
+
+    Usage:
+        @instrumented
+        @chunked(lambda: iau06trigbytes(('x', 'y', 's')), epochs=('ddx', 'ddy'))
+        def iau06xys(ttt, ddx, ddy, accuracy=None, trig=None): ...
+    """
+    def decorate(func):
+        signature = inspect.signature(func)
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            lead = np.asarray(args[0]) if args else None
+            if lead is None or lead.ndim == 0 or lead.shape[0] <= _minimum:
+                return func(*args, **kwargs)
+            n = lead.shape[0]
+            parts = chunks(n, perepoch())
+            if len(parts) == 1:
+                return func(*args, **kwargs)
+
+            bound = signature.bind(*args, **kwargs)
+            for name in epochs:
+                value = bound.arguments.get(name)
+                if isinstance(value, (list, tuple)) and len(value) == n:
+                    bound.arguments[name] = np.asarray(value)
+            args, kwargs = (lead,) + bound.args[1:], bound.kwargs
+
+            def part(value, sl):
+                if isinstance(value, np.ndarray) and value.ndim > 0 and value.shape[0] == n:
+                    return value[sl]
+                if isinstance(value, _sliceable) and len(value) == n:
+                    return value[sl]
+                return value
+
+            outer = getattr(_local, 'pool', None)
+            pool = _local.pool = _Scratch(max(sl.stop - sl.start for sl in parts))
+            try:
+                out = None
+                for sl in parts:
+                    pool.reset()
+                    result = func(*[part(a, sl) for a in args], **{k: part(v, sl) for k, v in kwargs.items()})
+                    single = not isinstance(result, tuple)
+                    result = (result,) if single else result
+                    if out is None:
+                        m = sl.stop - sl.start
+                        out = []
+                        for r in result:
+                            if np.ndim(r) > 0 and np.shape(r)[0] == m:
+                                out.append(np.empty((n,) + np.shape(r)[1:], dtype=np.result_type(r)))
+                            else:
+                                out.append(None)
+                        first = result
+                    for o, r in zip(out, result):
+                        if o is not None:
+                            o[sl] = r
+            finally:
+                _local.pool = outer
+            out = tuple(f if o is None else o for o, f in zip(out, first))
+            return out[0] if single else out
+        return wrapper
+    return decorate
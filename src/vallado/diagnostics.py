@@ -0,0 +1,73 @@
+"""
+Diagnostics channel of the package, built on the standard logging module.
+
+Routines report iterations, intermediate values and numerical trouble to the
+'vallado' logger and its per module children, passing the values as %-style
+arguments so that nothing is formatted unless a record is emitted. The
+package is quiet by default: the logger level is set above CRITICAL, so a
+call that would log costs one cached level check and writes nothing, even
+where the application has configured logging.
+
+    from vallado import diagnostics
+    diagnostics.enable()                    # DEBUG and up to stderr
+    diagnostics.enable(logging.WARNING)     # numerical trouble only
+    diagnostics.enable(handler=False)       # records go to the application's handlers
+    diagnostics.quiet()                     # silent again
+
+Values that were only printed are also returned by the routines that find
+them when called with info=True.
+
+Locals:
+    logger: The package logger, 'vallado'
+    _handler: Stream handler added by enable, None when there is none
+"""
+
+import logging
+
+logger = logging.getLogger('vallado')
+logger.addHandler(logging.NullHandler())
+
+_quietlevel = logging.CRITICAL + 1
+_handler = None
+
+logger.setLevel(_quietlevel)
+
+
+def getlogger(name):
+    """Logger for one module, a child of the package logger when name is the module __name__."""
+    return logging.getLogger(name)
+
+
+def enable(level=logging.DEBUG, handler=True):
+    """
+    Emit diagnostics at level and above.
+
+    Inputs:
+        level: Lowest level emitted, logging.DEBUG for iteration traces,
+               logging.WARNING for numerical trouble only
+        handler: True to write the records to stderr, False to leave them to
+                 the handlers of the application
+    """
+    global _handler
+    logger.setLevel(level)
+    if handler and _handler is None:
+        _handler = logging.StreamHandler()
+        _handler.setFormatter(logging.Formatter('%(name)s %(levelname)s: %(message)s'))
+        logger.addHandler(_handler)
+    elif not handler and _handler is not None:
+        logger.removeHandler(_handler)
+        _handler = None
+
+
+def quiet():
+    """Stop all diagnostics, the default."""
+    global _handler
+    logger.setLevel(_quietlevel)
+    if _handler is not None:
+        logger.removeHandler(_handler)
+        _handler = None
+
+
+def isquiet():
+    """True when no diagnostics are emitted."""
+    return not logger.isEnabledFor(logging.CRITICAL)
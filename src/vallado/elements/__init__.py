@@ -0,0 +1,28 @@
+"""
+Orbital elements and observation coordinate conversions.
+
+The modules are imported on first access, vallado.elements.<module>; the routines
+themselves are attributes of the vallado package.
+"""
+
+import importlib
+
+_modules = (
+    'adbar2rv',
+    'arclength_ellipse',
+    'azl2radc',
+    'biellip',
+    'newtonnu',
+    'rv2coe',
+    'rv2radec',
+)
+
+
+def __getattr__(name):
+    if name in _modules:
+        return importlib.import_module('.' + name, __name__)
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_modules))
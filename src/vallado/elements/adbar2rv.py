@@ -1,5 +1,7 @@
 import numpy as np
+from ..instrument import instrumented
 
+@instrumented
 def adbar2rv(rmag, vmag, rtasc, decl, fpav, az):
     """
     Function: adbar2rv
@@ -1,5 +1,5 @@
 import numpy as np
-from elliptic12 import elliptic12
+from ..math.elliptic12 import elliptic12
 
 def arclength_ellipse(a, b, theta0=None, theta1=None):
     """
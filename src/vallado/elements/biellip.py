@@ -1,7 +1,10 @@
 import numpy as np
-from constastro import re, velkmps
+from ..constastro import re, velkmps
+from ..diagnostics import getlogger
 
-def biellip(rinit, rb, rfinal, einit, efinal, nuinit, nufinal):
+_log = getlogger(__name__)
+
+def biellip(rinit, rb, rfinal, einit, efinal, nuinit, nufinal, info=False):
     """
     This function calculates the delta v's for a bi-elliptic transfer for either
     circle to circle, or ellipse to ellipse.
@@ -21,6 +24,8 @@ def biellip(rinit, rb, rfinal, einit, efinal, nuinit, nufinal):
             True anomaly of first orbit (0 or pi rad)
         nufinal : float
             True anomaly of final orbit (0 or pi rad, opposite of nuinit)
+        info : bool, optional
+            True to also return the transfer details (default False)
 
     Outputs:
         deltava : float
@@ -31,6 +36,11 @@ def biellip(rinit, rb, rfinal, einit, efinal, nuinit, nufinal):
             Change in velocity at point c (er / tu)
         dttu : float
             Time of flight for the transfer (tu)
+        details : dict
+            Only with info=True: semimajor axes atran1, atran2 (er), speeds
+            vinit, vtran1a, vtran1b, vtran2b, vtran2c, vfinal (er / tu) and
+            the times on each transfer ellipse t1, t2 (min). Empty when
+            either orbit is not elliptical.
 
     """
 
@@ -71,13 +81,18 @@ def biellip(rinit, rb, rfinal, einit, efinal, nuinit, nufinal):
         # constastro;
         t1 = np.pi * np.sqrt((atran1 * atran1 * atran1) / 1) * 13.446852064
         t2 = np.pi * np.sqrt((atran2 * atran2 * atran2) / 1) * 13.446852064
-        print(f' atran1   {atran1:11.7f}  {atran1 * re:11.7f} km')
-        print(f' atran2   {atran2:11.7f}  {atran2 * re:11.7f} km')
-        print(f' vinit   {vinit:11.7f}  {vinit * velkmps:11.7f} km/s')
-        print(f' vtran1a  {vtran1a:11.7f}  {vtran1a * velkmps:11.7f} km/s')
-        print(f' vtran1b  {vtran1b:11.7f}  {vtran1b * velkmps:11.7f} km/s')
-        print(f' vtran2b  {vtran2b:11.7f}  {vtran2b * velkmps:11.7f} km/s')
-        print(f' vtran2c  {vtran2c:11.7f}  {vtran2c * velkmps:11.7f} km/s')
-        print(f' vfinal  {vfinal:11.7f}  {vfinal * velkmps:11.7f} km/s')
-        print(f' t1  {t1:11.7f} t2 {t2:11.7f} min')
+        details = {'atran1': atran1, 'atran2': atran2, 'vinit': vinit,
+                   'vtran1a': vtran1a, 'vtran1b': vtran1b, 'vtran2b': vtran2b,
+                   'vtran2c': vtran2c, 'vfinal': vfinal, 't1': t1, 't2': t2}
+        _log.debug(' atran1 %11.7f  %11.7f km  atran2 %11.7f  %11.7f km',
+                   atran1, atran1 * re, atran2, atran2 * re)
+        _log.debug(' vinit %11.7f  vtran1a %11.7f  vtran1b %11.7f  vtran2b %11.7f'
+                   '  vtran2c %11.7f  vfinal %11.7f er/tu (x %.7f km/s)',
+                   vinit, vtran1a, vtran1b, vtran2b, vtran2c, vfinal, velkmps)
+        _log.debug(' t1  %11.7f t2 %11.7f min', t1, t2)
+    else:
+        details = {}
 
+    if info:
+        return deltava, deltavb, deltavc, dttu, details
+    return deltava, deltavb, deltavc, dttu
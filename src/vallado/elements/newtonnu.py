@@ -1,5 +1,7 @@
 import math
+from ..instrument import instrumented
 
+@instrumented
 def newtonnu(ecc, nu):
     """
     This function solves Kepler's equation when the true anomaly is known.
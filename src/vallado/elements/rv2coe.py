@@ -1,7 +1,10 @@
 import numpy as np
-from mag import mag
-from newtonnu import newtonnu
+from ..math.mag import mag
+from .newtonnu import newtonnu
+from ..instrument import instrumented
+from ..math.smallmat import angle, cross, dot
 
+@instrumented(vec=True)
 def rv2coe(r, v, mu):
     """
     Finds the classical orbital elements given the geocentric
@@ -36,14 +39,14 @@ def rv2coe(r, v, mu):
     magv = mag(v)
     
     # ------------------  find h n and e vectors   ----------------
-    hbar = np.cross(r, v)
+    hbar = cross(r, v)
     magh = mag(hbar)
     
     if magh >= 0.0:
         nbar = np.array([-hbar[1], hbar[0], 0.0])
         magn = mag(nbar)
         c1 = magv * magv - muin / magr
-        rdotv = np.dot(r, v)
+        rdotv = dot(r, v)
         
         ebar = (c1 * r - rdotv * v) / muin
         ecc = mag(ebar)
@@ -86,7 +89,7 @@ def rv2coe(r, v, mu):
         
         # ---------------- find argument of perigee ---------------
         if typeorbit == 'ei':
-            argp = np.arccos(np.dot(nbar, ebar) / (mag(nbar) * mag(ebar)))
+            argp = angle(nbar, ebar)
             if ebar[2] < 0.0:
                 argp = 2.0 * np.pi - argp
         else:
@@ -94,7 +97,7 @@ def rv2coe(r, v, mu):
         
         # ------------  find true anomaly at epoch    -------------
         if typeorbit[0] == 'e':
-            nu = np.arccos(np.dot(ebar, r) / (mag(ebar) * mag(r)))
+            nu = angle(ebar, r)
             if rdotv < 0.0:
                 nu = 2.0 * np.pi - nu
         else:
@@ -103,7 +106,7 @@ def rv2coe(r, v, mu):
         # ----  find argument of latitude - circular inclined -----
         # -- find in general cases too
         if typeorbit == 'ci' or typeorbit == 'ei':
-            arglat = np.arccos(np.dot(nbar, r) / (mag(nbar) * mag(r)))
+            arglat = angle(nbar, r)
             if r[2] < 0.0:
                 arglat = 2.0 * np.pi - arglat
             m = arglat
@@ -1,5 +1,8 @@
 import numpy as np
+from ..instrument import instrumented
+from ..math.smallmat import dot, norm
 
+@instrumented(vec=True)
 def rv2radec(r, v):
     """
     This function converts the right ascension and declination values with
@@ -21,7 +24,7 @@ def rv2radec(r, v):
     small = 0.00000001
     
     # ------------- calculate angles and rates ----------------
-    rr = np.linalg.norm(r)
+    rr = norm(r)
     temp = np.sqrt(r[0]*r[0] + r[1]*r[1])
     if temp < small:
         rtasc = np.arctan2(v[1], v[0])
@@ -32,7 +35,7 @@ def rv2radec(r, v):
     decl = np.arcsin(r[2] / rr)
 
     temp1 = -r[1]*r[1] - r[0]*r[0]
-    drr = np.dot(r, v) / rr
+    drr = dot(r, v) / rr
     if abs(temp1) > small:
         drtasc = (v[0]*r[1] - v[1]*r[0]) / temp1
     else:
@@ -0,0 +1,43 @@
+"""
+IAU 2006 reduction between the GCRF, CIRS and ITRF, time scales and EOP.
+
+The modules are imported on first access, vallado.frames.<module>; the routines
+themselves are attributes of the vallado package.
+"""
+
+import importlib
+
+_modules = (
+    'cirs2ecefiau06',
+    'cirs2eciiau06',
+    'convtime',
+    'ecef2cirsiau06',
+    'eci2cirsiau06',
+    'eopstore',
+    'framecache',
+    'frameephem',
+    'fundarg',
+    'gcrf2itrf',
+    'iau06era',
+    'iau06frame',
+    'iau06gst',
+    'iau06in',
+    'iau06pna',
+    'iau06pnb',
+    'iau06trig',
+    'iau06trunc',
+    'iau06xys',
+    'itrf2gcrf',
+    'polarm',
+    'precess',
+)
+
+
+def __getattr__(name):
+    if name in _modules:
+        return importlib.import_module('.' + name, __name__)
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_modules))
@@ -0,0 +1,59 @@
+import numpy as np
+from .iau06frame import iau06framerates
+from ..instrument import instrumented
+from ..timeline import span
+from ..math.smallmat import matvec
+
+@instrumented(vec=True)
+def cirs2ecefiau06(rcirs, vcirs, acirs, ttt, jdut1, lod=0.0, xp=0.0, yp=0.0, option='c', ddx=0.0, ddy=0.0,
+                   eop=None, ephem=None, cache=None):
+    """
+    This function transforms a vector from the CIRS (GCRF), to an Earth fixed (ITRF) frame.
+    The results take into account the effects of sidereal time, and polar motion.
+
+    Author: David Vallado, 719-573-2600, 2 May 2020
+
+    Revisions:
+
+    Inputs:
+        rcirs: position vector CIRS (km)
+        vcirs: velocity vector CIRS (km/s)
+        acirs: acceleration vector CIRS (km/s^2)
+        ttt: Julian centuries of TT (centuries)
+        jdut1: Julian date of UT1 (days from 4713 BC)
+        lod: Excess length of day (sec)
+        xp: Polar motion coefficient (rad)
+        yp: Polar motion coefficient (rad)
+        option: Which approach to use (a-2000a, b-2000b, c-2000xys)
+        ddx: EOP correction for x (rad)
+        ddy: EOP correction for y (rad)
+        eop: EOPStore to take lod, xp, yp, ddx and ddy from at jdut1 (optional,
+             overrides the individual values)
+        ephem: FrameEphem to interpolate the rotations from (optional). It is
+               used when it was built for the same option, covers every
+               jdut1 and was built with the EOP of the call: the same
+               EOPStore digest, or no EOP with lod, xp, yp, ddx and ddy all
+               zero. Otherwise the full reduction is computed
+        cache: FrameCache to take the rotations from when no ephemeris is
+               used (optional)
+
+    Vectors may be (3,) or (N, 3) with ttt and jdut1 scalars or arrays of N epochs.
+
+    Outputs:
+        recef: position vector Earth fixed (km)
+        vecef: velocity vector Earth fixed (km/s)
+        aecef: acceleration vector Earth fixed (km/s^2)
+    """
+    rcirs = np.asarray(rcirs, dtype=float)
+    vcirs = np.asarray(vcirs, dtype=float)
+    acirs = np.asarray(acirs, dtype=float)
+
+    pnb, w, wdot, wddot = iau06framerates(ttt, jdut1, lod, xp, yp, option, ddx, ddy, eop, ephem, cache)
+
+    with span('state transform'):
+        # (3,) and (N, 3) states both broadcast against the matrices
+        recef = matvec(w, rcirs)
+        vecef = matvec(w, vcirs) + matvec(wdot, rcirs)
+        aecef = matvec(w, acirs) + 2.0 * matvec(wdot, vcirs) + matvec(wddot, rcirs)
+
+    return recef, vecef, aecef
@@ -0,0 +1,69 @@
+import numpy as np
+from ..instrument import instrumented
+
+# TAI-UTC (sec) from the start of each UTC day (MJD) until the next entry
+_leapmjd = np.array([41317.0, 41499.0, 41683.0, 42048.0, 42413.0, 42778.0, 43144.0, 43509.0, 43874.0,
+                     44239.0, 44786.0, 45151.0, 45516.0, 46247.0, 47161.0, 47892.0, 48257.0, 48804.0,
+                     49169.0, 49534.0, 50083.0, 50630.0, 51179.0, 53736.0, 54832.0, 56109.0, 57204.0,
+                     57754.0])
+_leapdat = np.arange(10.0, 38.0)
+
+
+@instrumented
+def convtime(jd, jdfrac=0.0, dut1=0.0, eop=None, leapsec=None):
+    """
+    Convert UTC epochs to the UT1 and TT time scales used by the frame routines.
+
+    All inputs may be arrays; they are broadcast together. Dates are kept as a
+    whole part and a fraction of a day so that no precision is lost in the
+    conversion, and the fraction is returned in 0 to 1 day.
+
+    Inputs:
+        jd: Julian date of UTC, whole part (days from 4713 BC)
+        jdfrac: Fraction of a day added to jd (days)
+        dut1: UT1-UTC (sec), used when no eop is given
+        eop: EOPStore to take dut1 from at each epoch (optional)
+        leapsec: Optional (mjd, dat) arrays of UTC day starts and TAI-UTC (sec)
+                 replacing the built in leap second table
+
+    Outputs:
+        ttt: Julian centuries of TT
+        jdut1: Julian date of UT1, whole part (days from 4713 BC)
+        jdut1frac: Fraction of a day of UT1 (days)
+        jdtt: Julian date of TT, whole part (days from 4713 BC)
+        jdttfrac: Fraction of a day of TT (days)
+        tut1: Julian centuries of UT1
+        dat: TAI-UTC (sec)
+        dut1: UT1-UTC (sec)
+
+    References:
+        Vallado 2013, 196-203
+    """
+    jd, jdfrac, dut1 = np.broadcast_arrays(np.asarray(jd, dtype=float), np.asarray(jdfrac, dtype=float),
+                                           np.asarray(dut1, dtype=float))
+    leapmjd, leapdat = (_leapmjd, _leapdat) if leapsec is None else (np.asarray(leapsec[0], dtype=float),
+                                                                      np.asarray(leapsec[1], dtype=float))
+
+    # ---- leap seconds by the UTC day
+    mjd = (jd - 2400000.5) + jdfrac
+    if np.any(mjd < leapmjd[0]):
+        raise ValueError("UTC epoch before the start of the leap second table, MJD {}.".format(leapmjd[0]))
+    dat = leapdat[np.searchsorted(leapmjd, mjd, side='right') - 1]
+
+    if eop is not None:
+        dut1 = eop.lookup(jd, jdfrac)[0]
+
+    jdut1, jdut1frac = _split(jd, jdfrac + dut1 / 86400.0)
+    jdtt, jdttfrac = _split(jd, jdfrac + (dat + 32.184) / 86400.0)
+
+    # subtract the epoch from the whole part first to keep the fraction's precision
+    ttt = ((jdtt - 2451545.0) + jdttfrac) / 36525.0
+    tut1 = ((jdut1 - 2451545.0) + jdut1frac) / 36525.0
+
+    return ttt, jdut1, jdut1frac, jdtt, jdttfrac, tut1, dat, dut1[()]
+
+
+def _split(jd, frac):
+    """Move whole days of frac into jd so that frac is in 0 to 1."""
+    days = np.floor(frac)
+    return jd + days, frac - days
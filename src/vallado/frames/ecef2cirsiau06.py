@@ -0,0 +1,59 @@
+import numpy as np
+from .iau06frame import iau06framerates
+from ..instrument import instrumented
+from ..timeline import span
+from ..math.smallmat import mattvec
+
+@instrumented(vec=True)
+def ecef2cirsiau06(recef, vecef, aecef, ttt, jdut1, lod=0.0, xp=0.0, yp=0.0, option='c', ddx=0.0, ddy=0.0,
+                   eop=None, ephem=None, cache=None):
+    """
+    This function transforms a vector from an Earth fixed (ITRF) frame to the CIRS,
+    the inverse of cirs2ecefiau06. The results take into account the effects of
+    sidereal time, and polar motion.
+
+    Inputs:
+        recef: position vector Earth fixed (km)
+        vecef: velocity vector Earth fixed (km/s)
+        aecef: acceleration vector Earth fixed (km/s^2)
+        ttt: Julian centuries of TT (centuries)
+        jdut1: Julian date of UT1 (days from 4713 BC)
+        lod: Excess length of day (sec)
+        xp: Polar motion coefficient (rad)
+        yp: Polar motion coefficient (rad)
+        option: Which approach to use (a-2000a, b-2000b, c-2000xys)
+        ddx: EOP correction for x (rad)
+        ddy: EOP correction for y (rad)
+        eop: EOPStore to take lod, xp, yp, ddx and ddy from at jdut1 (optional,
+             overrides the individual values)
+        ephem: FrameEphem to interpolate the rotations from (optional), as for
+               cirs2ecefiau06
+        cache: FrameCache to take the rotations from when no ephemeris is
+               used (optional)
+
+    Vectors may be (3,) or (N, 3) with ttt and jdut1 scalars or arrays of N epochs.
+
+    Outputs:
+        rcirs: position vector CIRS (km)
+        vcirs: velocity vector CIRS (km/s)
+        acirs: acceleration vector CIRS (km/s^2)
+
+    Coupling:
+        iau06framerates: Rotations and rates of the reduction
+
+    References:
+        Vallado 2013, 212-226
+    """
+    recef = np.asarray(recef, dtype=float)
+    vecef = np.asarray(vecef, dtype=float)
+    aecef = np.asarray(aecef, dtype=float)
+
+    pnb, w, wdot, wddot = iau06framerates(ttt, jdut1, lod, xp, yp, option, ddx, ddy, eop, ephem, cache)
+
+    with span('state transform'):
+        # w is a rotation, so the inverse map uses the transposes of w and its rates
+        rcirs = mattvec(w, recef)
+        vcirs = mattvec(w, vecef) + mattvec(wdot, recef)
+        acirs = mattvec(w, aecef) + 2.0 * mattvec(wdot, vecef) + mattvec(wddot, recef)
+
+    return rcirs, vcirs, acirs
@@ -0,0 +1,50 @@
+from .iau06frame import iau06pnbselect
+from ..math.smallmat import mattvec
+from ..instrument import instrumented
+
+@instrumented(vec=True)
+def eci2cirsiau06(reci, veci, aeci, ttt, option='c', ddx=0.0, ddy=0.0, eop=None, ephem=None, cache=None):
+    """
+    This function transforms a vector from the ECI mean equator mean equinox
+    (GCRF) to the CIRS frame, the inverse of cirs2eciiau06.
+
+    Inputs:
+        reci: position vector ECI (km)
+        veci: velocity vector ECI (km/s)
+        aeci: acceleration vector ECI (km/s^2)
+        ttt: Julian centuries of TT (centuries)
+        option: which approach to use ('a' - 2000a, 'b' - 2000b, 'c' - 2000xys)
+        ddx: EOP correction for x (rad)
+        ddy: EOP correction for y (rad)
+        eop: EOPStore to take ddx and ddy from (optional, overrides the
+             individual values)
+        ephem: FrameEphem to interpolate pnb from when it was built for the
+               same option, covers every ttt and matches the EOP of the call:
+               the same EOPStore digest, or no EOP with ddx and ddy zero
+               (optional), as for iau06pnbselect
+        cache: FrameCache to take pnb from when no ephemeris is used (optional)
+
+    Vectors may be (3,) or (N, 3) with ttt a scalar or an array of N epochs.
+
+    Outputs:
+        rcirs: position vector CIRS (km)
+        vcirs: velocity vector CIRS (km/s)
+        acirs: acceleration vector CIRS (km/s^2)
+
+    Locals:
+        nut: transformation matrix for ire-gcrf
+
+    Coupling:
+        iau06pnbselect: rotation for prec/nut ire-gcrf
+
+    References:
+        Vallado, 2004, 205-219
+    """
+    pnb = iau06pnbselect(ttt, option, ddx, ddy, eop, ephem, cache)
+
+    # ---- perform transformations, pnb is a rotation so its inverse is the transpose
+    rcirs = mattvec(pnb, reci)
+    vcirs = mattvec(pnb, veci)
+    acirs = mattvec(pnb, aeci)
+
+    return rcirs, vcirs, acirs
@@ -0,0 +1,120 @@
+import hashlib
+
+import numpy as np
+
+class EOPStore:
+    """
+    Earth orientation parameters held in arrays for vectorized lookup.
+
+    The store is filled once, from a local CelesTrak style EOP file or from
+    arrays, and then interpolated at any number of epochs with a single
+    searchsorted call.
+
+    File format (whitespace separated, one day per line, other lines ignored):
+        year mon day mjd x y ut1-utc lod dpsi deps dx dy dat
+        x, y, dpsi, deps, dx, dy in arc sec, ut1-utc and lod in sec, dat in sec
+
+    Attributes:
+        mjd: Modified Julian dates of the table (days, UTC)
+        xp, yp: Polar motion coefficients (rad)
+        dut1: UT1-UTC (sec)
+        lod: Excess length of day (sec)
+        ddpsi, ddeps: Corrections to IAU-1980 nutation (rad)
+        ddx, ddy: Corrections to IAU-2006 CIP position (rad)
+        dat: TAI-UTC (sec)
+
+    References:
+        Vallado 2013, 221-225
+    """
+
+    def __init__(self, mjd, xp, yp, dut1, lod, ddpsi, ddeps, ddx, ddy, dat):
+        self.mjd = np.asarray(mjd, dtype=float)
+        if self.mjd.ndim != 1 or self.mjd.size < 2 or np.any(np.diff(self.mjd) <= 0.0):
+            raise ValueError("EOP dates must be at least two strictly increasing values.")
+        self.xp = np.asarray(xp, dtype=float)
+        self.yp = np.asarray(yp, dtype=float)
+        self.dut1 = np.asarray(dut1, dtype=float)
+        self.lod = np.asarray(lod, dtype=float)
+        self.ddpsi = np.asarray(ddpsi, dtype=float)
+        self.ddeps = np.asarray(ddeps, dtype=float)
+        self.ddx = np.asarray(ddx, dtype=float)
+        self.ddy = np.asarray(ddy, dtype=float)
+        self.dat = np.asarray(dat, dtype=float)
+        self._digest = None
+
+    @classmethod
+    def fromfile(cls, path):
+        """Read a CelesTrak style EOP file. Angles are converted from arc sec to rad."""
+        convrt = np.pi / (180.0 * 3600.0)
+
+        rows = []
+        with open(path) as f:
+            for line in f:
+                fields = line.split()
+                if len(fields) != 13 or not fields[0].isdigit():
+                    continue
+                rows.append([float(val) for val in fields[3:]])
+        if not rows:
+            raise ValueError("No EOP records found in {}".format(path))
+
+        tab = np.array(rows)
+        mjd, uniq = np.unique(tab[:, 0], return_index=True)
+        tab = tab[uniq]
+        return cls(mjd, tab[:, 1] * convrt, tab[:, 2] * convrt, tab[:, 3], tab[:, 4],
+                   tab[:, 5] * convrt, tab[:, 6] * convrt, tab[:, 7] * convrt, tab[:, 8] * convrt,
+                   tab[:, 9])
+
+    def digest(self):
+        """
+        SHA-256 hex digest of the table contents, to tell EOP sources apart.
+
+        Found once and kept, the tables are not meant to change after loading.
+        """
+        if self._digest is not None:
+            return self._digest
+        sha = hashlib.sha256()
+        for tab in (self.mjd, self.xp, self.yp, self.dut1, self.lod, self.ddpsi, self.ddeps,
+                    self.ddx, self.ddy, self.dat):
+            sha.update(np.ascontiguousarray(tab, dtype=float).tobytes())
+        self._digest = sha.hexdigest()
+        return self._digest
+
+    def covers(self, jd, jdfrac=0.0):
+        """True where the epochs fall inside the table."""
+        mjd = (np.asarray(jd, dtype=float) - 2400000.5) + jdfrac
+        return (mjd >= self.mjd[0]) & (mjd <= self.mjd[-1])
+
+    def lookup(self, jd, jdfrac=0.0):
+        """
+        Interpolate the parameters linearly at one or more epochs.
+
+        UT1-UTC is interpolated as UT1-TAI so that the step at a leap second
+        does not leak into the neighbouring day.
+
+        Inputs:
+            jd: Julian date (days from 4713 BC), scalar or array
+            jdfrac: Fraction of a day added to jd, scalar or array
+
+        Outputs (same shape as the broadcast inputs):
+            dut1: UT1-UTC (sec)
+            dat: TAI-UTC (sec)
+            lod: Excess length of day (sec)
+            xp, yp: Polar motion coefficients (rad)
+            ddpsi, ddeps: Corrections to IAU-1980 nutation (rad)
+            ddx, ddy: Corrections to IAU-2006 CIP position (rad)
+        """
+        mjd = (np.asarray(jd, dtype=float) - 2400000.5) + jdfrac
+        if np.any(mjd < self.mjd[0]) or np.any(mjd > self.mjd[-1]):
+            raise ValueError("Epoch outside EOP table span {} to {} MJD.".format(self.mjd[0], self.mjd[-1]))
+
+        i = np.clip(np.searchsorted(self.mjd, mjd, side='right') - 1, 0, self.mjd.size - 2)
+        frac = (mjd - self.mjd[i]) / (self.mjd[i + 1] - self.mjd[i])
+
+        def interp(tab):
+            return tab[i] + frac * (tab[i + 1] - tab[i])
+
+        dat = self.dat[i]
+        dut1 = interp(self.dut1 - self.dat) + dat
+
+        return dut1, dat, interp(self.lod), interp(self.xp), interp(self.yp), \
+               interp(self.ddpsi), interp(self.ddeps), interp(self.ddx), interp(self.ddy)
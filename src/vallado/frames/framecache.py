@@ -0,0 +1,123 @@
+from collections import OrderedDict
+
+import numpy as np
+from .iau06frame import iau06frame
+
+class FrameCache:
+    """
+    Bounded least recently used cache of the IAU 2006 frame rotations.
+
+    Epochs are rounded to a grid of step seconds, in both TT and UT1, and the
+    rotations are computed at the rounded epoch, so requests for the same
+    epoch, or epochs closer than the step, share one reduction. The key also
+    holds the option and the EOP values, so a change of EOP never returns
+    stale matrices. The rounding moves the epoch by up to step/2, which turns
+    st by up to earthrot * step / 2 rad (3.6e-8 rad for the 1 ms default), so
+    choose the step for the accuracy needed.
+
+        cache = FrameCache(maxsize=4096, step=0.001)
+        recef, vecef, aecef = cirs2ecefiau06(r, v, a, ttt, jdut1, cache=cache)
+        print(cache.stats())
+
+    Attributes:
+        maxsize: Largest number of entries kept
+        step: Rounding step of the epochs (sec)
+        hits, misses, evictions: Counters since creation or the last clear
+    """
+
+    def __init__(self, maxsize=4096, step=0.001):
+        if maxsize < 1 or step <= 0.0:
+            raise ValueError("maxsize must be at least 1 and step positive.")
+        self.maxsize = maxsize
+        self.step = step
+        self._store = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self):
+        return len(self._store)
+
+    def stats(self):
+        """Return size, maxsize, hits, misses, evictions and hitrate (0 to 1)."""
+        calls = self.hits + self.misses
+        return {'size': len(self._store), 'maxsize': self.maxsize, 'hits': self.hits,
+                'misses': self.misses, 'evictions': self.evictions,
+                'hitrate': self.hits / calls if calls else 0.0}
+
+    def clear(self):
+        """Drop every entry and reset the counters."""
+        self._store.clear()
+        self.hits = self.misses = self.evictions = 0
+
+    def frame(self, ttt, jdut1, xp=0.0, yp=0.0, option='c', ddx=0.0, ddy=0.0):
+        """
+        Rotations of the reduction at one or more epochs, from the cache where possible.
+
+        Inputs and outputs are those of iau06frame.
+        """
+        return self._lookup('frame', ttt, jdut1, xp, yp, option, ddx, ddy)
+
+    def pnb(self, ttt, option='c', ddx=0.0, ddy=0.0):
+        """
+        Precession-nutation matrix at one or more epochs, from the cache where possible.
+
+        Inputs:
+            ttt: Julian centuries of TT, scalar or array (N,)
+            option, ddx, ddy: As for iau06frame
+
+        Outputs:
+            pnb: Matrix for CIRS - GCRF, (3, 3) or (N, 3, 3)
+        """
+        return self._lookup('pnb', ttt, None, 0.0, 0.0, option, ddx, ddy)[0]
+
+    def _lookup(self, kind, ttt, jdut1, xp, yp, option, ddx, ddy):
+        qstep = self.step / 86400.0  # days
+        ttt, xp, yp, ddx, ddy = np.broadcast_arrays(*(np.asarray(val, dtype=float)
+                                                      for val in (ttt, xp, yp, ddx, ddy)))
+        shape = ttt.shape
+        if jdut1 is None:
+            jdut1 = 2451545.0 + ttt * 36525.0
+        jdut1 = np.broadcast_to(np.asarray(jdut1, dtype=float), shape)
+
+        # ---- round both time scales to the grid
+        qtt = np.round(ttt * 36525.0 / qstep).ravel()
+        qut1 = np.round((jdut1 - 2451545.0) / qstep).ravel()
+        eops = np.stack((xp.ravel(), yp.ravel(), ddx.ravel(), ddy.ravel()), axis=1)
+        if kind == 'pnb':
+            eops[:, :2] = 0.0
+
+        n = qtt.size
+        out = np.empty((3, n, 3, 3))
+        todo = {}
+        for i in range(n):
+            key = (kind, option, qtt[i], qut1[i]) + tuple(eops[i])
+            entry = self._store.get(key)
+            if entry is None:
+                todo.setdefault(key, []).append(i)
+            else:
+                self._store.move_to_end(key)
+                out[:, i] = entry
+                self.hits += 1
+
+        if todo:
+            keys = list(todo)
+            first = np.array([todo[key][0] for key in keys])
+            tttq = qtt[first] * qstep / 36525.0
+            jdut1q = 2451545.0 + qut1[first] * qstep
+            pnb, st, pm = iau06frame(tttq, jdut1q, eops[first, 0], eops[first, 1], option,
+                                     eops[first, 2], eops[first, 3])
+
+            for j, key in enumerate(keys):
+                entry = np.stack((pnb[j], st[j], pm[j]))
+                entry.flags.writeable = False
+                out[:, todo[key]] = entry[:, None]
+                self._store[key] = entry
+                self.misses += 1
+                self.hits += len(todo[key]) - 1
+                if len(self._store) > self.maxsize:
+                    self._store.popitem(last=False)
+                    self.evictions += 1
+
+        out = out.reshape((3,) + shape + (3, 3))
+        return out[0], out[1], out[2]
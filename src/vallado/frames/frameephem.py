@@ -0,0 +1,234 @@
+"""
+Precomputed GCRF to ITRF rotations on a fixed UT1 grid, kept in a
+memory-mapped file so that repeated runs over the same span only interpolate.
+
+    frameephem('frames.eph', 2460000.5, 60.0, 1441, option='c', eop=eop)
+    ephem = FrameEphem('frames.eph')
+    recef, vecef, aecef = cirs2ecefiau06(r, v, a, ttt, jdut1, ephem=ephem)
+
+File layout:
+    8 bytes   magic b'VALEPH01'
+    8 bytes   little endian header length in bytes
+    header    JSON: jdut1 (grid start), step (sec), count, option, eop
+              (EOPStore digest or ''), ttmut1 (sec, used without eop), layout
+    padding   to a multiple of 64 bytes
+    records   count rows of 29 float64: jdut1, ttt, pnb (9), T (9), Tdot (9),
+              with T the GCRF - ITRF matrix and Tdot its rate (1/s), row major
+
+The grid epochs are stored as computed, so the interpolation uses the true
+spacing of each interval rather than the nominal step; a Julian date only
+resolves about 40 microseconds, which is a centimetre of Earth rotation.
+"""
+
+import json
+import struct
+
+import numpy as np
+from ..constastro import earthrot
+from .iau06frame import iau06frame
+
+_magic = b'VALEPH01'
+_width = 29
+
+
+def frameephem(path, jdut1, step, count, option='c', eop=None, ttmut1=69.184, block=1000):
+    """
+    Compute the frame matrices on a UT1 grid and write them to an ephemeris file.
+
+    Inputs:
+        path: File to write
+        jdut1: Julian date of UT1 of the first grid point (days from 4713 BC)
+        step: Grid spacing (sec)
+        count: Number of grid points
+        option: Which approach to use (a-2000a, b-2000b, c-2000xys)
+        eop: EOPStore giving dut1, dat, lod, xp, yp, ddx and ddy on the grid (optional,
+             without it polar motion and the corrections are zero)
+        ttmut1: TT-UT1 used when no eop is given (sec)
+        block: Grid points computed at a time, bounds the working memory
+
+    Outputs:
+        header: Dictionary written to the file header
+
+    Coupling:
+        iau06frame: Rotations of the reduction at each grid point
+    """
+    header = {'jdut1': float(jdut1), 'step': float(step), 'count': int(count), 'option': option,
+              'eop': eop.digest() if eop is not None else '', 'ttmut1': float(ttmut1),
+              'layout': 'jdut1 ttt pnb T Tdot'}
+    text = json.dumps(header).encode()
+    offset = -(-(16 + len(text)) // 64) * 64
+
+    with open(path, 'wb') as f:
+        f.write(_magic)
+        f.write(struct.pack('<Q', len(text)))
+        f.write(text)
+        f.write(b'\0' * (offset - 16 - len(text)))
+
+    data = np.memmap(path, dtype='<f8', mode='r+', offset=offset, shape=(count, _width))
+    for start in range(0, count, block):
+        grid = jdut1 + np.arange(start, min(start + block, count)) * step / 86400.0
+
+        if eop is not None:
+            dut1, dat, lod, xp, yp, ddpsi, ddeps, ddx, ddy = eop.lookup(grid)
+            jdtt = grid + (dat + 32.184 - dut1) / 86400.0
+        else:
+            lod = xp = yp = ddx = ddy = 0.0
+            jdtt = grid + ttmut1 / 86400.0
+        ttt = (jdtt - 2451545.0) / 36525.0
+
+        pnb, st, pm = iau06frame(ttt, grid, xp, yp, option, ddx, ddy)
+
+        # ---- d(st^T)/dt = -[w x] st^T for the earth rotation about z
+        thetasa = earthrot * (1.0 - lod / 86400.0) * np.ones(grid.shape)
+        wcross = np.zeros(grid.shape + (3, 3))
+        wcross[..., 0, 1] = thetasa
+        wcross[..., 1, 0] = -thetasa
+
+        pmt = np.swapaxes(pm, -1, -2)
+        stt = np.swapaxes(st, -1, -2)
+        pnbt = np.swapaxes(pnb, -1, -2)
+
+        rows = data[start:start + grid.size]
+        rows[:, 0] = grid
+        rows[:, 1] = ttt
+        rows[:, 2:11] = pnb.reshape(-1, 9)
+        rows[:, 11:20] = (pmt @ stt @ pnbt).reshape(-1, 9)
+        rows[:, 20:29] = (pmt @ wcross @ stt @ pnbt).reshape(-1, 9)
+
+    data.flush()
+    del data
+
+    return header
+
+
+class FrameEphem:
+    """
+    Read-only view of an ephemeris file written by frameephem.
+
+    The records are memory mapped, so opening the file costs nothing and only
+    the pages near the query epochs are read.
+
+    Attributes:
+        jdut1: Julian date of UT1 of the first grid point (days from 4713 BC)
+        step: Grid spacing (sec)
+        count: Number of grid points
+        option: Approach the matrices were computed with (a, b, c)
+        eop: Digest of the EOPStore used, '' when none was
+        header: Full file header
+    """
+
+    def __init__(self, path):
+        with open(path, 'rb') as f:
+            if f.read(8) != _magic:
+                raise ValueError("{} is not a frame ephemeris file.".format(path))
+            size, = struct.unpack('<Q', f.read(8))
+            self.header = json.loads(f.read(size).decode())
+        offset = -(-(16 + size) // 64) * 64
+
+        self.jdut1 = self.header['jdut1']
+        self.step = self.header['step']
+        self.count = self.header['count']
+        self.option = self.header['option']
+        self.eop = self.header['eop']
+        self.data = np.memmap(path, dtype='<f8', mode='r', offset=offset, shape=(self.count, _width))
+
+    def matches(self, eop=None, lod=0.0, xp=0.0, yp=0.0, ddx=0.0, ddy=0.0):
+        """
+        True when the ephemeris was built with the EOP a call asks for.
+
+        With an EOPStore the digests must agree. Without one the ephemeris
+        must have been built without EOP and every value passed must be zero,
+        since the stored matrices have no polar motion, lod or corrections.
+
+        Inputs:
+            eop: EOPStore of the call (optional)
+            lod, xp, yp, ddx, ddy: EOP values of the call when no eop is given
+
+        Outputs:
+            ok: True when the stored matrices can stand in for the reduction
+        """
+        if eop is not None:
+            return eop.digest() == self.eop
+        return self.eop == '' and all(np.all(np.asarray(val) == 0.0) for val in (lod, xp, yp, ddx, ddy))
+
+    def _grid(self, jdut1):
+        """Position of the epochs on the grid in steps."""
+        return (np.asarray(jdut1, dtype=float) - self.jdut1) * (86400.0 / self.step)
+
+    def covers(self, jdut1):
+        """True where the epochs fall inside the grid."""
+        t = self._grid(jdut1)
+        return (t >= 0.0) & (t <= self.count - 1)
+
+    def frame(self, jdut1):
+        """
+        Interpolate the matrices at one or more epochs.
+
+        The CIRS - ITRF part W = T pnb, which holds the fast Earth rotation, is
+        cubic Hermite interpolated from its values and rates at the two
+        neighbouring grid points, and pnb, which changes slowly, linearly.
+        T and Tdot are then W pnb^T and Wdot pnb^T, Tdot being the Earth
+        rotation rate as in the velocity transforms.
+
+        Inputs:
+            jdut1: Julian date of UT1 (days from 4713 BC), scalar or array (N,)
+
+        Outputs:
+            pnb: Precession-nutation matrix for CIRS - GCRF, (3, 3) or (N, 3, 3)
+            T: Rotation GCRF - ITRF, (3, 3) or (N, 3, 3)
+            Tdot: Rate of T (1/s), (3, 3) or (N, 3, 3)
+        """
+        t = self._grid(jdut1)
+        if np.any(t < 0.0) or np.any(t > self.count - 1):
+            raise ValueError("Epoch outside frame ephemeris span.")
+
+        i = np.clip(np.floor(t).astype(np.int64), 0, self.count - 2)
+        rec0 = self.data[i]
+        rec1 = self.data[i + 1]
+        shape = t.shape + (3, 3)
+
+        # ---- position and length of the interval from the stored epochs
+        h = ((rec1[..., 0] - rec0[..., 0]) * 86400.0)[..., None, None]  # sec
+        u = ((np.asarray(jdut1, dtype=float) - rec0[..., 0]) * 86400.0)[..., None, None] / h
+
+        pnb0, pnb1 = rec0[..., 2:11].reshape(shape), rec1[..., 2:11].reshape(shape)
+        t0, t1 = rec0[..., 11:20].reshape(shape), rec1[..., 11:20].reshape(shape)
+        d0, d1 = rec0[..., 20:29].reshape(shape) * h, rec1[..., 20:29].reshape(shape) * h
+
+        w0, w1 = t0 @ pnb0, t1 @ pnb1
+        d0, d1 = d0 @ pnb0, d1 @ pnb1
+
+        u2 = u * u
+        u3 = u2 * u
+        w = (2.0 * u3 - 3.0 * u2 + 1.0) * w0 + (u3 - 2.0 * u2 + u) * d0 \
+            + (3.0 * u2 - 2.0 * u3) * w1 + (u3 - u2) * d1
+        wdot = ((6.0 * u2 - 6.0 * u) * (w0 - w1) + (3.0 * u2 - 4.0 * u + 1.0) * d0
+                + (3.0 * u2 - 2.0 * u) * d1) / h
+        pnb = pnb0 + u * (pnb1 - pnb0)
+        pnbt = np.swapaxes(pnb, -1, -2)
+
+        return pnb, w @ pnbt, wdot @ pnbt
+
+    def pnb(self, ttt):
+        """
+        Interpolate the precession-nutation matrix linearly in TT.
+
+        Inputs:
+            ttt: Julian centuries of TT, scalar or array (N,)
+
+        Outputs:
+            pnb: Precession-nutation matrix for CIRS - GCRF, (3, 3) or (N, 3, 3)
+            ok: True where ttt falls inside the grid
+        """
+        ttt = np.asarray(ttt, dtype=float)
+        tttgrid = self.data[:, 1]
+        ok = (ttt >= tttgrid[0]) & (ttt <= tttgrid[-1])
+
+        t = np.interp(ttt, tttgrid, np.arange(self.count, dtype=float))
+        i = np.clip(np.floor(t).astype(np.int64), 0, self.count - 2)
+        u = (t - i)[..., None, None]
+        shape = t.shape + (3, 3)
+        pnb0 = self.data[i, 2:11].reshape(shape)
+        pnb1 = self.data[i + 1, 2:11].reshape(shape)
+
+        return pnb0 + u * (pnb1 - pnb0), ok
@@ -0,0 +1,127 @@
+import numpy as np
+from ..instrument import instrumented
+
+# Polynomial coefficients of the fundamental arguments in deg, constant term first,
+# rows l, l1, f, d, omega, lonmer, lonven, lonear, lonmar, lonjup, lonsat, lonurn, lonnep, precrate
+_coef = {
+    # IAU 2006 theory
+    '06': np.array([
+        [134.96340251, 1717915923.2178 / 3600.0, 31.8792 / 3600.0, 0.051635 / 3600.0, -0.00024470 / 3600.0],
+        [357.52910918, 129596581.0481 / 3600.0, -0.5532 / 3600.0, 0.000136 / 3600.0, -0.00001149 / 3600.0],
+        [93.27209062, 1739527262.8478 / 3600.0, -12.7512 / 3600.0, -0.001037 / 3600.0, 0.00000417 / 3600.0],
+        [297.85019547, 1602961601.2090 / 3600.0, -6.3706 / 3600.0, 0.006593 / 3600.0, -0.00003169 / 3600.0],
+        [125.04455501, -6962890.5431 / 3600.0, 7.4722 / 3600.0, 0.007702 / 3600.0, -0.00005939 / 3600.0],
+        [252.250905494, 149472.6746358, 0.0, 0.0, 0.0],
+        [181.979800853, 58517.8156748, 0.0, 0.0, 0.0],
+        [100.466448494, 35999.3728521, 0.0, 0.0, 0.0],
+        [355.433274605, 19140.299314, 0.0, 0.0, 0.0],
+        [34.351483900, 3034.90567464, 0.0, 0.0, 0.0],
+        [50.0774713998, 1222.11379404, 0.0, 0.0, 0.0],
+        [314.055005137, 428.466998313, 0.0, 0.0, 0.0],
+        [304.348665499, 218.486200208, 0.0, 0.0, 0.0],
+        [0.0, 1.39697137214, 0.0003086, 0.0, 0.0]]),
+    # IAU 2000b theory
+    '02': np.array([
+        [134.96340251, 1717915923.2178 / 3600.0, 0.0, 0.0, 0.0],
+        [357.52910918, 129596581.0481 / 3600.0, 0.0, 0.0, 0.0],
+        [93.27209062, 1739527262.8478 / 3600.0, 0.0, 0.0, 0.0],
+        [297.85019547, 1602961601.2090 / 3600.0, 0.0, 0.0, 0.0],
+        [125.04455501, -6962890.5431 / 3600.0, 0.0, 0.0, 0.0]] + [[0.0] * 5] * 9),
+    # IAU 1996 theory
+    '96': np.array([
+        [134.96340251, 1717915923.2178 / 3600.0, 31.8792 / 3600.0, 0.051635 / 3600.0, -0.00024470 / 3600.0],
+        [357.52910918, 129596581.0481 / 3600.0, -0.5532 / 3600.0, -0.000136 / 3600.0, -0.00001149 / 3600.0],
+        [93.27209062, 1739527262.8478 / 3600.0, -12.7512 / 3600.0, 0.001037 / 3600.0, 0.00000417 / 3600.0],
+        [297.85019547, 1602961601.2090 / 3600.0, -6.3706 / 3600.0, 0.006593 / 3600.0, -0.00003169 / 3600.0],
+        [125.04455501, -6962890.2665 / 3600.0, 7.4722 / 3600.0, 0.007702 / 3600.0, -0.00005939 / 3600.0],
+        [0.0, 0.0, 0.0, 0.0, 0.0],
+        [181.979800853, 58517.8156748, 0.0, 0.0, 0.0],
+        [100.466448494, 35999.3728521, 0.0, 0.0, 0.0],
+        [355.433274605, 19140.299314, 0.0, 0.0, 0.0],
+        [34.351483900, 3034.90567464, 0.0, 0.0, 0.0],
+        [50.0774713998, 1222.11379404, 0.0, 0.0, 0.0],
+        [0.0, 0.0, 0.0, 0.0, 0.0],
+        [0.0, 0.0, 0.0, 0.0, 0.0],
+        [0.0, 1.39697137214, 0.0003086, 0.0, 0.0]]),
+    # IAU 1980 theory
+    '80': np.array([
+        [134.96298139, 1717915922.6330 / 3600.0, 31.310 / 3600.0, 0.064 / 3600.0, 0.0],
+        [357.52772333, 129596581.2240 / 3600.0, -0.577 / 3600.0, -0.012 / 3600.0, 0.0],
+        [93.27191028, 1739527263.1370 / 3600.0, -13.257 / 3600.0, 0.011 / 3600.0, 0.0],
+        [297.85036306, 1602961601.3280 / 3600.0, -6.891 / 3600.0, 0.019 / 3600.0, 0.0],
+        [125.04452222, -6962890.5390 / 3600.0, 7.455 / 3600.0, 0.008 / 3600.0, 0.0],
+        [252.3, 149472.0, 0.0, 0.0, 0.0],
+        [179.9, 58517.8, 0.0, 0.0, 0.0],
+        [98.4, 35999.4, 0.0, 0.0, 0.0],
+        [353.3, 19140.3, 0.0, 0.0, 0.0],
+        [32.3, 3034.9, 0.0, 0.0, 0.0],
+        [48.0, 1222.1, 0.0, 0.0, 0.0],
+        [0.0, 0.0, 0.0, 0.0, 0.0],
+        [0.0, 0.0, 0.0, 0.0, 0.0],
+        [0.0, 0.0, 0.0, 0.0, 0.0]]),
+}
+
+
+@instrumented
+def fundarg(ttt, opt):
+    """
+    This function calculates the Delaunay variables and planetary values for several theories.
+
+    Args:
+        ttt (float or ndarray): Julian centuries of TT. Arrays give arrays of the same shape.
+        opt (str): Method option. Possible values: '06', '02', '96', '80'.
+
+    Returns:
+        tuple: Tuple containing the following elements:
+            - l (float): Delaunay element in radians.
+            - l1 (float): Delaunay element in radians.
+            - f (float): Delaunay element in radians.
+            - d (float): Delaunay element in radians.
+            - omega (float): Delaunay element in radians.
+            - lonmer (float): Planetary longitude in radians.
+            - lonven (float): Planetary longitude in radians.
+            - lonear (float): Planetary longitude in radians.
+            - lonmar (float): Planetary longitude in radians.
+            - lonjup (float): Planetary longitude in radians.
+            - lonsat (float): Planetary longitude in radians.
+            - lonurn (float): Planetary longitude in radians.
+            - lonnep (float): Planetary longitude in radians.
+            - precrate (float): Planetary precession rate in radians.
+    """
+    return tuple(fundargvec(ttt, opt))
+
+
+@instrumented
+def fundargvec(ttt, opt, out=None):
+    """
+    Delaunay variables and planetary values for an array of epochs in one array.
+
+    All 14 arguments are evaluated together by Horner's rule and reduced to
+    0 to twopi, giving one contiguous array that the integer multiplier
+    tables of the IAU series can be multiplied by directly.
+
+    Args:
+        ttt (float or ndarray): Julian centuries of TT, shape (N,) or scalar.
+        opt (str): Method option. Possible values: '06', '02', '96', '80'.
+        out (ndarray, optional): float64 buffer of shape (14, N) to write into.
+
+    Returns:
+        ndarray: shape (14,) + ttt.shape, rows l, l1, f, d, omega, lonmer,
+        lonven, lonear, lonmar, lonjup, lonsat, lonurn, lonnep, precrate (rad).
+    """
+    coef = _coef[opt]
+    ttt = np.asarray(ttt, dtype=float)
+    if out is None:
+        out = np.empty((14,) + ttt.shape)
+
+    # ---- Horner evaluation in deg, highest power first
+    out[...] = coef[:, 4].reshape((14,) + (1,) * ttt.ndim)
+    for k in range(3, -1, -1):
+        out *= ttt
+        out += coef[:, k].reshape((14,) + (1,) * ttt.ndim)
+
+    # ---- convert units to rad
+    np.remainder(out, 360.0, out=out)
+    out *= np.pi / 180.0
+
+    return out
@@ -0,0 +1,66 @@
+import numpy as np
+from .iau06frame import iau06framerates
+from ..instrument import instrumented
+from ..timeline import span
+
+@instrumented(vec=True)
+def gcrf2itrf(rgcrf, vgcrf, agcrf, ttt, jdut1, lod=0.0, xp=0.0, yp=0.0, option='c', ddx=0.0, ddy=0.0,
+              eop=None, ephem=None, cache=None):
+    """
+    This function transforms a vector from the GCRF to the Earth fixed (ITRF) frame
+    in one step, with precession-nutation, Earth rotation and polar motion
+    combined in one matrix per epoch.
+
+    The rotation T = pm^T st^T pnb^T, its rate and second rate are placed in
+    one 9x9 block matrix [T 0 0; Tdot T 0; Tddot 2Tdot T] that maps the stacked
+    position, velocity and acceleration in a single product.
+
+    Inputs:
+        rgcrf: position vector GCRF (km), (3,) or (N, 3)
+        vgcrf: velocity vector GCRF (km/s), (3,) or (N, 3)
+        agcrf: acceleration vector GCRF (km/s^2), (3,) or (N, 3)
+        ttt: Julian centuries of TT (centuries), scalar or (N,)
+        jdut1: Julian date of UT1 (days from 4713 BC), scalar or (N,)
+        lod: Excess length of day (sec)
+        xp: Polar motion coefficient (rad)
+        yp: Polar motion coefficient (rad)
+        option: Which approach to use (a-2000a, b-2000b, c-2000xys)
+        ddx: EOP correction for x (rad)
+        ddy: EOP correction for y (rad)
+        eop: EOPStore to take lod, xp, yp, ddx and ddy from at jdut1 (optional)
+        ephem: FrameEphem to interpolate the rotations from (optional), used
+               only when it matches the option and EOP of the call, as for
+               cirs2ecefiau06
+        cache: FrameCache to take the rotations from (optional)
+
+    Outputs:
+        recef: position vector Earth fixed (km)
+        vecef: velocity vector Earth fixed (km/s)
+        aecef: acceleration vector Earth fixed (km/s^2)
+
+    Coupling:
+        iau06framerates: Rotations and rates of the reduction
+
+    References:
+        Vallado 2013, 212-226
+    """
+    pnb, w, wdot, wddot = iau06framerates(ttt, jdut1, lod, xp, yp, option, ddx, ddy, eop, ephem, cache)
+
+    with span('state transform'):
+        pnbt = np.swapaxes(pnb, -1, -2)
+        trot = w @ pnbt
+        tdot = wdot @ pnbt
+
+        big = np.zeros(trot.shape[:-2] + (9, 9))
+        big[..., 0:3, 0:3] = trot
+        big[..., 3:6, 3:6] = trot
+        big[..., 6:9, 6:9] = trot
+        big[..., 3:6, 0:3] = tdot
+        big[..., 6:9, 3:6] = 2.0 * tdot
+        big[..., 6:9, 0:3] = wddot @ pnbt
+
+        state = np.concatenate(np.broadcast_arrays(np.asarray(rgcrf, dtype=float), np.asarray(vgcrf, dtype=float),
+                                                   np.asarray(agcrf, dtype=float)), axis=-1)
+        out = (big @ state[..., None])[..., 0]
+
+    return out[..., 0:3], out[..., 3:6], out[..., 6:9]
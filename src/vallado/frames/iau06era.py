@@ -0,0 +1,96 @@
+import numpy as np
+from ..instrument import instrumented
+
+@instrumented
+def iau06era(jdut1):
+    """
+    Calculate the transformation matrix that accounts for the effects of sidereal time via the Earth rotation angle.
+
+    Parameters:
+    - jdut1: Julian date of UT1 (days), scalar or array of epochs
+
+    Returns:
+    - era: Earth rotation angle (0 to twopi rad), same shape as jdut1
+    - st: Transformation matrix for PEF-IRE, shape (3, 3) or (N, 3, 3)
+    """
+    # Julian centuries of UT1
+    tut1d = np.asarray(jdut1, dtype=float) - 2451545.0
+
+    # Earth rotation angle
+    era = (2 * np.pi) * (0.7790572732640 + 1.00273781191135448 * tut1d)
+    era = era % (2 * np.pi)
+
+    # Print ERA if needed
+    # if iauhelp == 'y':
+    #     print(f'era{era * 180 / pi:11.7f}')
+
+    # Transformation matrix
+    cosera = np.cos(era)
+    sinera = np.sin(era)
+    st = np.zeros(era.shape + (3, 3))
+    st[..., 0, 0] = cosera
+    st[..., 0, 1] = -sinera
+    st[..., 1, 0] = sinera
+    st[..., 1, 1] = cosera
+    st[..., 2, 2] = 1.0
+
+    return era, st
+
+
+@instrumented
+def iau06eragrid(jdut1, step, count, anchor=1024):
+    """
+    Earth rotation angle and matrices on an evenly spaced grid of epochs.
+
+    The rotation for one step is found once and the grid is advanced by angle
+    addition instead of evaluating sin and cos at every epoch. The angle is
+    re-anchored directly every anchor steps, and the offsets inside a block
+    are built by doubling, so each value is only a few additions away from a
+    directly evaluated angle and the drift stays at the rounding level.
+
+    Inputs:
+        jdut1: Julian date of UT1 of the first epoch (days)
+        step: Grid spacing (sec)
+        count: Number of epochs
+        anchor: Number of steps between directly evaluated angles
+
+    Outputs:
+        era: Earth rotation angle (0 to twopi rad), shape (count,)
+        st: Transformation matrix for PEF-IRE, shape (count, 3, 3)
+    """
+    twopi = 2.0 * np.pi
+    rate = twopi * 1.00273781191135448  # rad per day of UT1
+    nblock = -(-count // anchor)
+    anchor = min(anchor, count)
+
+    # ---- directly evaluated angle at the start of every block
+    tut1d = (jdut1 - 2451545.0) + np.arange(nblock) * (anchor * step / 86400.0)
+    eraa = (twopi * 0.7790572732640 + rate * tut1d) % twopi
+    cosa = np.cos(eraa)
+    sina = np.sin(eraa)
+
+    # ---- offsets inside a block by angle-addition doubling
+    delta = rate * step / 86400.0
+    coso = np.ones(1)
+    sino = np.zeros(1)
+    while coso.size < anchor:
+        n = coso.size
+        cosn = np.cos(n * delta)
+        sinn = np.sin(n * delta)
+        coso = np.concatenate((coso, coso * cosn - sino * sinn))
+        sino = np.concatenate((sino, sino * cosn + coso[:n] * sinn))
+    coso = coso[:anchor]
+    sino = sino[:anchor]
+
+    cosera = (np.outer(cosa, coso) - np.outer(sina, sino)).ravel()[:count]
+    sinera = (np.outer(sina, coso) + np.outer(cosa, sino)).ravel()[:count]
+    era = ((eraa[:, None] + delta * np.arange(anchor)) % twopi).ravel()[:count]
+
+    st = np.zeros((count, 3, 3))
+    st[:, 0, 0] = cosera
+    st[:, 0, 1] = -sinera
+    st[:, 1, 0] = sinera
+    st[:, 1, 1] = cosera
+    st[:, 2, 2] = 1.0
+
+    return era, st
@@ -0,0 +1,202 @@
+import numpy as np
+from .iau06era import iau06era
+from .iau06gst import iau06gst
+from .iau06pna import iau06pna
+from .iau06pnb import iau06pnb
+from .iau06xys import iau06xys
+from .. import backend
+from .fundarg import fundargvec
+from .iau06trig import TrigTable, iau06trigbytes
+from .polarm import polarm
+from ..constastro import earthrot
+from ..chunking import chunked
+from ..instrument import instrumented
+
+@instrumented
+@chunked(lambda: iau06trigbytes(('x', 'y', 's', 'ls', 'pl', 'gst')),
+         epochs=('jdut1', 'xp', 'yp', 'ddx', 'ddy'))
+def iau06frame(ttt, jdut1, xp=0.0, yp=0.0, option='c', ddx=0.0, ddy=0.0):
+    """
+    Find the three rotations of the IAU 2006 GCRF to ITRF reduction.
+
+    Inputs may be scalars or arrays of epochs; they are broadcast together.
+    Long arrays of epochs are run in chunks that fit the chunking budget, so
+    the series of all three rotations share their sin and cos per chunk.
+
+    Inputs:
+        ttt: Julian centuries of TT (centuries)
+        jdut1: Julian date of UT1 (days from 4713 BC)
+        xp: Polar motion coefficient (rad)
+        yp: Polar motion coefficient (rad)
+        option: Which approach to use (a-2000a, b-2000b, c-2000xys)
+        ddx: EOP correction for x (rad, 2000xys only)
+        ddy: EOP correction for y (rad, 2000xys only)
+
+    Outputs:
+        pnb: Precession-nutation matrix for CIRS (IRE) - GCRF, (3, 3) or (N, 3, 3)
+        st: Sidereal rotation for TIRS (PEF) - CIRS (IRE), (3, 3) or (N, 3, 3)
+        pm: Polar motion matrix for ITRF - TIRS (PEF), (3, 3) or (N, 3, 3)
+
+    Coupling:
+        iau06xys, iau06pna, iau06pnb: Precession-nutation
+        iau06era, iau06gst: Earth rotation
+        TrigTable: sin and cos shared by the series of one call
+        polarm: Polar motion
+
+    References:
+        Vallado 2013, 212-226
+    """
+    ttt, jdut1 = np.broadcast_arrays(np.asarray(ttt, dtype=float), np.asarray(jdut1, dtype=float))
+
+    # ---- sin and cos of the series arguments, shared by the series of this call
+    trig = None
+    if option in ('a', 'c') and not backend.compiled('poisson'):
+        trig = TrigTable(fundargvec(ttt, '06'))
+
+    # ---- ceo based, iau2006
+    if option == 'c':
+        x, y, s, pnb = iau06xys(ttt, ddx, ddy, trig=trig)
+        era, st = iau06era(jdut1)
+
+    # ---- class equinox based, 2000a
+    elif option == 'a':
+        deltapsi, pnb, prec, nut, l, l1, f, d, omega, lonmer, lonven, lonear, lonmar, lonjup, lonsat, lonurn, lonnep, precrate = iau06pna(ttt, trig=trig)
+        gst, st = iau06gst(jdut1, ttt, deltapsi, l, l1, f, d, omega, lonmer, lonven, lonear, lonmar, lonjup, lonsat, lonurn, lonnep, precrate, trig=trig)
+
+    # ---- class equinox based, 2000b
+    elif option == 'b':
+        deltapsi, pnb, prec, nut, l, l1, f, d, omega, lonmer, lonven, lonear, lonmar, lonjup, lonsat, lonurn, lonnep, precrate = iau06pnb(ttt)
+        gst, st = iau06gst(jdut1, ttt, deltapsi, l, l1, f, d, omega, lonmer, lonven, lonear, lonmar, lonjup, lonsat, lonurn, lonnep, precrate)
+
+    else:
+        raise ValueError("Unknown option '{}', use 'a', 'b' or 'c'.".format(option))
+
+    pm = polarm(xp, yp, ttt, '06')
+
+    return pnb, st, pm
+
+
+def iau06framerates(ttt, jdut1, lod=0.0, xp=0.0, yp=0.0, option='c', ddx=0.0, ddy=0.0,
+                    eop=None, ephem=None, cache=None):
+    """
+    Find the CIRS to ITRF rotation with its first and second rates, and pnb.
+
+    This is the shared front end of the CIRS, GCRF and ITRF transforms: it
+    takes the EOP from eop when given, interpolates from ephem when that
+    covers the epochs and was built with the same EOP, or else computes the
+    rotations, through cache when given.
+
+    Inputs:
+        ttt, jdut1, xp, yp, option, ddx, ddy: As for iau06frame
+        lod: Excess length of day (sec)
+        eop: EOPStore to take lod, xp, yp, ddx and ddy from at jdut1 (optional)
+        ephem: FrameEphem to interpolate from (optional). It is used only when
+               it was built for the same option, covers every jdut1 and
+               FrameEphem.matches the EOP of the call: the same EOPStore
+               digest, or no EOP at all with lod, xp, yp, ddx and ddy zero.
+               Otherwise the full reduction is computed
+        cache: FrameCache to take the rotations from (optional)
+
+    Outputs:
+        pnb: Precession-nutation matrix for CIRS - GCRF, (3, 3) or (N, 3, 3)
+        w: Rotation CIRS - ITRF, pm^T st^T, (3, 3) or (N, 3, 3)
+        wdot: Rate of w from the Earth rotation (1/s), (3, 3) or (N, 3, 3)
+        wddot: Second rate of w (1/s^2), (3, 3) or (N, 3, 3)
+
+    Coupling:
+        iau06frame: Rotations of the reduction
+    """
+    if ephem is not None and not (ephem.option == option and ephem.matches(eop, lod, xp, yp, ddx, ddy)
+                                  and np.all(ephem.covers(jdut1))):
+        ephem = None
+
+    if eop is not None:
+        dut1, dat, lod, xp, yp, ddpsi, ddeps, ddx, ddy = eop.lookup(jdut1)
+
+    if ephem is not None:
+        # ---- interpolate the stored GCRF - ITRF rotation and its rate, CIRS - ITRF is T pnb
+        pnb, trot, tdot = ephem.frame(jdut1)
+        w = trot @ pnb
+        wdot = tdot @ pnb
+        wddot = wdot @ np.swapaxes(w, -1, -2) @ wdot
+    else:
+        if cache is not None:
+            pnb, st, pm = cache.frame(ttt, jdut1, xp, yp, option, ddx, ddy)
+        else:
+            pnb, st, pm = iau06frame(ttt, jdut1, xp, yp, option, ddx, ddy)
+
+        # Setup parameters for velocity transformations, d(st^T)/dt = -[w x] st^T
+        thetasa = earthrot * (1.0 - lod / 86400.0) * np.ones(np.shape(st)[:-2])
+        wcross = np.zeros(thetasa.shape + (3, 3))
+        wcross[..., 0, 1] = thetasa
+        wcross[..., 1, 0] = -thetasa
+
+        pmt = np.swapaxes(pm, -1, -2)
+        stt = np.swapaxes(st, -1, -2)
+        w = pmt @ stt
+        wdot = pmt @ wcross @ stt
+        wddot = pmt @ wcross @ wcross @ stt
+
+    return pnb, w, wdot, wddot
+
+
+def iau06pnbselect(ttt, option='c', ddx=0.0, ddy=0.0, eop=None, ephem=None, cache=None):
+    """
+    Find the precession-nutation matrix pnb for CIRS - GCRF.
+
+    This is the shared front end of cirs2eciiau06 and eci2cirsiau06: it takes
+    ddx and ddy from eop at the TT date when given, interpolates from ephem
+    when it covers every ttt and matches the EOP of the call, or else
+    computes pnb, through cache when given.
+
+    Inputs:
+        ttt: Julian centuries of TT, scalar or array (N,)
+        option: Which approach to use (a-2000a, b-2000b, c-2000xys)
+        ddx, ddy: EOP corrections for x and y (rad)
+        eop: EOPStore to take ddx and ddy from (optional, overrides the
+             individual values)
+        ephem: FrameEphem to interpolate pnb from when it was built for the
+               same option, covers every ttt and matches the EOP of the call:
+               the same EOPStore digest, or no EOP with ddx and ddy zero
+               (optional)
+        cache: FrameCache to take pnb from when no ephemeris is used (optional)
+
+    Outputs:
+        pnb: Precession-nutation matrix for CIRS - GCRF, (3, 3) or (N, 3, 3)
+
+    Coupling:
+        iau06xys, iau06pna, iau06pnb: Precession-nutation
+    """
+    if option not in ('a', 'b', 'c'):
+        raise ValueError("Unknown option '{}', use 'a', 'b' or 'c'.".format(option))
+
+    if ephem is not None and not (ephem.option == option and ephem.matches(eop, ddx=ddx, ddy=ddy)):
+        ephem = None
+
+    if eop is not None:
+        dut1, dat, lod, xp, yp, ddpsi, ddeps, ddx, ddy = eop.lookup(2451545.0 + ttt * 36525.0)
+
+    pnb = None
+    if ephem is not None:
+        pnb, ok = ephem.pnb(ttt)
+        if not np.all(ok):
+            pnb = None
+
+    if pnb is None and cache is not None:
+        pnb = cache.pnb(ttt, option, ddx, ddy)
+
+    # ---- ceo based, iau2006
+    if pnb is None and option == 'c':
+        x, y, s, pnb = iau06xys(ttt, ddx, ddy)
+
+    # ---- class equinox based, 2000a
+    if pnb is None and option == 'a':
+        deltapsi, pnb, prec, nut, l, l1, f, d, omega, \
+        lonmer, lonven, lonear, lonmar, lonjup, lonsat, lonurn, lonnep, precrate = iau06pna(ttt)
+
+    # ---- class equinox based, 2000b
+    if pnb is None and option == 'b':
+        deltapsi, pnb, prec, nut, l, l1, f, d, omega, \
+        lonmer, lonven, lonear, lonmar, lonjup, lonsat, lonurn, lonnep, precrate = iau06pnb(ttt)
+
+    return pnb
@@ -1,13 +1,19 @@
 import numpy as np
-from iau06in import iau06in
+from .iau06in import iau06in
+from .. import backend
+from .iau06trig import iau06trig, iau06poissonsum
+from ..instrument import instrumented
 
+@instrumented
 def iau06gst(jdut1, ttt, deltapsi, l, l1, f, d, omega,
-             lonmer, lonven, lonear, lonmar, lonjup, lonsat, lonurn, lonnep, precrate):
+             lonmer, lonven, lonear, lonmar, lonjup, lonsat, lonurn, lonnep, precrate, trig=None):
     """
     This function finds the IAU2006 Greenwich Sidereal Time.
 
     Author: David Vallado, 719-573-2600, 16 Jul 2004
 
+    All inputs may be arrays of epochs; they are broadcast together.
+
     Inputs:
         jdut1: Julian date of UT1 (days from 4713 BC)
         ttt: Julian centuries of TT
@@ -15,10 +21,12 @@ def iau06gst(jdut1, ttt, deltapsi, l, l1, f, d, omega,
         l, l1, f, d, omega: Delaunay elements (rad)
         lonmer, lonven, lonear, lonmar, lonjup, lonsat, lonurn, lonnep: Planetary values (rad)
         precrate: Precession rate (rad)
+        trig: TrigTable made from these fundamental arguments, to share sin
+              and cos with the other series (optional)
 
     Outputs:
         gst: Greenwich Sidereal Time (0 to twopi rad)
-        st: Transformation matrix
+        st: Transformation matrix, shape (3, 3) or (N, 3, 3)
 
     Locals:
         temp: Temporary variable for reals (rad)
@@ -35,6 +43,7 @@ def iau06gst(jdut1, ttt, deltapsi, l, l1, f, d, omega,
     axs0, a0xi, ays0, a0yi, ass0, a0si, apn, apni, appl, appli, agst, agsti = iau06in()
 
     # Precompute powers of ttt
+    ttt = np.asarray(ttt, dtype=float)
     ttt2 = ttt * ttt
     ttt3 = ttt2 * ttt
     ttt4 = ttt2 * ttt2
@@ -46,30 +55,28 @@ def iau06gst(jdut1, ttt, deltapsi, l, l1, f, d, omega,
     epsa = (epsa / 3600.0) % 360.0  # degrees
     epsa = epsa * deg2rad  # radians
 
-    # Evaluate the ee complementary terms
-    gstsum0 = 0.0
-    for i in range(33, 0, -1):
-        tempval = agsti[i-1, 0] * l + agsti[i-1, 1] * l1 + agsti[i-1, 2] * f + agsti[i-1, 3] * d + agsti[i-1, 4] * omega + \
-                  agsti[i-1, 5] * lonmer + agsti[i-1, 6] * lonven + agsti[i-1, 7] * lonear + agsti[i-1, 8] * lonmar + \
-                  agsti[i-1, 9] * lonjup + agsti[i-1, 10] * lonsat + agsti[i-1, 11] * lonurn + agsti[i-1, 12] * lonnep + \
-                  agsti[i-1, 13] * precrate
-        gstsum0 += agst[i-1, 0] * np.sin(tempval) + agst[i-1, 1] * np.cos(tempval)  # rad
-    gstsum1 = 0.0
-    for j in range(1, -1, -1):
-        i = 33 + j
-        tempval = agsti[i-1, 0] * l + agsti[i-1, 1] * l1 + agsti[i-1, 2] * f + agsti[i-1, 3] * d + agsti[i-1, 4] * omega + \
-                  agsti[i-1, 5] * lonmer + agsti[i-1, 6] * lonven + agsti[i-1, 7] * lonear + agsti[i-1, 8] * lonmar + \
-                  agsti[i-1, 9] * lonjup + agsti[i-1, 10] * lonsat + agsti[i-1, 11] * lonurn + agsti[i-1, 12] * lonnep + \
-                  agsti[i-1, 13] * precrate
-        gstsum1 += agst[i-1, 0] * ttt * np.sin(tempval) + agst[i-1, 1] * ttt * np.cos(tempval)
-
-    eect2000 = gstsum0 + gstsum1 * ttt  # rad
+    # Evaluate the ee complementary terms, 33 constant rows and 1 row times ttt,
+    # from the stacked fundamental arguments, sharing sin/cos with the other series
+    fargs = np.array(np.broadcast_arrays(l, l1, f, d, omega, lonmer, lonven, lonear, lonmar,
+                                         lonjup, lonsat, lonurn, lonnep, precrate), dtype=float)
+    if backend.compiled('poisson'):
+        tpow = np.stack(np.broadcast_arrays(1.0, ttt, fargs[0])[:2]).reshape(2, -1)
+        eect2000 = iau06poissonsum('gst', fargs.reshape(14, -1), tpow)[0].reshape(fargs.shape[1:])  # rad
+    else:
+        if trig is not None:
+            sinval, cosval = trig('gst')
+        else:
+            sinval, cosval = iau06trig(fargs.reshape(14, -1), 'gst')
+        gstsum0 = (agst[:33, 0] @ sinval[:33] + agst[:33, 1] @ cosval[:33]).reshape(fargs.shape[1:])  # rad
+        gstsum1 = (agst[33:, 0] @ sinval[33:] + agst[33:, 1] @ cosval[33:]).reshape(fargs.shape[1:])
+
+        eect2000 = gstsum0 + gstsum1 * ttt  # rad
 
     # Equation of the equinoxes
     ee2000 = deltapsi * np.cos(epsa) + eect2000  # rad
 
     # Earth rotation angle
-    tut1d = jdut1 - 2451545.0
+    tut1d = np.asarray(jdut1, dtype=float) - 2451545.0
     era = 2.0 * np.pi * (0.7790572732640 + 1.00273781191135448 * tut1d)
     era = era % (2.0 * np.pi)  # rad
 
@@ -80,17 +87,13 @@ def iau06gst(jdut1, ttt, deltapsi, l, l1, f, d, omega,
     gst = gmst2000 + ee2000  # rad
 
     # Transformation matrix
-    st = np.zeros((3, 3))
-    st[0, 0] = np.cos(gst)
-    st[0, 1] = -np.sin(gst)
-    st[0, 2] = 0.0
-
-    st[1, 0] = np.sin(gst)
-    st[1, 1] = np.cos(gst)
-    st[1, 2] = 0.0
-
-    st[2, 0] = 0.0
-    st[2, 1] = 0.0
-    st[2, 2] = 1.0
+    cosgst = np.cos(gst)
+    singst = np.sin(gst)
+    st = np.zeros(gst.shape + (3, 3))
+    st[..., 0, 0] = cosgst
+    st[..., 0, 1] = -singst
+    st[..., 1, 0] = singst
+    st[..., 1, 1] = cosgst
+    st[..., 2, 2] = 1.0
 
     return gst, st
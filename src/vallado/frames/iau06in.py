@@ -0,0 +1,85 @@
+import functools
+import math
+import os
+
+import numpy as np
+from ..instrument import instrumented
+
+@instrumented
+@functools.lru_cache(maxsize=None)
+def iau06in(datadir=None):
+    """
+    Initialize matrices for IAU 2006 reduction calculations.
+
+    The tables are read and converted once per data directory; later calls
+    return the same read-only arrays. The series routines all call it with
+    the default directory, which is VALLADO_DATA from the environment when
+    set, so set that before their first use to read the files from elsewhere.
+
+    Author: David Vallado, 719-573-2600, 16 Jul 2004
+    Revisions:
+    - Dav 14 Apr 11: Update for IAU2006 conventions
+
+    Inputs:
+        datadir - Directory holding the IAU data files (default: VALLADO_DATA, or
+                  else the data directory of the package)
+
+    Outputs:
+        axs0 - Real coefficients for x (rad)
+        a0xi - Integer coefficients for x
+        ays0 - Real coefficients for y (rad)
+        a0yi - Integer coefficients for y
+        ass0 - Real coefficients for s (rad)
+        a0si - Integer coefficients for s
+        apn - Real coefficients for nutation (rad)
+        apni - Integer coefficients for nutation
+        appl - Real coefficients for obliquity (rad)
+        appli - Integer coefficients for obliquity
+        agst - Real coefficients for GST (rad)
+        agsti - Integer coefficients for GST
+    """
+    if datadir is None:
+        datadir = os.environ.get('VALLADO_DATA') or \
+                  os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'data')
+
+    def load(name):
+        return np.loadtxt(os.path.join(datadir, name))
+
+    # Conversion factors to radians
+    convrtu = (0.000001 * math.pi) / (180.0 * 3600.0)  # If micro arcsecond
+    convrtm = (0.001 * math.pi) / (180.0 * 3600.0)      # If milli arcsecond
+
+    # XYS values
+    filein = load('iau06xtab5.2.a.dat')
+    axs0 = filein[:, 1:3] * convrtu  # reals, rad
+    a0xi = np.ascontiguousarray(filein[:, 3:17])  # integers
+
+    filein = load('iau06ytab5.2.b.dat')
+    ays0 = filein[:, 1:3] * convrtu
+    a0yi = np.ascontiguousarray(filein[:, 3:17])
+
+    filein = load('iau06stab5.2.d.dat')
+    ass0 = filein[:, 1:3] * convrtu
+    a0si = np.ascontiguousarray(filein[:, 3:17])
+
+    # Nutation values old approach IAU2003
+    filein = load('iau03n.dat')
+    apni = np.ascontiguousarray(filein[:, 0:5])
+    apn = filein[:, 6:14] * convrtm
+
+    # Planetary nutation values
+    filein = load('iau03pl.dat')
+    appli = np.ascontiguousarray(filein[:, 1:15])
+    appl = filein[:, 16:20] * convrtm  # 21 is extra
+
+    # GMST values
+    filein = load('iau06gsttab5.2.e.dat')
+    agst = filein[:, 1:3] * convrtu
+    agsti = np.ascontiguousarray(filein[:, 3:17])
+
+    tables = (axs0, a0xi, ays0, a0yi, ass0, a0si, apn, apni, appl, appli, agst, agsti)
+    for tab in tables:
+        tab.flags.writeable = False
+
+    return tables
+
@@ -0,0 +1,152 @@
+import numpy as np
+from .fundarg import fundargvec
+from .iau06in import iau06in
+from .. import backend
+from .iau06trig import TrigTable, iau06trigbytes, iau06poissonsum
+from .iau06trunc import iau06trunc
+from .precess import precess
+from ..math.rotations import rot1mat, rot2mat, rot3mat
+from ..chunking import chunked
+from ..instrument import instrumented
+
+@instrumented
+@chunked(lambda: iau06trigbytes(('ls', 'pl')))
+def iau06pna(ttt, accuracy=None, trig=None):
+    """
+    Calculates the transformation matrix that accounts for the effects of precession-nutation in the IAU2000A theory.
+
+    Parameters:
+    - ttt : float or ndarray
+        Julian centuries of TT, scalar or array (N,).
+    - accuracy : float, optional
+        Truncation error allowed in each of deltapsi and deltaeps (micro arc sec).
+        The luni-solar and planetary terms are dropped together as selected by
+        iau06trunc('pn', accuracy), whose bound gives the guaranteed error.
+        None keeps the full series.
+    - trig : TrigTable, optional
+        sin and cos for the same epochs, shared with other series. One is
+        made for the luni-solar and planetary terms when None.
+
+    Returns:
+    - deltapsi : float
+        Change in longitude (rad).
+    - pnb : numpy.ndarray
+        Nutation transformation matrix for IRE-GCRF, (3, 3) or (N, 3, 3).
+    - prec : numpy.ndarray
+        Precession transformation matrix, (3, 3) or (N, 3, 3).
+    - nut : numpy.ndarray
+        Nutation transformation matrix, (3, 3) or (N, 3, 3).
+    - l : float
+        Delaunay element (rad).
+    - l1 : float
+        Delaunay element (rad).
+    - f : float
+        Delaunay element (rad).
+    - d : float
+        Delaunay element (rad).
+    - omega : float
+        Delaunay element (rad).
+    - lonmer : float
+        Planetary value (rad).
+    - lonven : float
+        Planetary value (rad).
+    - lonear : float
+        Planetary value (rad).
+    - lonmar : float
+        Planetary value (rad).
+    - lonjup : float
+        Planetary value (rad).
+    - lonsat : float
+        Planetary value (rad).
+    - lonurn : float
+        Planetary value (rad).
+    - lonnep : float
+        Planetary value (rad).
+    - precrate : float
+        Planetary value (rad).
+    """
+
+    # " to rad
+    convrt = np.pi / (180.0 * 3600.0)
+    deg2rad = np.pi / 180.0
+
+    ttt = np.asarray(ttt, dtype=float)
+    ttt2 = ttt * ttt
+    ttt3 = ttt2 * ttt
+    ttt4 = ttt2 * ttt2
+    ttt5 = ttt3 * ttt2
+
+    # Obtain data for calculations from the 2000a theory
+    opt = '06'  # a-all, r-reduced, e-1980 theory
+    fargs = fundargvec(ttt, opt)
+    l, l1, f, d, omega, lonmer, lonven, lonear, lonmar, lonjup, lonsat, lonurn, lonnep, precrate = fargs
+    fargs = fargs.reshape(14, -1)
+
+    # ---- obtain data coefficients
+    axs0, a0xi, ays0, a0yi, ass0, a0si, apn, apni, appl, appli, agst, agsti = iau06in()
+
+    ls = np.arange(678)
+    pl = np.arange(687)
+    if accuracy is not None:
+        rows = iau06trunc('pn', accuracy)[0]
+        ls = rows[rows < 678]
+        pl = rows[rows >= 678] - 678
+
+    if backend.compiled('poisson'):
+        tpow = np.stack(np.broadcast_arrays(1.0, ttt)).reshape(2, -1)
+        pnsum, ensum = iau06poissonsum('ls', fargs, tpow, ls).reshape((2,) + np.shape(ttt))
+        pplnsum, eplnsum = iau06poissonsum('pl', fargs, tpow[:1], pl).reshape((2,) + np.shape(ttt))
+    else:
+        if trig is None:
+            trig = TrigTable(fargs)
+
+        # Luni-solar terms use the 5 Delaunay arguments, 678 rows
+        sinval, cosval = trig('ls', ls)
+        pnsum = (apn[ls, 0] @ sinval + apn[ls, 4] @ cosval + (apn[ls, 1] @ sinval) * ttt).reshape(np.shape(ttt))
+        ensum = (apn[ls, 2] @ cosval + apn[ls, 6] @ sinval + (apn[ls, 3] @ cosval) * ttt).reshape(np.shape(ttt))
+
+        # Planetary terms use all 14 arguments, 687 rows
+        sinval, cosval = trig('pl', pl)
+        pplnsum = (appl[pl, 0] @ sinval + appl[pl, 1] @ cosval).reshape(np.shape(ttt))
+        eplnsum = (appl[pl, 2] @ sinval + appl[pl, 3] @ cosval).reshape(np.shape(ttt))
+
+    # Add planetary and luni-solar components
+    deltapsi = pnsum + pplnsum  # rad
+    deltaeps = ensum + eplnsum
+
+    # Corrections to the IAU2000A
+    j2d = -2.7774e-6 * ttt * convrt  # rad
+    deltapsi += deltapsi * (0.4697e-6 + j2d)  # rad
+    deltaeps += deltaeps * j2d
+
+    prec, psia, wa, ea, xa = precess(ttt, '06')
+
+    oblo = 84381.406 * convrt  # " to rad
+
+    # Mean to true
+    a1 = rot1mat(ea + deltaeps)
+    a2 = rot3mat(deltapsi)
+    a3 = rot1mat(-ea)
+
+    # J2000 to date (precession)
+    a4 = rot3mat(-xa)
+    a5 = rot1mat(wa)
+    a6 = rot3mat(psia)
+    a7 = rot1mat(-oblo)
+
+    # ICRS to J2000
+    a8 = rot1mat(-0.0068192 * convrt)
+    a9 = rot2mat(0.0417750 * np.sin(oblo) * convrt)
+    a10 = rot3mat(0.0146 * convrt)
+
+    # Constant frame bias and obliquity rotations broadcast over the epoch stacks
+    frb = a10 @ a9 @ a8
+
+    prec = a7 @ a6 @ a5 @ a4
+
+    nut = a3 @ a2 @ a1
+
+    pnb = frb @ prec @ nut
+
+    return deltapsi, pnb, prec, nut, l, l1, f, d, omega, \
+           lonmer, lonven, lonear, lonmar, lonjup, lonsat, lonurn, lonnep, precrate
@@ -1,9 +1,11 @@
 import numpy as np
-from iau06in import iau06in
-from fundarg import fundarg
-from precess import precess
-from rotations import rot1mat, rot2mat, rot3mat
+from .iau06in import iau06in
+from .fundarg import fundargvec
+from .precess import precess
+from ..math.rotations import rot1mat, rot2mat, rot3mat
+from ..instrument import instrumented
 
+@instrumented
 def iau06pnb(ttt):
     """
     This function calculates the transformation matrix that accounts for the
@@ -15,12 +17,13 @@ def iau06pnb(ttt):
     - Consolidate with IAU 2000, 14 Feb 2005
 
     Inputs:
-        ttt: Julian centuries of TT
+        ttt: Julian centuries of TT, scalar or array (N,)
 
     Outputs:
         deltapsi: Change in longitude (rad)
-        pnb: Transformation matrix for IRE-GCRF
-        nut: Transformation matrix for mean to true equator and equinox
+        pnb: Transformation matrix for IRE-GCRF, (3, 3) or (N, 3, 3)
+        prec: Transformation matrix for precession, (3, 3) or (N, 3, 3)
+        nut: Transformation matrix for mean to true equator and equinox, (3, 3) or (N, 3, 3)
         l: Delaunay element (rad)
         l1: Delaunay element (rad)
         f: Delaunay element (rad)
@@ -40,6 +43,7 @@ def iau06pnb(ttt):
     convrt = np.pi / (180.0 * 3600.0)
     deg2rad = np.pi / 180.0
 
+    ttt = np.asarray(ttt, dtype=float)
     ttt2 = ttt * ttt
     ttt3 = ttt2 * ttt
     ttt4 = ttt2 * ttt2
@@ -47,17 +51,21 @@ def iau06pnb(ttt):
 
     # Obtain data for calculations from the 2000B theory
     opt = '02'  # a-all, r-reduced, e-1980 theory
-    l, l1, f, d, omega, lonmer, lonven, lonear, lonmar, lonjup, lonsat, lonurn, lonnep, precrate = fundarg(ttt, opt)
+    fargs = fundargvec(ttt, opt)
+    l, l1, f, d, omega, lonmer, lonven, lonear, lonmar, lonjup, lonsat, lonurn, lonnep, precrate = fargs
+    fargs = fargs.reshape(14, -1)
 
     # Obtain data coefficients
     axs0, a0xi, ays0, a0yi, ass0, a0si, apn, apni, appl, appli, agst, agsti = iau06in()
 
-    pnsum = 0.0
-    ensum = 0.0
-    for i in range(77, 0, -1):
-        tempval = apni[i - 1, 0] * l + apni[i - 1, 1] * l1 + apni[i - 1, 2] * f + apni[i - 1, 3] * d + apni[i - 1, 4] * omega
-        pnsum += (apn[i - 1, 0] + apn[i - 1, 1] * ttt) * np.sin(tempval) + (apn[i - 1, 4] + apn[i - 1, 5] * ttt) * np.cos(tempval)
-        ensum += (apn[i - 1, 2] + apn[i - 1, 3] * ttt) * np.cos(tempval) + (apn[i - 1, 6] + apn[i - 1, 7] * ttt) * np.sin(tempval)
+    # Luni-solar terms of the 2000b theory, first 77 rows
+    tempval = apni[:77] @ fargs[:5]
+    sinval = np.sin(tempval)
+    cosval = np.cos(tempval)
+    pnsum = (apn[:77, 0] @ sinval + apn[:77, 4] @ cosval
+             + (apn[:77, 1] @ sinval + apn[:77, 5] @ cosval) * ttt).reshape(np.shape(ttt))
+    ensum = (apn[:77, 2] @ cosval + apn[:77, 6] @ sinval
+             + (apn[:77, 3] @ cosval + apn[:77, 7] @ sinval) * ttt).reshape(np.shape(ttt))
 
     # Form the planetary arguments
     pplnsum = -0.000135 * convrt  # " to rad
@@ -0,0 +1,350 @@
+import functools
+import math
+
+import numpy as np
+from .. import backend
+from ..chunking import scratch, sliceable
+from ..timeline import spanned
+from .iau06in import iau06in
+
+# 'direct' - sin and cos of every argument, 'recurrence' - products of e^(i k arg) tables
+_method = 'direct'
+
+# rows of the x, y and s tables multiplied by ttt^0 ... ttt^4
+_blocks = {'x': (1306, 253, 36, 4, 1), 'y': (962, 277, 30, 5, 1), 's': (33, 3, 25, 4, 1)}
+
+
+@functools.lru_cache(maxsize=None)
+def iau06args():
+    """
+    Build one table of the distinct argument multipliers used by the IAU 2006
+    series, with an index from every series row into it.
+
+    The x, y, s, luni-solar nutation, planetary nutation and GST tables repeat
+    many of the same argument combinations. Each distinct combination is kept
+    once, so its sin and cos need only be found once per epoch.
+
+    Outputs:
+        uniq: Distinct integer multipliers of the 14 fundamental arguments, (M, 14)
+        index: Dictionary of read-only row maps into uniq, keyed 'x', 'y', 's',
+               'ls' (luni-solar, 5 Delaunay arguments), 'pl' (planetary) and 'gst'
+
+    Coupling:
+        iau06in: Initialize the arrays
+    """
+    axs0, a0xi, ays0, a0yi, ass0, a0si, apn, apni, appl, appli, agst, agsti = iau06in()
+
+    # luni-solar rows use only the Delaunay arguments, pad to all 14
+    lsi = np.zeros((apni.shape[0], 14))
+    lsi[:, :5] = apni
+
+    names = ('x', 'y', 's', 'ls', 'pl', 'gst')
+    tables = (a0xi, a0yi, a0si, lsi, appli, agsti)
+    uniq, inverse = np.unique(np.concatenate(tables), axis=0, return_inverse=True)
+    inverse = inverse.ravel()
+
+    index = {}
+    start = 0
+    for name, tab in zip(names, tables):
+        index[name] = inverse[start:start + tab.shape[0]]
+        index[name].flags.writeable = False
+        start += tab.shape[0]
+    uniq = np.ascontiguousarray(uniq)
+    uniq.flags.writeable = False
+
+    return uniq, index
+
+
+@functools.lru_cache(maxsize=None)
+def iau06poisson(series):
+    """
+    Arrange one IAU 2006 series for the poisson kernel.
+
+    Inputs:
+        series: 'x', 'y', 's', 'ls' (luni-solar, deltapsi and deltaeps), 'pl'
+                (planetary, deltapsi and deltaeps) or 'gst'
+
+    Outputs:
+        ints: Integer multipliers of the 14 fundamental arguments, (M, 14)
+        coef: sin and cos amplitude of each output, row and power of ttt,
+              (S, M, K, 2) (rad), read-only
+
+    Coupling:
+        iau06in: Initialize the arrays
+    """
+    axs0, a0xi, ays0, a0yi, ass0, a0si, apn, apni, appl, appli, agst, agsti = iau06in()
+
+    if series in _blocks:
+        amp, ints = {'x': (axs0, a0xi), 'y': (ays0, a0yi), 's': (ass0, a0si)}[series]
+        power = np.repeat(np.arange(5), _blocks[series])
+        coef = np.zeros((1, amp.shape[0], 5, 2))
+        coef[0, np.arange(amp.shape[0]), power] = amp[:, 0:2]
+    elif series == 'ls':
+        ints = np.zeros((678, 14))
+        ints[:, :5] = apni[:678]
+        coef = np.zeros((2, 678, 2, 2))
+        coef[0, :, 0] = apn[:678, [0, 4]]
+        coef[0, :, 1, 0] = apn[:678, 1]
+        coef[1, :, 0] = apn[:678, [6, 2]]
+        coef[1, :, 1, 1] = apn[:678, 3]
+    elif series == 'pl':
+        ints = appli[:687]
+        coef = np.zeros((2, 687, 1, 2))
+        coef[0, :, 0] = appl[:687, 0:2]
+        coef[1, :, 0] = appl[:687, 2:4]
+    elif series == 'gst':
+        ints = agsti
+        coef = np.zeros((1, agst.shape[0], 2, 2))
+        coef[0, :33, 0] = agst[:33, 0:2]
+        coef[0, 33:, 1] = agst[33:, 0:2]
+    else:
+        raise ValueError("Unknown series '{}', use 'x', 'y', 's', 'ls', 'pl' or 'gst'.".format(series))
+
+    ints = np.ascontiguousarray(ints, dtype=float)
+    ints.flags.writeable = False
+    coef.flags.writeable = False
+    return ints, coef
+
+
+def _poisson(ints, coef, fargs, tpow):
+    """
+    Sum Poisson series, numpy reference of the poisson kernel.
+
+    Inputs:
+        ints: Integer multipliers of the fundamental arguments, (M, 14)
+        coef: sin and cos amplitudes, (S, M, K, 2)
+        fargs: Fundamental arguments, (14, N) (rad)
+        tpow: Powers ttt^0 ... ttt^(K-1), (K, N)
+
+    Outputs:
+        total: Sum of each of the S series, (S, N)
+    """
+    tempval = ints @ fargs
+    sinval = np.sin(tempval)
+    cosval = np.cos(tempval)
+    return np.einsum('smk,mn,kn->sn', coef[..., 0], sinval, tpow) \
+        + np.einsum('smk,mn,kn->sn', coef[..., 1], cosval, tpow)
+
+
+def _poissonloop(ints, coef, fargs, tpow):
+    """Loop form of _poisson, one pass over the rows per epoch with no temporaries."""
+    nout, nrows, npow, _ = coef.shape
+    nargs = ints.shape[1]
+    nepoch = fargs.shape[1]
+    total = np.zeros((nout, nepoch))
+    for e in range(nepoch):
+        for r in range(nrows):
+            tempval = 0.0
+            for j in range(nargs):
+                if ints[r, j] != 0.0:
+                    tempval += ints[r, j] * fargs[j, e]
+            sinval = math.sin(tempval)
+            cosval = math.cos(tempval)
+            for o in range(nout):
+                for k in range(npow):
+                    total[o, e] += (coef[o, r, k, 0] * sinval + coef[o, r, k, 1] * cosval) * tpow[k, e]
+    return total
+
+
+def _poissonsample():
+    """Arguments for the parity check of the poisson kernel."""
+    rng = np.random.default_rng(0)
+    ints = rng.integers(-4, 5, (40, 14)).astype(float)
+    return ints, rng.normal(size=(2, 40, 3, 2)), rng.uniform(-10.0, 10.0, (14, 7)), rng.normal(size=(3, 7))
+
+
+backend.register('poisson', _poisson, _poissonloop, _poissonsample)
+
+
+@spanned('series sums')
+def iau06poissonsum(series, fargs, tpow, rows=None):
+    """
+    Sum one IAU 2006 series with the poisson kernel.
+
+    The routines call this in place of iau06trig when the compiled backend
+    is active, which evaluates each argument, its sin and cos and the sum in
+    a single loop with no (rows, N) temporaries.
+
+    Inputs:
+        series: As for iau06poisson
+        fargs: Fundamental arguments from fundargvec, (14, N) (rad)
+        tpow: Powers of ttt, (K, N)
+        rows: Optional rows of the series to sum, all when None
+
+    Outputs:
+        total: Sum of each output of the series, (S, N)
+    """
+    ints, coef = iau06poisson(series)
+    if rows is not None:
+        ints = ints[rows]
+        coef = coef[:, rows]
+    return backend.kernel('poisson')(ints, coef, np.ascontiguousarray(fargs, dtype=float),
+                                     np.ascontiguousarray(tpow, dtype=float))
+
+
+@sliceable
+class TrigTable:
+    """
+    sin and cos of the distinct IAU 2006 series arguments for one set of epochs.
+
+    A table is made for the epochs of one call and passed down to the series
+    that share them, as iau06frame does for iau06xys, iau06pna and iau06gst,
+    so each distinct sin and cos is found once. Values are worked out the
+    first time a series asks for them, by the method chosen with
+    iau06trigmethod, and are released with the table. Inside a chunked run
+    the sin and cos arrays are scratch, reused by the table of the next chunk.
+
+    Slicing the table along the epochs gives a table for those epochs that
+    keeps the values already found, which is how chunked runs pass it on.
+
+    Attributes:
+        fargs: Fundamental arguments from fundargvec, (14, N) (rad)
+        method: 'direct' or 'recurrence'
+    """
+
+    def __init__(self, fargs, method=None):
+        uniq, index = iau06args()
+        self.fargs = np.asarray(fargs, dtype=float).reshape(14, -1)
+        self.method = _method if method is None else method
+        self.sin = scratch((uniq.shape[0], self.fargs.shape[1]))
+        self.cos = scratch((uniq.shape[0], self.fargs.shape[1]))
+        self.done = np.zeros(uniq.shape[0], dtype=bool)
+
+    def __len__(self):
+        return self.fargs.shape[1]
+
+    def __getitem__(self, epochs):
+        part = object.__new__(TrigTable)
+        part.fargs = self.fargs[:, epochs]
+        part.method = self.method
+        part.sin = self.sin[:, epochs]
+        part.cos = self.cos[:, epochs]
+        part.done = self.done.copy()
+        return part
+
+    @spanned('series sums')
+    def __call__(self, series, rows=None):
+        """
+        Find sin and cos of the arguments of one series.
+
+        Inputs:
+            series: 'x', 'y', 's', 'ls', 'pl' or 'gst'
+            rows: Optional rows of the series to return, all when None
+
+        Outputs:
+            sinval: sin of the argument of each row, (rows, N)
+            cosval: cos of the argument of each row, (rows, N)
+        """
+        uniq, index = iau06args()
+        inv = index[series] if rows is None else index[series][rows]
+
+        # ---- evaluate the distinct arguments not already found for these epochs
+        need = np.zeros(uniq.shape[0], dtype=bool)
+        need[inv] = True
+        todo = np.flatnonzero(need & ~self.done)
+        if todo.size > 0:
+            if self.method == 'recurrence':
+                self.sin[todo], self.cos[todo] = _recurrence(uniq[todo], self.fargs)
+            else:
+                tempval = uniq[todo] @ self.fargs
+                self.sin[todo] = np.sin(tempval)
+                self.cos[todo] = np.cos(tempval)
+            self.done[todo] = True
+
+        return self.sin[inv], self.cos[inv]
+
+
+@spanned('series sums')
+def iau06trig(fargs, series, rows=None):
+    """
+    Find sin and cos of the arguments of one IAU 2006 series.
+
+    The values are worked out on the table of distinct arguments, only for
+    the arguments the series needs, by the method chosen with
+    iau06trigmethod. To share them between series for the same epochs, make
+    one TrigTable and call it for each series instead.
+
+    Inputs:
+        fargs: Fundamental arguments from fundargvec, (14, N) (rad)
+        series: 'x', 'y', 's', 'ls', 'pl' or 'gst'
+        rows: Optional rows of the series to return, all when None
+
+    Outputs:
+        sinval: sin of the argument of each row, (rows, N)
+        cosval: cos of the argument of each row, (rows, N)
+
+    Coupling:
+        TrigTable: Distinct sin and cos for a set of epochs
+    """
+    return TrigTable(fargs)(series, rows)
+
+
+def iau06trigbytes(series):
+    """
+    Estimate the scratch memory per epoch taken to sum IAU 2006 series.
+
+    With numpy this is the sin and cos kept for every distinct argument plus
+    the (rows, N) temporaries of the longest series; the poisson kernel keeps
+    no temporaries. Used to size the chunks of long runs.
+
+    Inputs:
+        series: Names of the series summed together, as for iau06trig
+
+    Outputs:
+        nbytes: Bytes per epoch
+    """
+    if backend.compiled('poisson'):
+        return 0
+    uniq, index = iau06args()
+    rows = max(index[name].size for name in series)
+    return 8 * (2 * uniq.shape[0] + 5 * rows)
+
+
+def iau06trigmethod(method=None):
+    """
+    Choose how iau06trig and new TrigTables evaluate the series arguments.
+
+    Inputs:
+        method: 'direct' for sin and cos of every argument, 'recurrence' for
+                products of tables of e^(i k arg) built by repeated complex
+                multiplication, or None to leave the choice unchanged
+
+    Outputs:
+        method: The method in use
+    """
+    global _method
+    if method is not None:
+        if method not in ('direct', 'recurrence'):
+            raise ValueError("Unknown method '{}', use 'direct' or 'recurrence'.".format(method))
+        _method = method
+    return _method
+
+
+def _recurrence(ints, fargs):
+    """
+    sin and cos of ints @ fargs with no transcendental call per term.
+
+    For each fundamental argument e^(i arg) is found once per epoch and raised
+    to the powers 0 ... max |k| of its column by repeated multiplication.
+    The phase of each row is the product of one table entry per nonzero
+    multiplier, the conjugate standing in for negative multipliers.
+    """
+    ints = ints.astype(np.int64)
+    phase = np.ones((ints.shape[0],) + fargs.shape[1:], dtype=complex)
+    for j in range(ints.shape[1]):
+        nz = np.flatnonzero(ints[:, j])
+        if nz.size == 0:
+            continue
+        k = ints[nz, j]
+
+        unit = np.exp(1j * fargs[j])
+        power = np.empty((np.abs(k).max() + 1,) + unit.shape, dtype=complex)
+        power[0] = 1.0
+        for n in range(1, power.shape[0]):
+            power[n] = power[n - 1] * unit
+
+        term = power[np.abs(k)]
+        term[k < 0] = term[k < 0].conj()
+        phase[nz] *= term
+
+    return phase.imag, phase.real
@@ -0,0 +1,67 @@
+import functools
+
+import numpy as np
+from .iau06in import iau06in
+
+@functools.lru_cache(maxsize=None)
+def iau06trunc(series, accuracy):
+    """
+    Select the terms of an IAU 2006 series needed for a given accuracy.
+
+    The smallest terms are dropped while the sum of their amplitudes stays
+    within the accuracy, so the sum of the dropped terms can never exceed the
+    returned bound for |ttt| <= 1 (1900 to 2100), where every ttt^k factor is
+    at most one. The selection is made once per series and accuracy and cached.
+
+    Inputs:
+        series: 'x', 'y', 's' for the CIP series of iau06xys, or 'pn' for the
+                2000a luni-solar rows followed by the planetary rows of iau06pna
+        accuracy: Largest allowed truncation error (micro arc sec)
+
+    Outputs:
+        rows: Sorted indices of the rows to keep, read-only. For 'pn' indices
+              below 678 are luni-solar rows and the rest are planetary rows
+              offset by 678
+        bound: Largest possible error of the truncated sum (micro arc sec),
+               for 'pn' it holds for both deltapsi and deltaeps
+
+    Locals:
+        amp: Largest magnitude of each term over |ttt| <= 1 (micro arc sec)
+
+    Coupling:
+        iau06in: Initialize the arrays
+
+    References:
+        Vallado 2013, 212-216
+    """
+    axs0, a0xi, ays0, a0yi, ass0, a0si, apn, apni, appl, appli, _, _ = iau06in()
+
+    # ---- largest magnitude a*sin + b*cos can reach for each row
+    if series == 'x':
+        amp = np.hypot(axs0[:, 0], axs0[:, 1])
+    elif series == 'y':
+        amp = np.hypot(ays0[:, 0], ays0[:, 1])
+    elif series == 's':
+        amp = np.hypot(ass0[:, 0], ass0[:, 1])
+    elif series == 'pn':
+        # luni-solar terms carry a ttt rate on the sin (psi) or cos (eps) part
+        ampls = np.maximum(np.abs(apn[:678, 0]) + np.abs(apn[:678, 1]) + np.abs(apn[:678, 4]),
+                           np.abs(apn[:678, 2]) + np.abs(apn[:678, 3]) + np.abs(apn[:678, 6]))
+        amppl = np.maximum(np.hypot(appl[:687, 0], appl[:687, 1]), np.hypot(appl[:687, 2], appl[:687, 3]))
+        amp = np.concatenate((ampls, amppl))
+    else:
+        raise ValueError("Unknown series '{}', use 'x', 'y', 's' or 'pn'.".format(series))
+
+    convrt = 1.0e-6 * np.pi / (180.0 * 3600.0)  # micro arc sec to rad
+    amp = amp / convrt
+
+    # ---- drop the smallest terms while their total stays within the accuracy
+    order = np.argsort(amp, kind='stable')
+    dropped = np.cumsum(amp[order])
+    ndrop = np.searchsorted(dropped, accuracy, side='right')
+    bound = float(dropped[ndrop - 1]) if ndrop > 0 else 0.0
+
+    rows = np.sort(order[ndrop:])
+    rows.flags.writeable = False
+
+    return rows, bound
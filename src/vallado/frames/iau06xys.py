@@ -0,0 +1,158 @@
+import numpy as np
+from .fundarg import fundargvec
+from .iau06in import iau06in
+from .. import backend
+from .iau06trig import TrigTable, iau06trigbytes, iau06poissonsum
+from .iau06trunc import iau06trunc
+from ..chunking import chunked
+from ..instrument import instrumented
+from ..timeline import spanned
+
+@instrumented
+@chunked(lambda: iau06trigbytes(('x', 'y', 's')), epochs=('ddx', 'ddy'))
+def iau06xys(ttt, ddx, ddy, accuracy=None, trig=None):
+    """
+    Calculates the transformation matrix that accounts for the
+    effects of precession-nutation in the IAU2006 theory.
+
+    Author: David Vallado, 719-573-2600, 16 Jul 2004
+
+    Revisions:
+    - Vallado: Consolidate with IAU 2000, 14 Feb 2005
+
+    Inputs:
+        ttt: Julian centuries of TT, scalar or array (N,)
+        ddx: EOP correction for x (rad)
+        ddy: EOP correction for y (rad)
+        accuracy: Optional truncation error allowed in each of x, y and s
+                  (micro arc sec). Terms are dropped as selected by iau06trunc,
+                  whose bound gives the guaranteed error, e.g.
+                  iau06trunc('x', accuracy)[1]. None keeps the full series
+        trig: TrigTable for the same epochs to share sin and cos with other
+              series (optional, one is made for x, y and s when None)
+
+    Outputs:
+        x: Coordinate of CIP (rad)
+        y: Coordinate of CIP (rad)
+        s: Coordinate (rad)
+        nut: Transformation matrix for TIRS-GCRF, (3, 3) or (N, 3, 3)
+
+    Long arrays of epochs are run in chunks that fit the chunking budget.
+
+    Locals:
+        axs0: Real coefficients for x (rad)
+        a0xi: Integer coefficients for x
+        ays0: Real coefficients for y (rad)
+        a0yi: Integer coefficients for y
+        ass0: Real coefficients for s (rad)
+        a0si: Integer coefficients for s
+        apn: Real coefficients for nutation (rad)
+        apni: Integer coefficients for nutation
+        appl: Real coefficients for planetary nutation (rad)
+        appli: Integer coefficients for planetary nutation
+        ttt2, ttt3: Powers of ttt
+        l, l1, f, d, omega: Delaunay elements (rad)
+        deltaeps: Change in obliquity (rad)
+        many others
+
+    Coupling:
+        iau00in: Initialize the arrays
+        fundargvec: Find the fundamental arguments
+        iau06trunc: Select the terms kept for an accuracy
+        TrigTable: sin and cos of the series arguments, shared between series
+        iau06poissonsum: Series sums with the compiled backend
+        chunked: Split long runs to fit the memory budget
+
+    References:
+        Vallado 2004, 212-214
+    """
+
+    convrt = np.pi / (180.0 * 3600.0)
+
+    ttt = np.asarray(ttt, dtype=float)
+    ttt2 = ttt * ttt
+    ttt3 = ttt2 * ttt
+    ttt4 = ttt2 * ttt2
+    ttt5 = ttt3 * ttt2
+
+    # Call iau06in function to initialize coefficients
+    axs0, a0xi, ays0, a0yi, ass0, a0si, apn, apni, appl, appli, _, _ = iau06in()
+
+    opt = '06'  # 02 - 2000a, 96 - 1996 theory, 80-1980 theory
+
+    fargs = trig.fargs if trig is not None else fundargvec(ttt, opt).reshape(14, -1)
+    x = -0.016617 + 2004.191898 * ttt - 0.4297829 * ttt2 - 0.19861834 * ttt3 - 0.000007578 * ttt4 + 0.0000059285 * ttt5
+    y = -0.006951 - 0.025896 * ttt - 22.4072747 * ttt2 + 0.00190059 * ttt3 + 0.001112526 * ttt4 + 0.0000001358 * ttt5
+    s = 0.000094 + 0.00380865 * ttt - 0.00012268 * ttt2 - 0.07257411 * ttt3 + 0.00002798 * ttt4 + 0.00001562 * ttt5
+
+    # Each table holds blocks of rows multiplied by ttt^0 ... ttt^4
+    tpow = np.stack(np.broadcast_arrays(1.0, ttt, ttt2, ttt3, ttt4)).reshape(5, -1)
+    xrows = yrows = srows = None
+    if accuracy is not None:
+        xrows = iau06trunc('x', accuracy)[0]
+        yrows = iau06trunc('y', accuracy)[0]
+        srows = iau06trunc('s', accuracy)[0]
+    if backend.compiled('poisson'):
+        xsum = iau06poissonsum('x', fargs, tpow, xrows)[0].reshape(ttt.shape)
+        ysum = iau06poissonsum('y', fargs, tpow, yrows)[0].reshape(ttt.shape)
+        ssum = iau06poissonsum('s', fargs, tpow, srows)[0].reshape(ttt.shape)
+    else:
+        if trig is None:
+            trig = TrigTable(fargs)
+        xsum = _powersum(axs0, (1306, 253, 36, 4, 1), trig('x', xrows), tpow, xrows).reshape(ttt.shape)
+        ysum = _powersum(ays0, (962, 277, 30, 5, 1), trig('y', yrows), tpow, yrows).reshape(ttt.shape)
+        ssum = _powersum(ass0, (33, 3, 25, 4, 1), trig('s', srows), tpow, srows).reshape(ttt.shape)
+
+    # Calculate x, y, and s - all in radians
+    x = x * convrt + xsum
+    y = y * convrt + ysum
+    s = -x * y * 0.5 + s * convrt + ssum
+
+    # Apply corrections
+    x = x + ddx
+    y = y + ddy
+
+    # Now find a
+    a = 0.5 + 0.125 * (x * x + y * y) # units take on whatever x and y are
+
+    # Find nutation matrix
+    nut1 = np.zeros(x.shape + (3, 3))
+    nut1[..., 0, 0] = 1.0 - a * x * x
+    nut1[..., 0, 1] = -a * x * y
+    nut1[..., 0, 2] = x
+    nut1[..., 1, 0] = -a * x * y
+    nut1[..., 1, 1] = 1.0 - a * y * y
+    nut1[..., 1, 2] = y
+    nut1[..., 2, 0] = -x
+    nut1[..., 2, 1] = -y
+    nut1[..., 2, 2] = 1.0 - a * (x * x + y * y)
+
+    coss = np.cos(s)
+    sins = np.sin(s)
+    nut2 = np.zeros(s.shape + (3, 3))
+    nut2[..., 0, 0] = coss
+    nut2[..., 1, 1] = coss
+    nut2[..., 0, 1] = sins
+    nut2[..., 1, 0] = -sins
+    nut2[..., 2, 2] = 1.0
+
+    nut = nut1 @ nut2
+
+    return x, y, s, nut
+
+
+@spanned('series sums')
+def _powersum(coef, blocks, trig, tpow, rows=None):
+    """Sum sin/cos series whose consecutive row blocks are multiplied by ttt^0, ttt^1, ..."""
+    sinval, cosval = trig
+    if rows is not None:
+        # only the sorted rows kept, blocks shrink to the rows left in each
+        blocks = np.diff(np.searchsorted(rows, np.cumsum((0,) + blocks)))
+        coef = coef[rows]
+    terms = coef[:, 0:1] * sinval + coef[:, 1:2] * cosval
+    total = np.zeros(tpow.shape[1])
+    row = 0
+    for k, nrows in enumerate(blocks):
+        total += terms[row:row + nrows].sum(axis=0) * tpow[k]
+        row += nrows
+    return total
@@ -0,0 +1,65 @@
+import numpy as np
+from .iau06frame import iau06framerates
+from ..instrument import instrumented
+from ..timeline import span
+
+@instrumented(vec=True)
+def itrf2gcrf(recef, vecef, aecef, ttt, jdut1, lod=0.0, xp=0.0, yp=0.0, option='c', ddx=0.0, ddy=0.0,
+              eop=None, ephem=None, cache=None):
+    """
+    This function transforms a vector from the Earth fixed (ITRF) frame to the
+    GCRF in one step, the inverse of gcrf2itrf.
+
+    With T = pm^T st^T pnb^T the GCRF - ITRF rotation, the stacked position,
+    velocity and acceleration are mapped by [T' 0 0; Tdot' T' 0; Tddot' 2Tdot' T'],
+    with ' the transpose, in a single product.
+
+    Inputs:
+        recef: position vector Earth fixed (km), (3,) or (N, 3)
+        vecef: velocity vector Earth fixed (km/s), (3,) or (N, 3)
+        aecef: acceleration vector Earth fixed (km/s^2), (3,) or (N, 3)
+        ttt: Julian centuries of TT (centuries), scalar or (N,)
+        jdut1: Julian date of UT1 (days from 4713 BC), scalar or (N,)
+        lod: Excess length of day (sec)
+        xp: Polar motion coefficient (rad)
+        yp: Polar motion coefficient (rad)
+        option: Which approach to use (a-2000a, b-2000b, c-2000xys)
+        ddx: EOP correction for x (rad)
+        ddy: EOP correction for y (rad)
+        eop: EOPStore to take lod, xp, yp, ddx and ddy from at jdut1 (optional)
+        ephem: FrameEphem to interpolate the rotations from (optional), used
+               only when it matches the option and EOP of the call, as for
+               cirs2ecefiau06
+        cache: FrameCache to take the rotations from (optional)
+
+    Outputs:
+        rgcrf: position vector GCRF (km)
+        vgcrf: velocity vector GCRF (km/s)
+        agcrf: acceleration vector GCRF (km/s^2)
+
+    Coupling:
+        iau06framerates: Rotations and rates of the reduction
+
+    References:
+        Vallado 2013, 212-226
+    """
+    pnb, w, wdot, wddot = iau06framerates(ttt, jdut1, lod, xp, yp, option, ddx, ddy, eop, ephem, cache)
+
+    with span('state transform'):
+        # transposes of T, Tdot and Tddot
+        trott = pnb @ np.swapaxes(w, -1, -2)
+        tdott = pnb @ np.swapaxes(wdot, -1, -2)
+
+        big = np.zeros(trott.shape[:-2] + (9, 9))
+        big[..., 0:3, 0:3] = trott
+        big[..., 3:6, 3:6] = trott
+        big[..., 6:9, 6:9] = trott
+        big[..., 3:6, 0:3] = tdott
+        big[..., 6:9, 3:6] = 2.0 * tdott
+        big[..., 6:9, 0:3] = pnb @ np.swapaxes(wddot, -1, -2)
+
+        state = np.concatenate(np.broadcast_arrays(np.asarray(recef, dtype=float), np.asarray(vecef, dtype=float),
+                                                   np.asarray(aecef, dtype=float)), axis=-1)
+        out = (big @ state[..., None])[..., 0]
+
+    return out[..., 0:3], out[..., 3:6], out[..., 6:9]
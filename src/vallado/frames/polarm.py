@@ -0,0 +1,88 @@
+import numpy as np
+from ..instrument import instrumented
+
+@instrumented
+def polarm(xp, yp, ttt, opt):
+    """
+    Calculates the transformation matrix that accounts for polar motion.
+    
+    Both the 1980 and 2000 theories are handled. Note that the rotation 
+    order is different between 1980 and 2000.
+    
+    Author: David Vallado (719-573-2600), 25 Jun 2002
+    
+    Inputs may be scalars or arrays of epochs; they are broadcast together.
+
+    Inputs:
+        xp : float or ndarray
+            Polar motion coefficient in radians
+        yp : float or ndarray
+            Polar motion coefficient in radians
+        ttt : float or ndarray
+            Julian centuries of TT (00 theory only)
+        opt : str
+            Method option: '01', '02', '80'
+    
+    Outputs:
+        pm : ndarray
+            Transformation matrix for ECEF - PEF, shape (3, 3) for scalar
+            inputs or (N, 3, 3) for arrays of N epochs
+    
+    References:
+        Vallado 2004, 207-209, 211, 223-224
+    """
+    cosxp, sinxp, cosyp, sinyp, ttt = np.broadcast_arrays(np.cos(xp), np.sin(xp), np.cos(yp), np.sin(yp),
+                                                          np.asarray(ttt, dtype=float))
+
+    pm = np.empty(cosxp.shape + (3, 3))
+
+    if opt == "80":
+        pm[..., 0, 0] = cosxp
+        pm[..., 0, 1] = 0.0
+        pm[..., 0, 2] = -sinxp
+        pm[..., 1, 0] = sinxp * sinyp
+        pm[..., 1, 1] = cosyp
+        pm[..., 1, 2] = cosxp * sinyp
+        pm[..., 2, 0] = sinxp * cosyp
+        pm[..., 2, 1] = -sinyp
+        pm[..., 2, 2] = cosxp * cosyp
+
+        # a1 = rot2mat(xp);
+        # a2 = rot1mat(yp);
+        # pm = a2*a1;          
+        # Approximate matrix using small angle approximations
+        # pm[0][0] =  1.0
+        # pm[1][0] =  0.0
+        # pm[2][0] =  xp
+        # pm[0][1] =  0.0
+        # pm[1][1] =  1.0
+        # pm[2][1] = -yp
+        # pm[0][2] = -xp
+        # pm[1][2] =  yp
+        # pm[2][2] =  1.0
+    else:
+        convrt = np.pi / (3600.0 * 180.0)
+        # approximate sp value in rad
+        sp = -47.0e-6 * ttt * convrt
+        cossp = np.cos(sp)
+        sinsp = np.sin(sp)
+
+        # print(' sp  {:14.11f} mas'.format(sp/convrt))
+
+        # form the matrix
+        pm[..., 0, 0] = cosxp * cossp
+        pm[..., 0, 1] = -cosyp * sinsp + sinyp * sinxp * cossp
+        pm[..., 0, 2] = -sinyp * sinsp - cosyp * sinxp * cossp
+        pm[..., 1, 0] = cosxp * sinsp
+        pm[..., 1, 1] = cosyp * cossp + sinyp * sinxp * sinsp
+        pm[..., 1, 2] = sinyp * cossp - cosyp * sinxp * sinsp
+        pm[..., 2, 0] = sinxp
+        pm[..., 2, 1] = -sinyp * cosxp
+        pm[..., 2, 2] = cosyp * cosxp
+
+        # a1 = rot1mat(yp);
+        # a2 = rot2mat(xp);
+        # a3 = rot3mat(-sp);
+        # pm = a3*a2*a1;
+
+    return pm
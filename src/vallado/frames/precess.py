@@ -1,5 +1,7 @@
 import numpy as np
+from ..instrument import instrumented
 
+@instrumented
 def precess(ttt, opt):
     """
     This function calculates the transformation matrix that accounts for the effects
@@ -12,22 +14,28 @@ def precess(ttt, opt):
     - Vallado: Consolidate with iau 2000, 14 Feb 2005
 
     Inputs:
-    - ttt: Julian centuries of TT
+    - ttt: Julian centuries of TT, scalar or array (N,)
     - opt: Method option: '01', '02', '96', '80'
 
     Outputs:
-    - prec: Transformation matrix for mod - j2000 (80 only)
+    - prec: Transformation matrix for mod - j2000 (80 only), (3, 3) or (N, 3, 3)
     - psia: Canonical precession angle in radians (00 only)
     - wa: Canonical precession angle in radians (00 only)
     - ea: Canonical precession angle in radians (00 only)
     - xa: Canonical precession angle in radians (00 only)
+
+    The angles have the shape of ttt.
     """
     # " to rad
     convrt = np.pi / (180.0 * 3600.0)
+    ttt = np.asarray(ttt, dtype=float)
     ttt2 = ttt * ttt
     ttt3 = ttt2 * ttt
 
-    prec = np.eye(3)
+    prec = np.zeros(ttt.shape + (3, 3))
+    prec[..., 0, 0] = 1.0
+    prec[..., 1, 1] = 1.0
+    prec[..., 2, 2] = 1.0
 
     # ------------------- fk4 b1950 precession angles --------------------
     if opt == '50':
@@ -44,15 +52,15 @@ def precess(ttt, opt):
         z = 2304.9969 * ttt + 1.092999 * ttt2 + 0.0192 * ttt3
         # tp-008 36-45
         # ttt is tropical centuries from 1950 36524.22 days
-        prec[0, 0] = 1.0 - 2.9696e-4 * ttt2 - 1.3e-7 * ttt3
-        prec[0, 1] = 2.234941e-2 * ttt + 6.76e-6 * ttt2 - 2.21e-6 * ttt3
-        prec[0, 2] = 9.7169e-3 * ttt - 2.07e-6 * ttt2 - 9.6e-7 * ttt3
-        prec[1, 0] = -prec[0, 1]
-        prec[1, 1] = 1.0 - 2.4975e-4 * ttt2 - 1.5e-7 * ttt3
-        prec[1, 2] = -1.0858e-4 * ttt2
-        prec[2, 0] = -prec[0, 2]
-        prec[2, 1] = prec[1, 2]
-        prec[2, 2] = 1.0 - 4.721e-5 * ttt2
+        prec[..., 0, 0] = 1.0 - 2.9696e-4 * ttt2 - 1.3e-7 * ttt3
+        prec[..., 0, 1] = 2.234941e-2 * ttt + 6.76e-6 * ttt2 - 2.21e-6 * ttt3
+        prec[..., 0, 2] = 9.7169e-3 * ttt - 2.07e-6 * ttt2 - 9.6e-7 * ttt3
+        prec[..., 1, 0] = -prec[..., 0, 1]
+        prec[..., 1, 1] = 1.0 - 2.4975e-4 * ttt2 - 1.5e-7 * ttt3
+        prec[..., 1, 2] = -1.0858e-4 * ttt2
+        prec[..., 2, 0] = -prec[..., 0, 2]
+        prec[..., 2, 1] = prec[..., 1, 2]
+        prec[..., 2, 2] = 1.0 - 4.721e-5 * ttt2
         # pass these back out for testing
         psia = zeta
         wa = theta
@@ -94,14 +102,14 @@ def precess(ttt, opt):
         cosz = np.cos(z)
         sinz = np.sin(z)
         # ----------------- form matrix  mod to j2000 -----------------
-        prec[0, 0] = coszeta * costheta * cosz - sinzeta * sinz
-        prec[0, 1] = coszeta * costheta * sinz + sinzeta * cosz
-        prec[0, 2] = coszeta * sintheta
-        prec[1, 0] = -sinzeta * costheta * cosz - coszeta * sinz
-        prec[1, 1] = -sinzeta * costheta * sinz + coszeta * cosz
-        prec[1, 2] = -sinzeta * sintheta
-        prec[2, 0] = -sintheta * cosz
-        prec[2, 1] = -sintheta * sinz
-        prec[2, 2] = costheta
+        prec[..., 0, 0] = coszeta * costheta * cosz - sinzeta * sinz
+        prec[..., 0, 1] = coszeta * costheta * sinz + sinzeta * cosz
+        prec[..., 0, 2] = coszeta * sintheta
+        prec[..., 1, 0] = -sinzeta * costheta * cosz - coszeta * sinz
+        prec[..., 1, 1] = -sinzeta * costheta * sinz + coszeta * cosz
+        prec[..., 1, 2] = -sinzeta * sintheta
+        prec[..., 2, 0] = -sintheta * cosz
+        prec[..., 2, 1] = -sintheta * sinz
+        prec[..., 2, 2] = costheta
 
     return prec, psia, wa, ea, xa
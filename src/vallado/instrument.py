@@ -0,0 +1,131 @@
+"""
+Opt-in call counters and timers for the public routines.
+
+Routines wrapped with the instrumented decorator record, while instrumentation
+is enabled, their call count, total and maximum wall time and the number of
+epochs or states passed in. When disabled (the default) the wrapper only checks
+one module flag before calling through, so it can stay in place in production.
+The same wrapper also emits a timeline span for each call while timeline
+tracing is enabled.
+
+    from vallado import instrument
+    instrument.enable()
+    ...
+    print(instrument.tojson())
+    instrument.reset()
+
+Locals:
+    _enabled: True when calls are being recorded
+    _stats: Dictionary of per routine statistics keyed by routine name
+"""
+
+import functools
+import json
+import time
+
+import numpy as np
+
+from . import timeline
+_enabled = False
+_stats = {}
+
+
+def enable():
+    """Start recording calls."""
+    global _enabled
+    _enabled = True
+
+
+def disable():
+    """Stop recording calls. Statistics gathered so far are kept."""
+    global _enabled
+    _enabled = False
+
+
+def isenabled():
+    return _enabled
+
+
+def reset():
+    """Discard all statistics."""
+    _stats.clear()
+
+
+def snapshot():
+    """
+    Return the statistics gathered so far.
+
+    Returns:
+        dict: routine name -> dict with
+            calls: number of calls
+            total: total wall time (s)
+            max: longest single call (s)
+            mean: mean wall time per call (s)
+            items: total number of epochs/states processed
+            maxbatch: largest number of epochs/states in one call
+    """
+    out = {}
+    for name, stat in _stats.items():
+        entry = dict(stat)
+        entry['mean'] = stat['total'] / stat['calls']
+        out[name] = entry
+    return out
+
+
+def tojson(**kwargs):
+    """Return the snapshot as a JSON string. Keyword arguments go to json.dumps."""
+    return json.dumps(snapshot(), **kwargs)
+
+
+def record(name, dt, batch):
+    """Add one call of duration dt (s) over batch items to the statistics of name."""
+    stat = _stats.get(name)
+    if stat is None:
+        stat = _stats[name] = {'calls': 0, 'total': 0.0, 'max': 0.0, 'items': 0, 'maxbatch': 0}
+    stat['calls'] += 1
+    stat['total'] += dt
+    if dt > stat['max']:
+        stat['max'] = dt
+    stat['items'] += batch
+    if batch > stat['maxbatch']:
+        stat['maxbatch'] = batch
+
+
+def instrumented(func=None, vec=False):
+    """
+    Decorator recording calls of func while instrumentation is enabled.
+
+    The batch size is taken from the first argument: its number of elements,
+    or its number of 3-vectors when vec is True.
+
+    Usage:
+        @instrumented
+        def iau06xys(ttt, ddx, ddy): ...
+
+        @instrumented(vec=True)
+        def rv2coe(r, v, mu): ...
+    """
+    if func is None:
+        return lambda f: instrumented(f, vec)
+
+    name = func.__name__
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        if not _enabled:
+            if not timeline._enabled:
+                return func(*args, **kwargs)
+            with timeline.span(name, 'call'):
+                return func(*args, **kwargs)
+        t0 = time.perf_counter()
+        try:
+            with timeline.span(name, 'call'):
+                return func(*args, **kwargs)
+        finally:
+            dt = time.perf_counter() - t0
+            batch = np.size(args[0]) if args else 1
+            if vec:
+                batch = max(batch // 3, 1)
+            record(name, dt, batch)
+
+    return wrapper
@@ -0,0 +1,26 @@
+"""
+Initial orbit determination from angles only observations.
+
+The modules are imported on first access, vallado.iod.<module>; the routines
+themselves are attributes of the vallado package.
+"""
+
+import importlib
+
+_modules = (
+    'anglesdr',
+    'anglesg',
+    'anglesl',
+    'checkhitearth',
+    'doubler',
+)
+
+
+def __getattr__(name):
+    if name in _modules:
+        return importlib.import_module('.' + name, __name__)
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_modules))
@@ -1,5 +1,8 @@
 import numpy as np
+from ..instrument import instrumented
+from ..timeline import span
 
+@instrumented
 def anglesg(decl1, decl2, decl3, rtasc1, rtasc2, rtasc3, jd1, jdf1, jd2, jdf2, jd3, jdf3, rs1, rs2, rs3):
     """
     This function solves the problem of orbit determination using three optical sightings.
@@ -81,13 +84,14 @@ def anglesg(decl1, decl2, decl3, rtasc1, rtasc2, rtasc3, jd1, jdf1, jd2, jdf2, j
     magrs2 = np.linalg.norm(rs2)
     l2dotrs = np.dot(los2, rs2)
 
-    poly = np.zeros(9)
-    poly[2] = -(dl1 ** 2 + 2.0 * dl1 * l2dotrs + magrs2 ** 2)
-    poly[5] = -2.0 * mu * (l2dotrs * dl2 + dl1 * dl2)
-    poly[8] = -mu ** 2 * dl2 ** 2
+    with span('gauss root'):
+        poly = np.zeros(9)
+        poly[2] = -(dl1 ** 2 + 2.0 * dl1 * l2dotrs + magrs2 ** 2)
+        poly[5] = -2.0 * mu * (l2dotrs * dl2 + dl1 * dl2)
+        poly[8] = -mu ** 2 * dl2 ** 2
 
-    rootarr = np.roots(poly)
-    bigr2 = max([root.real for root in rootarr if root.imag == 0])
+        rootarr = np.roots(poly)
+        bigr2 = max([root.real for root in rootarr if root.imag == 0])
 
     # Solve matrix with u2 better known
     u = mu / bigr2 ** 3
@@ -106,64 +110,65 @@ def anglesg(decl1, decl2, decl3, rtasc1, rtasc2, rtasc3, jd1, jdf1, jd2, jdf2, j
     r3 = rhomat[2, 0] * l3eci / c3 + rs3
 
     # Refine the answer
-    rho2 = 999999.9
-    ll = 0
-    while abs(rhoold2 - rho2) > 1.0e-12 and ll <= 0:
-        ll += 1
-        rho2 = rhoold2
+    with span('refinement'):
+        rho2 = 999999.9
+        ll = 0
+        while abs(rhoold2 - rho2) > 1.0e-12 and ll <= 0:
+            ll += 1
+            rho2 = rhoold2
 
-        r1 = rhomat[0, 0] * l1eci / c1 + rs1
-        r2 = -rhomat[1, 0] * l2eci + rs2
-        r3 = rhomat[2, 0] * l3eci / c3 + rs3
+            r1 = rhomat[0, 0] * l1eci / c1 + rs1
+            r2 = -rhomat[1, 0] * l2eci + rs2
+            r3 = rhomat[2, 0] * l3eci / c3 + rs3
 
-        magr1 = np.linalg.norm(r1)
-        magr2 = np.linalg.norm(r2)
-        magr3 = np.linalg.norm(r3)
+            magr1 = np.linalg.norm(r1)
+            magr2 = np.linalg.norm(r2)
+            magr3 = np.linalg.norm(r3)
 
-        n1 = np.cross(r1, r2)
-        n2 = np.cross(r2, r3)
-        n3 = np.cross(r1, r3)
+            n1 = np.cross(r1, r2)
+            n2 = np.cross(r2, r3)
+            n3 = np.cross(r1, r3)
 
-        mag_n1 = np.linalg.norm(n1)
-        mag_n2 = np.linalg.norm(n2)
-        mag_n3 = np.linalg.norm(n3)
+            mag_n1 = np.linalg.norm(n1)
+            mag_n2 = np.linalg.norm(n2)
+            mag_n3 = np.linalg.norm(n3)
 
-        cosd12 = np.dot(r1, r2) / (magr1 * magr2)
-        cosd23 = np.dot(r2, r3) / (magr2 * magr3)
-        cosd31 = np.dot(r1, r3) / (magr1 * magr3)
+            cosd12 = np.dot(r1, r2) / (magr1 * magr2)
+            cosd23 = np.dot(r2, r3) / (magr2 * magr3)
+            cosd31 = np.dot(r1, r3) / (magr1 * magr3)
 
-        sind12 = mag_n1 / (magr1 * magr2)
-        sind23 = mag_n2 / (magr2 * magr3)
-        sind31 = mag_n3 / (magr1 * magr3)
+            sind12 = mag_n1 / (magr1 * magr2)
+            sind23 = mag_n2 / (magr2 * magr3)
+            sind31 = mag_n3 / (magr1 * magr3)
 
-        cos2d12 = np.dot(r1, r2) / (magr1 * magr2)
-        cos2d23 = np.dot(r2, r3) / (magr2 * magr3)
-        cos2d31 = np.dot(r1, r3) / (magr1 * magr3)
+            cos2d12 = np.dot(r1, r2) / (magr1 * magr2)
+            cos2d23 = np.dot(r2, r3) / (magr2 * magr3)
+            cos2d31 = np.dot(r1, r3) / (magr1 * magr3)
 
-        s1sq = 1.0 - cosd12 ** 2
-        s2sq = 1.0 - cosd23 ** 2
-        s3sq = 1.0 - cosd31 ** 2
+            s1sq = 1.0 - cosd12 ** 2
+            s2sq = 1.0 - cosd23 ** 2
+            s3sq = 1.0 - cosd31 ** 2
 
-        u = np.zeros(3)
-        u[0] = np.sqrt(mu) / magr1 ** 1.5
-        u[1] = np.sqrt(mu) / magr2 ** 1.5
-        u[2] = np.sqrt(mu) / magr3 ** 1.5
+            u = np.zeros(3)
+            u[0] = np.sqrt(mu) / magr1 ** 1.5
+            u[1] = np.sqrt(mu) / magr2 ** 1.5
+            u[2] = np.sqrt(mu) / magr3 ** 1.5
 
-        f1 = -tau32 / tau31
-        f2 = 1.0
-        f3 = tau12 / tau31
+            f1 = -tau32 / tau31
+            f2 = 1.0
+            f3 = tau12 / tau31
 
-        g1 = f2 * f3 / s1sq
-        g2 = -f1 * f3 / s2sq
-        g3 = f1 * f2 / s3sq
+            g1 = f2 * f3 / s1sq
+            g2 = -f1 * f3 / s2sq
+            g3 = f1 * f2 / s3sq
 
-        rho1 = (s2sq * g1 * rhoold1 + s3sq * g2 * rhoold2 + s1sq * g3 * rhoold3) / \
-               (s1sq * (g1 + g3) + s2sq * (g1 + g2) + s3sq * (g2 + g3))
+            rho1 = (s2sq * g1 * rhoold1 + s3sq * g2 * rhoold2 + s1sq * g3 * rhoold3) / \
+                   (s1sq * (g1 + g3) + s2sq * (g1 + g2) + s3sq * (g2 + g3))
 
-        rho2 = (rhoold2 - (rho1 - rhoold1) * f1) / f2
-        rho3 = (rhoold3 - (rho1 - rhoold1) * f3) / f3
+            rho2 = (rhoold2 - (rho1 - rhoold1) * f1) / f2
+            rho3 = (rhoold3 - (rho1 - rhoold1) * f3) / f3
 
-        rhomat = np.array([[rho1], [-rho2], [rho3]])
+            rhomat = np.array([[rho1], [-rho2], [rho3]])
 
     # Solve for velocity
     drdot = np.zeros(3)
@@ -1,9 +1,14 @@
 import numpy as np
-from mag import mag
-from constastro import earthrot, mu
+from ..math.mag import mag
+from ..constastro import earthrot, mu
+from ..instrument import instrumented
+from ..diagnostics import getlogger
+
+_log = getlogger(__name__)
 
 # Function to solve the problem of orbit determination using three optical sightings and the method of Laplace
-def anglesl(decl1, decl2, decl3, rtasc1, rtasc2, rtasc3, jd1, jdf1, jd2, jdf2, jd3, jdf3, diffsites, rs1, rs2, rs3):
+@instrumented
+def anglesl(decl1, decl2, decl3, rtasc1, rtasc2, rtasc3, jd1, jdf1, jd2, jdf2, jd3, jdf3, diffsites, rs1, rs2, rs3, info=False):
     """
     This function solves the problem of orbit determination using three optical sightings and the method of Laplace.
 
@@ -13,10 +18,14 @@ def anglesl(decl1, decl2, decl3, rtasc1, rtasc2, rtasc3, jd1, jdf1, jd2, jdf2, j
         jd1, jdf1, jd2, jdf2, jd3, jdf3: Julian date of 1st, 2nd, and 3rd sightings (days from 4713 BC)
         diffsites: Flag indicating if sightings are from different sites ('n' for no, 'y' for yes)
         rs1, rs2, rs3: ECI site position vectors (km)
+        info: True to also return the solution details (default False)
 
     Outputs:
-        r2: IJK position vector (km)
-        v2: IJK velocity vector (km/s)
+        r2: IJK position vector (km), nan when the determinant is too small
+        v2: IJK velocity vector (km/s), nan when the determinant is too small
+        details: Only with info=True, dict of the determinant d, whether it
+                 allowed a solution (solved), and the range rho (km), range
+                 rate rhodot (km/s) and root bigr2 (km) when it did
     """
 
     # Constants
@@ -94,7 +103,13 @@ def anglesl(decl1, decl2, decl3, rtasc1, rtasc2, rtasc3, jd1, jdf1, jd2, jdf2, j
 
         # Find middle velocity vector
         v2 = rhodot * los2 + rho * ldot + rs2dot
+        details = {'d': d, 'solved': True, 'rho': rho, 'rhodot': rhodot, 'bigr2': bigr2}
     else:
-        print("Determinant value was zero:", d)
+        r2 = np.full(3, np.nan)
+        v2 = np.full(3, np.nan)
+        details = {'d': d, 'solved': False}
+        _log.warning('determinant value was zero: %s', d)
 
+    if info:
+        return r2, v2, details
     return r2, v2
@@ -1,7 +1,10 @@
 import numpy as np
-from mag import mag
+from ..math.mag import mag
+from ..diagnostics import getlogger
 
-def checkhitearth(altPad, r1, v1t, r2, v2t, nrev):
+_log = getlogger(__name__)
+
+def checkhitearth(altPad, r1, v1t, r2, v2t, nrev, info=False):
     """
     This function checks to see if the trajectory hits the earth during the transfer.
 
@@ -12,18 +15,21 @@ def checkhitearth(altPad, r1, v1t, r2, v2t, nrev):
     - r2 (list): final position vector of int (km)
     - v2t (list): final velocity vector of trns (km/s)
     - nrev (int): number of revolutions (0, 1, 2, ...)
+    - info (bool): True to also return the perigee radius (default False)
 
     Returns:
     - hitearth (str): 'y' if earth was impacted, 'n' otherwise
     - hitearthstr (str): "y - radii" if earth was impacted, "no" otherwise
+    - rp (float): only with info=True, radius of perigee of the transfer (km),
+      nan when perigee is not passed or the end points are already inside
     """
     
     # -------------------------- implementation -----------------
-    show = 'n'
     mu = 3.986004418e5
     
     hitearth = 'n'
     hitearthstr = 'no'
+    rp = np.nan
     
     magr1 = mag(r1)
     magr2 = mag(r2)
@@ -35,8 +41,7 @@ def checkhitearth(altPad, r1, v1t, r2, v2t, nrev):
         # hitting earth already at start or stop point
         hitearth = 'y'
         hitearthstr = hitearth + ' initradii'
-        if show == 'y':
-            print('hitearth?', hitearthstr)
+        _log.debug('hitearth? %s', hitearthstr)
     else:
         rdotv1 = np.dot(r1, v1t)
         rdotv2 = np.dot(r2, v2t)
@@ -103,7 +108,8 @@ def checkhitearth(altPad, r1, v1t, r2, v2t, nrev):
                                 hitearth = 'y'
                                 hitearthstr = hitearth + ' Sub_Earth_hyp'
         
-        if show == 'y':
-            print('hitearth?', hitearth, 'rp', rp * 6378.0, 'km')
+        _log.debug('hitearth? %s rp %s km', hitearth, rp)
 
+    if info:
+        return hitearth, hitearthstr, rp
     return hitearth, hitearthstr
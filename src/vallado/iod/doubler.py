@@ -1,7 +1,13 @@
 import numpy as np
+from ..instrument import instrumented
+from ..math.smallmat import cross, dot, norm
+from ..diagnostics import getlogger
 
+_log = getlogger(__name__)
+
+@instrumented
 def doubler(cc1, cc2, magrsite1, magrsite2, magr1in, magr2in,
-            los1, los2, los3, rsite1, rsite2, rsite3, t1, t3, direct, re, mu):
+            los1, los2, los3, rsite1, rsite2, rsite3, t1, t3, direct, re, mu, info=False):
     """
     This routine accomplishes the iteration work for the double-r angles only routine.
 
@@ -15,12 +21,15 @@ def doubler(cc1, cc2, magrsite1, magrsite2, magr1in, magr2in,
     - direct: 'y' or 'n'
     - re: Earth's radius
     - mu: gravitational parameter
+    - info: True to also return the orbit details (default False)
 
     Returns:
     - r2, r3: position vectors
     - f1, f2: time values
     - q1: value
     - magr1, magr2, a, deltae32: magnitudes and angle
+    - details: only with info=True, dict of the eccentricity e, semilatus
+      rectum p and whether the hyperbolic branch was taken (hyperbolic)
     """
 
     rho1 = (-cc1 + np.sqrt(cc1**2 - 4.0 * (magrsite1**2 - magr1in**2))) / 2.0
@@ -28,27 +37,27 @@ def doubler(cc1, cc2, magrsite1, magrsite2, magr1in, magr2in,
     r1 = rho1 * los1 + rsite1
     r2 = rho2 * los2 + rsite2
 
+    magr1 = norm(r1)
+    magr2 = norm(r2)
     if direct == 'y':
-        w = np.cross(r1, r2) / (np.linalg.norm(r1) * np.linalg.norm(r2))
+        w = cross(r1, r2) / (magr1 * magr2)
     else:
-        w = -np.cross(r1, r2) / (np.linalg.norm(r1) * np.linalg.norm(r2))
+        w = -cross(r1, r2) / (magr1 * magr2)
 
-    rho3 = -np.dot(rsite3, w) / np.dot(los3, w)
+    rho3 = -dot(rsite3, w) / dot(los3, w)
     r3 = rho3 * los3 + rsite3
-    magr1 = np.linalg.norm(r1)
-    magr2 = np.linalg.norm(r2)
-    magr3 = np.linalg.norm(r3)
+    magr3 = norm(r3)
 
-    cosdv21 = np.dot(r2, r1) / (magr2 * magr1)
-    sindv21 = np.linalg.norm(np.cross(r2, r1)) / (magr2 * magr1)
+    cosdv21 = dot(r2, r1) / (magr2 * magr1)
+    sindv21 = norm(cross(r2, r1)) / (magr2 * magr1)
     dv21 = np.arctan2(sindv21, cosdv21)
 
-    cosdv31 = np.dot(r3, r1) / (magr3 * magr1)
+    cosdv31 = dot(r3, r1) / (magr3 * magr1)
     sindv31 = np.sqrt(1.0 - cosdv31**2)
     dv31 = np.arctan2(sindv31, cosdv31)
 
-    cosdv32 = np.dot(r3, r2) / (magr3 * magr2)
-    sindv32 = np.linalg.norm(np.cross(r3, r2)) / (magr3 * magr2)
+    cosdv32 = dot(r3, r2) / (magr3 * magr2)
+    sindv32 = norm(cross(r3, r2)) / (magr3 * magr2)
     dv32 = np.arctan2(sindv32, cosdv32)
 
     if dv31 > np.pi:
@@ -89,7 +98,7 @@ def doubler(cc1, cc2, magrsite1, magrsite2, magr1in, magr2in,
         deltam32 = deltae32 + 2 * s * (np.sin(deltae32 / 2))**2 - c * np.sin(deltae32)
         deltam12 = -deltae21 + 2 * s * (np.sin(deltae21 / 2))**2 + c * np.sin(deltae21)
     else:
-        print('Hyperbolic, e1 is greater than 0.99:', e)
+        _log.debug('hyperbolic, e1 is greater than 0.99: %s', e)
         n = np.sqrt(mu / (-a**3))
 
         s = magr2 / p * np.sqrt(e**2 - 1) * esinv2
@@ -109,4 +118,7 @@ def doubler(cc1, cc2, magrsite1, magrsite2, magr1in, magr2in,
     f2 = t3 - deltam32 / n
     q1 = np.sqrt(f1**2 + f2**2)
 
+    if info:
+        details = {'e': e, 'p': p, 'hyperbolic': not e**2 < 0.99}
+        return r2, r3, f1, f2, q1, magr1, magr2, a, deltae32, details
     return r2, r3, f1, f2, q1, magr1, magr2, a, deltae32
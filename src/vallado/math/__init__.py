@@ -0,0 +1,35 @@
+"""
+Vector, matrix, polynomial, interpolation and elliptic integral routines.
+
+The modules are imported on first access, vallado.math.<module>; the routines
+themselves are attributes of the vallado package.
+"""
+
+import importlib
+
+_modules = (
+    'angl',
+    'cubic',
+    'cubicinterp',
+    'cubicspl',
+    'cubicspl1',
+    'elliptic12',
+    'eventstream',
+    'mag',
+    'matmult',
+    'quadric',
+    'recovpar',
+    'rotations',
+    'smallmat',
+    'vec3',
+)
+
+
+def __getattr__(name):
+    if name in _modules:
+        return importlib.import_module('.' + name, __name__)
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_modules))
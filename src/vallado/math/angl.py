@@ -0,0 +1,28 @@
+import numpy as np
+from .mag import mag
+from . import smallmat
+def angl(vec1, vec2):
+    """
+    Calculate the angle between two vectors.
+    
+    Parameters:
+        vec1 (array_like): Vector number 1, (3,) or a stack (N, 3).
+        vec2 (array_like): Vector number 2, (3,) or a stack (N, 3).
+        
+    Returns:
+        float: Angle between the two vectors in the range [0, pi], or array (N,)
+               for stacks. If the angle cannot be determined (due to zero
+               magnitude vectors), returns 999999.1.
+    """
+    small = 0.00000001
+    undefined = 999999.1
+
+    magv1 = mag(vec1)
+    magv2 = mag(vec2)
+
+    # atan2 of the cross and dot products, full precision near 0 and pi
+    theta = smallmat.angle(vec1, vec2)
+    if isinstance(theta, float):
+        return theta if magv1 * magv2 > small ** 2 else undefined
+
+    return np.where(magv1 * magv2 > small ** 2, theta, undefined)[()]
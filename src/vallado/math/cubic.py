@@ -1,4 +1,4 @@
-from quadric import quadric
+from .quadric import quadric
 
 def cubic(a3, b2, c1, d0, opt):
     """
@@ -1,7 +1,10 @@
-from cubicspl import cubicspl
-from cubic import cubic
+from .cubicspl import cubicspl
+from .cubic import cubic
+from ..diagnostics import getlogger
 
-def cubicinterp(p1a, p1b, p1c, p1d, p2a, p2b, p2c, p2d, valuein):
+_log = getlogger(__name__)
+
+def cubicinterp(p1a, p1b, p1c, p1d, p2a, p2b, p2c, p2d, valuein, info=False):
     """
     This function performs a cubic spline. Four points are needed.
 
@@ -11,9 +14,12 @@ def cubicinterp(p1a, p1b, p1c, p1d, p2a, p2b, p2c, p2d, valuein):
         p1a, p1b, p1c, p1d (float): Points for cubic spline 1.
         p2a, p2b, p2c, p2d (float): Points for cubic spline 2.
         valuein (float): Input value.
+        info (bool): True to also return whether a root was found.
 
     Returns:
         float: Interpolated value.
+        bool: Only with info=True, False when no root of the second spline
+            lies in [0, 1] and the first point of the interval was used.
 
     References:
         Vallado 2013, 1027
@@ -27,6 +33,7 @@ def cubicinterp(p1a, p1b, p1c, p1d, p2a, p2b, p2c, p2d, valuein):
     # use the normalized time first, but at an arbitrary interval
     r1r, r1i, r2r, r2i, r3r, r3i = cubic(kc3, kc2, kc1, kc0 - valuein, 'R')
     # print('cubic', ac0, ac1, kc0, r1r, r2r)
+    found = True
     if -0.000001 <= r1r <= 1.001:
         value = r1r
     elif -0.000001 <= r2r <= 1.001:
@@ -35,7 +42,10 @@ def cubicinterp(p1a, p1b, p1c, p1d, p2a, p2b, p2c, p2d, valuein):
         value = r3r
     else:
         value = 0.0
-        print(f"error in cubicinterp root {valuein} {r1r} {r2r} {r3r}")
+        found = False
+        _log.warning('no root in [0, 1] for %s, roots %s %s %s', valuein, r1r, r2r, r3r)
 
     answer = ac3 * value ** 3 + ac2 * value ** 2 + ac1 * value + ac0
+    if info:
+        return answer, found
     return answer
@@ -1,5 +1,5 @@
-from cubic import cubic
-from recovpar import recovpar
+from .cubic import cubic
+from .recovpar import recovpar
 
 def cubicspl1(p1, p2, p3, p4):
     """
@@ -49,7 +49,7 @@ def cubicspl1(p1, p2, p3, p4):
             minfound = 'y'
             rootf = root
             # [time] = recovpar(t1,t2,t3,t4, root);
-            _, ans = recovpar(p1, p2, p3, p4, root)  # should be 0.0!!!!!!
+            ans = recovpar(p1, p2, p3, p4, root)  # should be 0.0!!!!!!
             # ----- recover the function value derivative
             funrate = 3.0 * acu3 * root ** 2 + 2.0 * acu2 * root + acu1
 
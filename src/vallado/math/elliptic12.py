@@ -0,0 +1,176 @@
+import math
+
+import numpy as np
+from .. import backend
+def elliptic12(u, m, tol=np.finfo(float).eps):
+    """
+    Evaluate the value of the Incomplete Elliptic Integrals of the First, Second Kind and Jacobi's Zeta Function.
+
+    Parameters:
+    u (array_like): Phase in radians.
+    m (array_like): Module (0 < m < 1).
+    tol (float, optional): Tolerance. Default is machine epsilon.
+
+    Returns:
+    F (ndarray): Incomplete Elliptic Integral of the First Kind.
+    E (ndarray): Incomplete Elliptic Integral of the Second Kind.
+    Z (ndarray): Jacobi Zeta Function.
+
+    Uses the method of the Arithmetic-Geometric Mean and Descending Landen Transformation.
+    """
+    if np.ndim(u) == 0:
+        u = np.array([u])
+    if np.ndim(m) == 0:
+        m = np.array([m])
+    
+    if len(u) != len(m):
+        raise ValueError("U and M must be the same size.")
+    
+    F = np.zeros_like(u)
+    E = np.zeros_like(u)
+    Z = np.zeros_like(u)
+
+    if np.any(np.logical_or(m < 0, m > 1)):
+        raise ValueError("M must be in the range 0 <= M <= 1.")
+    
+    m = np.asarray(m)
+    u = np.asarray(u)
+
+    # cdav change for small eccentricities
+    m[m < 1e-7] = 1e-7
+
+    I = np.where(np.logical_and(m != 1, m != 0))[0]
+    if len(I) > 0:
+        F[I], E[I], Z[I] = backend.kernel('elliptic12')(np.asarray(u[I], dtype=float),
+                                                        np.asarray(m[I], dtype=float), float(tol))
+
+    # Special cases: m == {0, 1}
+    m0 = np.where(m == 0)[0]
+    if len(m0) > 0:
+        F[m0] = u[m0]
+        E[m0] = u[m0]
+
+    m1 = np.where(m == 1)[0]
+    um1 = np.abs(u[m1])
+    if len(m1) > 0:
+        N = np.floor((um1 + np.pi / 2) / np.pi)
+        M = np.where(um1 < np.pi / 2)[0]
+        
+        F[m1[M]] = np.log(np.tan(np.pi / 4 + u[m1[M]] / 2))
+        F[m1[um1 >= np.pi / 2]] = np.inf * np.sign(u[m1[um1 >= np.pi / 2]])
+
+        E[m1] = ((-1) ** N * np.sin(um1) + 2 * N) * np.sign(u[m1])
+
+        Z[m1] = (-1) ** N * np.sin(u[m1])
+
+    return F, E, Z
+
+
+def _landen(u, m, tol):
+    """
+    Arithmetic-geometric mean and descending Landen transformation for 0 < m < 1,
+    numpy reference of the elliptic12 kernel.
+
+    Returns F, E and Z for each element of u and m.
+    """
+    mu, J, K = np.unique(m, return_index=True, return_inverse=True)
+    mumax = len(mu)
+    signU = np.sign(u)
+
+    chunk = 7
+    a = np.zeros((chunk, mumax))
+    c = np.copy(a)
+    b = np.copy(a)
+    a[0, :] = 1
+    c[0, :] = np.sqrt(mu)
+    b[0, :] = np.sqrt(1 - mu)
+    n = np.zeros(mumax, dtype=np.uint32)
+    i = 0
+    while np.any(np.abs(c[i, :]) > tol):
+        i += 1
+        if i >= a.shape[0]:
+            a = np.concatenate((a, np.zeros((2, mumax))))
+            b = np.concatenate((b, np.zeros((2, mumax))))
+            c = np.concatenate((c, np.zeros((2, mumax))))
+        a[i, :] = 0.5 * (a[i-1, :] + b[i-1, :])
+        b[i, :] = np.sqrt(a[i-1, :] * b[i-1, :])
+        c[i, :] = 0.5 * (a[i-1, :] - b[i-1, :])
+        in_indices = np.where(np.logical_and(np.abs(c[i, :]) <= tol, np.abs(c[i-1, :]) > tol))[0]
+        if len(in_indices) > 0:
+            n[in_indices] = i - 1
+    
+    mmax = len(u)
+    mn = np.max(n)
+    phin = np.zeros(mmax)
+    C = np.zeros(mmax)
+    Cp = np.zeros(mmax)
+    e = np.zeros(mmax, dtype=np.uint32)
+    phin[:] = signU * u
+    i = 0
+    while i < mn:
+        i += 1
+        in_indices = np.where(n[K] > i)[0]
+        if len(in_indices) > 0:
+            phin[in_indices] = np.arctan(b[i, K[in_indices]] / a[i, K[in_indices]] * np.tan(phin[in_indices])) \
+                                + np.pi * (np.ceil(phin[in_indices] / np.pi - 0.5)) + phin[in_indices]
+            e[in_indices] = 2 ** (i - 1)
+            C[in_indices] += e[in_indices[0]] * c[i, K[in_indices]]
+            Cp[in_indices] += c[i + 1, K[in_indices]] * np.sin(phin[in_indices])
+    
+    Ff = phin / (a[mn, K] * e * 2)
+    return Ff * signU, (Cp + (1 - 1/2 * C) * Ff) * signU, Cp * signU
+
+
+def _landenloop(u, m, tol):
+    """Loop form of _landen, one element at a time."""
+    size = u.shape[0]
+    F = np.empty(size)
+    E = np.empty(size)
+    Z = np.empty(size)
+    a = np.empty(64)
+    b = np.empty(64)
+    c = np.empty(64)
+    for k in range(size):
+        a[0] = 1.0
+        b[0] = math.sqrt(1.0 - m[k])
+        c[0] = math.sqrt(m[k])
+        i = 0
+        while abs(c[i]) > tol:
+            i += 1
+            a[i] = 0.5 * (a[i-1] + b[i-1])
+            b[i] = math.sqrt(a[i-1] * b[i-1])
+            c[i] = 0.5 * (a[i-1] - b[i-1])
+        n = i - 1
+
+        signU = 1.0 if u[k] > 0.0 else (-1.0 if u[k] < 0.0 else 0.0)
+        phin = signU * u[k]
+        C = 0.0
+        Cp = 0.0
+        e = 0.0
+        for i in range(1, n):
+            phin = math.atan(b[i] / a[i] * math.tan(phin)) + math.pi * math.ceil(phin / math.pi - 0.5) + phin
+            e = 2.0 ** (i - 1)
+            C += e * c[i]
+            Cp += c[i + 1] * math.sin(phin)
+
+        # no Landen step is taken for very small m, the reference then divides by zero
+        den = a[n] * e * 2
+        if den != 0.0:
+            Ff = phin / den
+        elif phin != 0.0:
+            Ff = math.copysign(math.inf, phin)
+        else:
+            Ff = math.nan
+        F[k] = Ff * signU
+        Z[k] = Cp * signU
+        E[k] = (Cp + (1 - 1/2 * C) * Ff) * signU
+    return F, E, Z
+
+
+def _landensample():
+    """Arguments for the parity check of the elliptic12 kernel."""
+    rng = np.random.default_rng(0)
+    return rng.uniform(-3.0, 3.0, 50), rng.uniform(1e-7, 0.999, 50), float(np.finfo(float).eps)
+
+
+backend.register('elliptic12', _landen, _landenloop, _landensample)
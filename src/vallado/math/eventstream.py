@@ -0,0 +1,53 @@
+import numpy as np
+from .cubicspl1 import cubicspl1
+
+def eventstream(chunks):
+    """
+    Find the zero crossings of a sampled function one chunk at a time.
+
+    The samples are consumed from an iterator of (t, f) chunks, so a long span
+    never has to be held in memory at once. Each interval between consecutive
+    samples is blended with the four surrounding points (see cubicspl1), and
+    the last three samples of every chunk are carried over to the next one so
+    that intervals spanning a chunk boundary are still searched. Events are
+    yielded as soon as the interval holding them is bracketed.
+
+    Inputs:
+        chunks: iterable of (t, f) pairs of equal length 1-d arrays, with t
+                increasing and evenly spaced across chunks
+
+    Outputs (generator):
+        tevent: time of the zero crossing (units of t)
+        funrate: rate of the function at the crossing (units of f per t)
+
+    Notes:
+        The first and last intervals of the whole series have no outer
+        neighbour and are not searched. Memory use is one chunk plus three
+        samples, no matter how many chunks are supplied.
+
+    Coupling:
+        cubicspl1: cubic blending of four points and root solution
+
+    References:
+        Vallado, 2013, 559, 1034
+    """
+    tcarry = np.empty(0)
+    fcarry = np.empty(0)
+
+    for t, f in chunks:
+        tbuf = np.concatenate((tcarry, np.asarray(t, dtype=float)))
+        fbuf = np.concatenate((fcarry, np.asarray(f, dtype=float)))
+
+        # ---- window j blends points j..j+3, the event lies between j+1 and j+2
+        if fbuf.size >= 4:
+            p2 = fbuf[1:-2]
+            p3 = fbuf[2:-1]
+            bracket = np.nonzero((p2 == 0.0) | (p2 * p3 < 0.0))[0]
+            for j in bracket:
+                minfound, rootf, funrate = cubicspl1(fbuf[j], fbuf[j + 1], fbuf[j + 2], fbuf[j + 3])
+                if minfound == 'y':
+                    dt = tbuf[j + 2] - tbuf[j + 1]
+                    yield tbuf[j + 1] + rootf * dt, funrate / dt
+
+        tcarry = tbuf[-3:]
+        fcarry = fbuf[-3:]
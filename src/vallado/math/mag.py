@@ -0,0 +1,23 @@
+import math
+
+import numpy as np
+from . import smallmat
+from . import vec3
+def mag(vec):
+    """
+    Calculate the magnitude of a vector.
+    
+    Parameters:
+        vec (array_like): Input vector, (3,) or a stack (N, 3).
+        
+    Returns:
+        float: Magnitude of the vector, or array (N,) for a stack. Magnitudes
+               whose square is below 1.0e-16 are returned as 0.0.
+    """
+    if smallmat.isvec(vec):
+        temp = vec3.dot3(vec, vec)
+        return np.float64(math.sqrt(temp) if abs(temp) >= 1.0e-16 else 0.0)
+
+    temp = smallmat.dot(vec, vec)
+
+    return np.where(np.abs(temp) >= 1.0e-16, np.sqrt(temp), 0.0)[()]
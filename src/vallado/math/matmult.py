@@ -1,7 +1,9 @@
 import numpy as np
-
-# Function to perform matrix multiplication
+from . import smallmat
+# Function to perform matrix multiplication, 3x3 matrices or (N, 3, 3) stacks
 def matmult(a, b):
+    if np.shape(a)[-2:] == np.shape(b)[-2:] == (3, 3):
+        return smallmat.matmat(a, b)
     return np.dot(a, b)
 
 def matvecmult(mat, vec, size_of):
@@ -10,12 +12,13 @@ def matvecmult(mat, vec, size_of):
     
                                    function matvecmult
     
-      this function multiplies a matrix by a vector.
+      this function multiplies a matrix by a vector. stacks of matrices
+        (n,3,3) and vectors (n,3) are multiplied pairwise.
     
       author        : david vallado                  719-573-2600    4 jun 2002
     
       revisions
-                    -
+                    - stacked 3x3 product from smallmat
     
       inputs          description                    range / units
         mat         - matrix (square)
@@ -23,20 +26,15 @@ def matvecmult(mat, vec, size_of):
         size        - dimension of matrix
     
       outputs       :
-        outvec      - unit vector
-    
-      locals        :
-        i,j         - index
+        outvec      - vector, (3,) or (n,3)
     
       coupling      :
-        none
+        smallmat.matvec - stacked matrix vector product
     
       [outvec] = matvecmult ( mat, vec, sizeof );
     ----------------------------------------------------------------------------
     """
     # -------------------------  implementation   -----------------
-    outvec = [0.0] * size_of
-    for i in range(size_of):
-        for j in range(size_of):
-            outvec[i] += mat[i][j] * vec[j]
-    return outvec
+    if size_of != 3:
+        return np.dot(mat, vec)
+    return smallmat.matvec(mat, vec)
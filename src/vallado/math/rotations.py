@@ -31,19 +31,22 @@ def rot1mat(xval):
     Set up a rotation matrix for an input angle about the first axis.
 
     Parameters:
-    - xval : float
-        Angle of rotation in radians.
+    - xval : float or ndarray
+        Angle of rotation in radians, scalar or array (N,).
 
     Returns:
-    - outmat : list of lists
-        Matrix result.
+    - outmat : ndarray
+        Matrix result, (3, 3) or (N, 3, 3).
     """
     c = np.cos(xval)
     s = np.sin(xval)
 
-    outmat = [[1.0, 0.0, 0.0],
-              [0.0, c, s],
-              [0.0, -s, c]]
+    outmat = np.zeros(np.shape(c) + (3, 3))
+    outmat[..., 0, 0] = 1.0
+    outmat[..., 1, 1] = c
+    outmat[..., 1, 2] = s
+    outmat[..., 2, 1] = -s
+    outmat[..., 2, 2] = c
 
     return outmat
 
@@ -79,19 +82,22 @@ def rot2mat(xval):
     Set up a rotation matrix for an input angle about the second axis.
 
     Parameters:
-    - xval : float
-        Angle of rotation in radians.
+    - xval : float or ndarray
+        Angle of rotation in radians, scalar or array (N,).
 
     Returns:
-    - outmat : list of lists
-        Matrix result.
+    - outmat : ndarray
+        Matrix result, (3, 3) or (N, 3, 3).
     """
     c = np.cos(xval)
     s = np.sin(xval)
 
-    outmat = [[c, 0.0, -s],
-              [0.0, 1.0, 0.0],
-              [s, 0.0, c]]
+    outmat = np.zeros(np.shape(c) + (3, 3))
+    outmat[..., 0, 0] = c
+    outmat[..., 0, 2] = -s
+    outmat[..., 1, 1] = 1.0
+    outmat[..., 2, 0] = s
+    outmat[..., 2, 2] = c
 
     return outmat
 
@@ -127,18 +133,21 @@ def rot3mat(xval):
     Set up a rotation matrix for an input angle about the third axis.
 
     Parameters:
-    - xval : float
-        Angle of rotation in radians.
+    - xval : float or ndarray
+        Angle of rotation in radians, scalar or array (N,).
 
     Returns:
-    - outmat : list of lists
-        Matrix result.
+    - outmat : ndarray
+        Matrix result, (3, 3) or (N, 3, 3).
     """
     c = np.cos(xval)
     s = np.sin(xval)
 
-    outmat = [[c, s, 0.0],
-              [-s, c, 0.0],
-              [0.0, 0.0, 1.0]]
+    outmat = np.zeros(np.shape(c) + (3, 3))
+    outmat[..., 0, 0] = c
+    outmat[..., 0, 1] = s
+    outmat[..., 1, 0] = -s
+    outmat[..., 1, 1] = c
+    outmat[..., 2, 2] = 1.0
 
     return outmat
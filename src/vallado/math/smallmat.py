@@ -0,0 +1,213 @@
+"""
+Linear algebra on stacks of 3 vectors and 3x3 matrices.
+
+Every function takes a single vector (3,) or matrix (3, 3), or stacks of them
+(N, 3) and (N, 3, 3), broadcasting the leading axes, and writes into out when
+one is given so that loops over many epochs need not allocate. The products
+are written out by component, which for three elements is faster than the
+general numpy routines.
+
+A call on a single vector, with no out, goes to the math kernels of vec3,
+which avoid the fixed cost of numpy on three elements and give the same
+result; vectors still come back as arrays and scalars as np.float64, so a
+division by a degenerate dot product gives inf or nan as it does for stacks.
+A single matrix and vector that are already arrays take one np.dot, which is
+cheaper than unpacking the matrix.
+
+    r = matvec(w, rcirs)            # (N, 3, 3) with (N, 3)
+    h = cross(r, v)
+    incl = angle(h, [0.0, 0.0, 1.0])
+"""
+
+import numpy as np
+from . import vec3
+small = 1.0e-8
+
+
+def _out(out, shape):
+    """Return out, or a new array for the result shape."""
+    return np.empty(shape) if out is None else out
+
+
+def isvec(vec):
+    """True for a single 3 vector given as an array, list or tuple."""
+    if isinstance(vec, np.ndarray):
+        return vec.shape == (3,)
+    return isinstance(vec, (list, tuple)) and len(vec) == 3 and not hasattr(vec[0], '__len__')
+
+
+def ismat(mat):
+    """True for a single 3x3 matrix."""
+    if isinstance(mat, np.ndarray):
+        return mat.shape == (3, 3)
+    return isinstance(mat, (list, tuple)) and len(mat) == 3 and isvec(mat[0])
+
+
+def matvec(mat, vec, out=None):
+    """
+    Multiply matrices by vectors.
+
+    Inputs:
+        mat: Matrix, (3, 3) or (N, 3, 3)
+        vec: Vector, (3,) or (N, 3)
+        out: Optional result array
+
+    Outputs:
+        outvec: mat vec, (3,) or (N, 3)
+    """
+    if out is None and ismat(mat) and isvec(vec):
+        if isinstance(mat, np.ndarray) and isinstance(vec, np.ndarray):
+            return np.dot(mat, vec)
+        return np.array(vec3.matvec3(mat, vec), dtype=float)
+    mat = np.asarray(mat, dtype=float)
+    vec = np.asarray(vec, dtype=float)
+    out = _out(out, np.broadcast_shapes(mat.shape[:-1], vec.shape))
+    return np.matmul(mat, vec[..., None], out=out[..., None])[..., 0]
+
+
+def mattvec(mat, vec, out=None):
+    """
+    Multiply transposed matrices by vectors, the inverse rotation for rotation matrices.
+
+    Inputs:
+        mat: Matrix, (3, 3) or (N, 3, 3)
+        vec: Vector, (3,) or (N, 3)
+        out: Optional result array
+
+    Outputs:
+        outvec: mat^T vec, (3,) or (N, 3)
+    """
+    if out is None and ismat(mat) and isvec(vec):
+        if isinstance(mat, np.ndarray) and isinstance(vec, np.ndarray):
+            return np.dot(vec, mat)
+        return np.array(vec3.mattvec3(mat, vec), dtype=float)
+    mat = np.asarray(mat, dtype=float)
+    return matvec(np.swapaxes(mat, -1, -2), vec, out)
+
+
+def matmat(mat1, mat2, out=None):
+    """
+    Multiply matrices.
+
+    Inputs:
+        mat1: Matrix, (3, 3) or (N, 3, 3)
+        mat2: Matrix, (3, 3) or (N, 3, 3)
+        out: Optional result array
+
+    Outputs:
+        outmat: mat1 mat2, (3, 3) or (N, 3, 3)
+    """
+    mat1 = np.asarray(mat1, dtype=float)
+    mat2 = np.asarray(mat2, dtype=float)
+    out = _out(out, np.broadcast_shapes(mat1.shape[:-2], mat2.shape[:-2]) + (3, 3))
+    return np.matmul(mat1, mat2, out=out)
+
+
+def dot(vec1, vec2, out=None):
+    """
+    Dot product of vectors.
+
+    Inputs:
+        vec1: Vector, (3,) or (N, 3)
+        vec2: Vector, (3,) or (N, 3)
+        out: Optional result array
+
+    Outputs:
+        dotp: vec1 . vec2, np.float64 or (N,)
+    """
+    if out is None and isvec(vec1) and isvec(vec2):
+        return np.float64(vec3.dot3(vec1, vec2))
+    vec1 = np.asarray(vec1, dtype=float)
+    vec2 = np.asarray(vec2, dtype=float)
+    out = _out(out, np.broadcast_shapes(vec1.shape, vec2.shape)[:-1])
+    np.multiply(vec1[..., 0], vec2[..., 0], out=out)
+    out += vec1[..., 1] * vec2[..., 1]
+    out += vec1[..., 2] * vec2[..., 2]
+    return out if out.ndim else out[()]
+
+
+def cross(vec1, vec2, out=None):
+    """
+    Cross product of vectors.
+
+    Inputs:
+        vec1: Vector, (3,) or (N, 3)
+        vec2: Vector, (3,) or (N, 3)
+        out: Optional result array
+
+    Outputs:
+        outvec: vec1 x vec2, (3,) or (N, 3)
+    """
+    if out is None and isvec(vec1) and isvec(vec2):
+        return np.array(vec3.cross3(vec1, vec2), dtype=float)
+    vec1 = np.asarray(vec1, dtype=float)
+    vec2 = np.asarray(vec2, dtype=float)
+    out = _out(out, np.broadcast_shapes(vec1.shape, vec2.shape))
+    x1, y1, z1 = vec1[..., 0], vec1[..., 1], vec1[..., 2]
+    x2, y2, z2 = vec2[..., 0], vec2[..., 1], vec2[..., 2]
+    out[..., 0] = y1 * z2 - z1 * y2
+    out[..., 1] = z1 * x2 - x1 * z2
+    out[..., 2] = x1 * y2 - y1 * x2
+    return out
+
+
+def norm(vec, out=None):
+    """
+    Magnitude of vectors.
+
+    Inputs:
+        vec: Vector, (3,) or (N, 3)
+        out: Optional result array
+
+    Outputs:
+        magvec: |vec|, np.float64 or (N,)
+    """
+    if out is None and isvec(vec):
+        return np.float64(vec3.mag3(vec))
+    vec = np.asarray(vec, dtype=float)
+    out = dot(vec, vec, out)
+    return np.sqrt(out, out=out) if isinstance(out, np.ndarray) else np.sqrt(out)
+
+
+def unit(vec, out=None):
+    """
+    Unit vectors.
+
+    Inputs:
+        vec: Vector, (3,) or (N, 3)
+        out: Optional result array
+
+    Outputs:
+        outvec: vec / |vec|, zero where |vec| is below small, (3,) or (N, 3)
+    """
+    if out is None and isvec(vec):
+        return np.array(vec3.unit3(vec, small), dtype=float)
+    vec = np.asarray(vec, dtype=float)
+    magvec = np.asarray(norm(vec))
+    scale = np.divide(1.0, magvec, out=np.zeros_like(magvec), where=magvec > small)
+    return np.multiply(vec, scale[..., None], out=_out(out, vec.shape))
+
+
+def angle(vec1, vec2, out=None):
+    """
+    Angle between vectors.
+
+    The angle is found as atan2(|vec1 x vec2|, vec1 . vec2), which keeps full
+    precision near 0 and pi where the arccos of the dot product loses it, and
+    needs no clipping of the cosine.
+
+    Inputs:
+        vec1: Vector, (3,) or (N, 3)
+        vec2: Vector, (3,) or (N, 3)
+        out: Optional result array
+
+    Outputs:
+        theta: Angle between the vectors, 0.0 to pi (rad), np.float64 or (N,)
+    """
+    if out is None and isvec(vec1) and isvec(vec2):
+        return np.float64(vec3.angle3(vec1, vec2))
+    vec1 = np.asarray(vec1, dtype=float)
+    vec2 = np.asarray(vec2, dtype=float)
+    sinv = norm(cross(vec1, vec2))
+    cosv = dot(vec1, vec2)
+    return np.arctan2(sinv, cosv, out=out)
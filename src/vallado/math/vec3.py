@@ -0,0 +1,71 @@
+"""
+Kernels on a single 3 vector or 3x3 matrix using only the math module.
+
+For one state the fixed cost of numpy calls on 3 element arrays is far larger
+than the arithmetic, so smallmat hands single vectors to these kernels. They
+evaluate the same expressions in the same order as the array path, so the
+results agree. Inputs may be lists, tuples or numpy arrays. The kernels
+return vectors as lists and scalars as floats; smallmat wraps them, so its
+single vector results are still numpy arrays and np.float64 scalars.
+"""
+
+import math
+
+import numpy as np
+
+
+def _floats(vec):
+    """Components of a vector or rows of a matrix as Python floats."""
+    return vec.tolist() if isinstance(vec, np.ndarray) else vec
+
+
+def dot3(vec1, vec2):
+    """Dot product of two 3 vectors."""
+    x1, y1, z1 = _floats(vec1)
+    x2, y2, z2 = _floats(vec2)
+    return x1 * x2 + y1 * y2 + z1 * z2
+
+
+def cross3(vec1, vec2):
+    """Cross product of two 3 vectors."""
+    x1, y1, z1 = _floats(vec1)
+    x2, y2, z2 = _floats(vec2)
+    return [y1 * z2 - z1 * y2, z1 * x2 - x1 * z2, x1 * y2 - y1 * x2]
+
+
+def mag3(vec):
+    """Magnitude of a 3 vector."""
+    x, y, z = _floats(vec)
+    return math.sqrt(x * x + y * y + z * z)
+
+
+def unit3(vec, small=1.0e-8):
+    """Unit vector, zero when the magnitude is below small."""
+    x, y, z = _floats(vec)
+    magvec = math.sqrt(x * x + y * y + z * z)
+    scale = 1.0 / magvec if magvec > small else 0.0
+    return [x * scale, y * scale, z * scale]
+
+
+def angle3(vec1, vec2):
+    """Angle between two 3 vectors, 0.0 to pi (rad), from atan2 of the cross and dot products."""
+    x1, y1, z1 = _floats(vec1)
+    x2, y2, z2 = _floats(vec2)
+    cx = y1 * z2 - z1 * y2
+    cy = z1 * x2 - x1 * z2
+    cz = x1 * y2 - y1 * x2
+    return math.atan2(math.sqrt(cx * cx + cy * cy + cz * cz), x1 * x2 + y1 * y2 + z1 * z2)
+
+
+def matvec3(mat, vec):
+    """Product of a 3x3 matrix and a 3 vector."""
+    (a, b, c), (d, e, f), (g, h, i) = _floats(mat)
+    x, y, z = _floats(vec)
+    return [a * x + b * y + c * z, d * x + e * y + f * z, g * x + h * y + i * z]
+
+
+def mattvec3(mat, vec):
+    """Product of a transposed 3x3 matrix and a 3 vector."""
+    (a, b, c), (d, e, f), (g, h, i) = _floats(mat)
+    x, y, z = _floats(vec)
+    return [a * x + d * y + g * z, b * x + e * y + h * z, c * x + f * y + i * z]
@@ -0,0 +1,22 @@
+"""
+Geomagnetic index conversions.
+
+The modules are imported on first access, vallado.spaceweather.<module>; the routines
+themselves are attributes of the vallado package.
+"""
+
+import importlib
+
+_modules = (
+    'ap2kp',
+)
+
+
+def __getattr__(name):
+    if name in _modules:
+        return importlib.import_module('.' + name, __name__)
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_modules))
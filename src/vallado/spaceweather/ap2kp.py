@@ -1,7 +1,10 @@
-from cubicspl import cubicspl
-from cubic import cubic
+from ..math.cubicspl import cubicspl
+from ..math.cubic import cubic
+from ..diagnostics import getlogger
 
-def ap2kp(apin):
+_log = getlogger(__name__)
+
+def ap2kp(apin, info=False):
     """
     Convert ap to kp using cubic splines.
 
@@ -9,9 +12,12 @@ def ap2kp(apin):
 
     Inputs:
     - apin: ap
+    - info: True to also return whether a root was found
 
     Outputs:
     - kpout: kp
+    - found: only with info=True, False when no root of the ap spline lies in
+      [0, 1] and the first point of the interval was used
 
     References:
     - Vallado, 2004, 899-901
@@ -25,8 +31,7 @@ def ap2kp(apin):
           6.0, 6.33333, 6.66667, 7.0, 7.33333, 7.66667, 8.0, 8.33333, 8.66667, 9.0, 9.33333]
 
     kpout = 0.0
-    t1 = 0.0
-    t2 = 0.0
+    found = True
 
     i = 0
     while i < 30 and apin > ap[i]:
@@ -37,13 +42,13 @@ def ap2kp(apin):
         p2 = kp[i - 1]
         p3 = kp[i]
         p4 = kp[i + 1]
-        ac0, ac1, ac2, ac3 = cubicspl(p1, p2, p3, p4, t1, t2)
+        ac0, ac1, ac2, ac3 = cubicspl(p1, p2, p3, p4)
 
         p1 = ap[i - 2]
         p2 = ap[i - 1]
         p3 = ap[i]
         p4 = ap[i + 1]
-        kac0, kac1, kac2, kac3 = cubicspl(p1, p2, p3, p4, t1, t2)
+        kac0, kac1, kac2, kac3 = cubicspl(p1, p2, p3, p4)
 
         r1r, _, r2r, _, r3r, _ = cubic(kac3, kac2, kac1, kac0 - apin, 'R')
 
@@ -57,8 +62,11 @@ def ap2kp(apin):
             apval = r[2]
         else:
             apval = 0.0
-            print('error in root %11.7f %3i %11.7f %11.7f %11.7f' % (apin, i, r[0], r[1], r[2]))
+            found = False
+            _log.warning('no root in [0, 1] for ap %11.7f %3i %11.7f %11.7f %11.7f', apin, i, r[0], r[1], r[2])
 
         kpout = ac3 * apval**3 + ac2 * apval**2 + ac1 * apval + ac0
 
+    if info:
+        return kpout, found
     return kpout
\ No newline at end of file
@@ -0,0 +1,132 @@
+"""
+Nested timing spans exported as Chrome trace-event JSON.
+
+While tracing is enabled, every instrumented routine and every stage wrapped in
+a span is recorded as a complete ('X') event. The file written by export can be
+opened offline in chrome://tracing or Perfetto, where nested calls show as a
+timeline (for example cirs2ecefiau06 -> iau06pna -> series sums).
+
+    from vallado import timeline
+    timeline.enable()
+    cirs2ecefiau06(...)
+    timeline.export('reduction.json')
+
+When tracing is disabled span returns a shared do-nothing context manager.
+A helper that evaluates a whole stage can instead be decorated with spanned,
+so the routine calling it keeps its own layout.
+
+Locals:
+    _enabled: True when spans are being recorded
+    _events: List of recorded trace events
+"""
+
+import functools
+import json
+import os
+import threading
+import time
+
+_enabled = False
+_events = []
+_t0 = time.perf_counter()
+
+
+class _NullSpan:
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_nullspan = _NullSpan()
+
+
+class _Span:
+    def __init__(self, name, cat, args):
+        self.name = name
+        self.cat = cat
+        self.args = args
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        end = time.perf_counter()
+        event = {'name': self.name,
+                 'cat': self.cat,
+                 'ph': 'X',
+                 'ts': (self.start - _t0) * 1.0e6,  # us
+                 'dur': (end - self.start) * 1.0e6,
+                 'pid': os.getpid(),
+                 'tid': threading.get_ident()}
+        if self.args:
+            event['args'] = self.args
+        _events.append(event)
+        return False
+
+
+def enable():
+    """Start recording spans."""
+    global _enabled
+    _enabled = True
+
+
+def disable():
+    """Stop recording spans. Events recorded so far are kept."""
+    global _enabled
+    _enabled = False
+
+
+def isenabled():
+    return _enabled
+
+
+def reset():
+    """Discard all recorded events."""
+    del _events[:]
+
+
+def span(name, cat='stage', **args):
+    """
+    Context manager timing the enclosed block as one trace event.
+
+    Inputs:
+        name: Event name shown on the timeline
+        cat: Event category ('call' for routines, 'stage' for blocks inside them)
+        args: Extra values attached to the event
+    """
+    if not _enabled:
+        return _nullspan
+    return _Span(name, cat, args)
+
+
+def spanned(name, cat='stage'):
+    """
+    Decorator timing each call of a function as one trace event.
+
+    Usage:
+        @spanned('series sums')
+        def _powersum(coef, blocks, trig, tpow, rows=None): ...
+    """
+    def decorate(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not _enabled:
+                return func(*args, **kwargs)
+            with _Span(name, cat, None):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorate
+
+
+def events():
+    """Return a copy of the recorded events."""
+    return list(_events)
+
+
+def export(path):
+    """Write the recorded events to path in the Chrome trace-event format."""
+    with open(path, 'w') as f:
+        json.dump({'traceEvents': _events, 'displayTimeUnit': 'ms'}, f)
@@ -0,0 +1,33 @@
+"""Double-r angles-only orbit determination."""
+
+import logging
+
+import numpy as np
+
+from vallado.iod.anglesdr import anglesdr
+
+
+def sightings():
+    t = np.array([-300.0, 0.0, 300.0])
+    u = 0.1 + np.sqrt(398600.4415 / 8000.0 ** 3) * t
+    r = 8000.0 * np.stack((np.cos(u), np.sin(u) * np.cos(0.9), np.sin(u) * np.sin(0.9)), axis=1)
+    rs = 6378.1363 * np.stack((np.cos(0.4) * np.cos(7.292115e-5 * t), np.cos(0.4) * np.sin(7.292115e-5 * t),
+                               np.full(3, np.sin(0.4))), axis=1)
+    rho = r - rs
+    rtasc = np.arctan2(rho[:, 1], rho[:, 0])
+    decl = np.arcsin(rho[:, 2] / np.linalg.norm(rho, axis=1))
+    jd = 2451545.0 + t / 86400.0
+    return (decl[0], decl[1], decl[2], rtasc[0], rtasc[1], rtasc[2], jd[0], 0.0, jd[1], 0.0, jd[2], 0.0,
+            rs[0], rs[1], rs[2], 6378.1363, 398600.4415)
+
+
+def test_trace_does_not_change_solution(caplog):
+    r2, v2 = anglesdr(*sightings())
+    r2i, v2i, details = anglesdr(*sightings(), info=True)
+    with caplog.at_level(logging.DEBUG, logger='vallado'):
+        r2d, v2d = anglesdr(*sightings())
+
+    assert np.array_equal(r2, r2i) and np.array_equal(v2, v2i)
+    assert np.array_equal(r2, r2d) and np.array_equal(v2, v2d)
+    assert len(details['history']) == details['iterations']
+    assert set(details['history'][0]) >= {'p', 'a', 'ecc', 'incl', 'raan', 'argp', 'nu', 'm', 'q1', 'deltar1'}
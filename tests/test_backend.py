@@ -0,0 +1,42 @@
+"""Parity of the kernel loops with their numpy references."""
+
+import os
+
+import pytest
+
+from vallado import backend
+
+
+@pytest.mark.parametrize('name, tol', [('poisson', 1e-12), ('elliptic12', 1e-12)])
+def test_parity(name, tol):
+    # compiled with numba when installed, run as plain Python otherwise
+    diffs = backend.parity([name])
+    assert diffs[name] < tol
+
+
+@pytest.mark.parametrize('name, tol', [('poisson', 1e-12), ('elliptic12', 1e-12)])
+def test_parity_compiled(name, tol):
+    pytest.importorskip('numba')
+    diffs = backend.parity([name])
+    assert backend._kernels[name]['jit'] is not None
+    assert diffs[name] < tol
+
+
+@pytest.mark.skipif('VALLADO_BACKEND' in os.environ, reason='backend chosen by VALLADO_BACKEND')
+def test_default_backend():
+    from vallado.frames import iau06trig  # registers 'poisson'
+    expected = 'numba' if backend._hasnumba else 'numpy'
+    assert backend.setbackend() == expected
+    assert backend.compiled('poisson') == (expected == 'numba')
+
+
+def test_setbackend_override():
+    old = backend.setbackend()
+    try:
+        assert backend.setbackend('numpy') == 'numpy'
+        from vallado.frames import iau06trig
+        assert backend.kernel('poisson') is backend._kernels['poisson']['ref']
+    finally:
+        backend.setbackend(old)
+    with pytest.raises(ValueError):
+        backend.setbackend('fortran')
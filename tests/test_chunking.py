@@ -0,0 +1,77 @@
+"""Chunked runs along the epoch axis."""
+
+import numpy as np
+import pytest
+
+from vallado import chunking
+from vallado.chunking import chunked, chunks, scratch
+from vallado.frames.iau06frame import iau06frame
+from vallado.frames.iau06xys import iau06xys
+
+
+@pytest.fixture
+def budget():
+    old = chunking.setbudget()
+    chunking.setbudget(1)
+    yield
+    chunking.setbudget(old)
+
+
+def test_chunks_cover_and_respect_minimum():
+    for n in (257, 1000, 5000):
+        parts = chunks(n, 10**9)
+        assert parts[0].start == 0 and parts[-1].stop == n
+        assert all(a.stop == b.start for a, b in zip(parts[:-1], parts[1:]))
+        assert min(sl.stop - sl.start for sl in parts) >= chunking._minimum
+
+
+def test_iau06frame_matches_unchunked(budget):
+    ttt = np.linspace(-0.1, 0.2, 1000)
+    jdut1 = 2451545.0 + ttt * 36525.0
+    chunked_out = iau06frame(ttt, list(jdut1), 1.0e-6, 2.0e-6, 'c')
+    chunking.setbudget(2**40)
+    whole = iau06frame(ttt, jdut1, 1.0e-6, 2.0e-6, 'c')
+    for a, b in zip(chunked_out, whole):
+        assert a.shape == (1000, 3, 3)
+        assert np.max(np.abs(a - b)) < 1.0e-15
+
+
+def test_iau06xys_per_epoch_corrections(budget):
+    ttt = np.linspace(-0.1, 0.2, 600)
+    ddx = list(np.linspace(0.0, 1.0e-9, 600))
+    x = iau06xys(ttt, ddx, 0.0)[0]
+    chunking.setbudget(2**40)
+    assert np.max(np.abs(x - iau06xys(ttt, np.asarray(ddx), 0.0)[0])) < 1.0e-18
+
+
+def test_only_epoch_arguments_sliced(budget):
+    seen = []
+
+    @chunked(lambda: 1, epochs=('rates',))
+    def run(ttt, rates, table):
+        seen.append((len(rates), len(table)))
+        return ttt + rates
+
+    ttt = np.zeros(600)
+    table = list(range(600))  # same length, not per epoch
+    out = run(ttt, list(np.ones(600)), table)
+    assert np.all(out == 1.0)
+    assert len(seen) > 1
+    assert all(r < 600 and t == 600 for r, t in seen)
+
+
+def test_scratch_reused_across_chunks(budget):
+    bases = []
+
+    @chunked(lambda: 1)
+    def run(ttt):
+        buf = scratch((3, ttt.shape[0]))
+        bases.append(buf.base if buf.base is not None else buf)
+        buf[:] = ttt
+        return buf.sum(axis=0)
+
+    out = run(np.arange(1000.0))
+    assert np.all(out == 3.0 * np.arange(1000.0))
+    assert len(bases) > 1
+    assert all(b is bases[0] for b in bases)
+    assert chunking._local.pool is None
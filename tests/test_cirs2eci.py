@@ -0,0 +1,31 @@
+"""CIRS - GCRF transforms."""
+
+import numpy as np
+
+from vallado.frames.cirs2eciiau06 import cirs2eciiau06
+from vallado.frames.eci2cirsiau06 import eci2cirsiau06
+
+r = [-1033.4793830, 7901.2952754, 6380.3565958]
+v = [-3.225636520, -2.872451450, 5.531924446]
+a = [0.001, 0.002, 0.003]
+
+
+def test_round_trip_single():
+    ttt = 0.0426236319
+    rcirs, vcirs, acirs = eci2cirsiau06(r, v, a, ttt)
+    assert rcirs.shape == (3,)
+    reci, veci, aeci = cirs2eciiau06(rcirs, vcirs, acirs, ttt)
+    assert np.max(np.abs(reci - r)) < 1.0e-8
+    assert np.max(np.abs(veci - v)) < 1.0e-11
+    assert np.max(np.abs(aeci - a)) < 1.0e-15
+
+
+def test_stack_matches_single():
+    ttt = np.linspace(0.0, 0.1, 4)
+    rs = np.tile(r, (4, 1))
+    stacked = eci2cirsiau06(rs, rs, rs, ttt, 'a')[0]
+    for i in range(4):
+        single = eci2cirsiau06(r, r, r, ttt[i], 'a')[0]
+        assert np.max(np.abs(stacked[i] - single)) < 1.0e-8
+    # one vector against a stack of epochs
+    assert np.max(np.abs(eci2cirsiau06(r, v, a, ttt, 'a')[0] - stacked)) < 1.0e-8
@@ -0,0 +1,37 @@
+"""UTC to UT1 and TT."""
+
+import numpy as np
+import pytest
+
+from vallado.frames.convtime import convtime
+
+
+def test_vallado_example():
+    # Vallado 2013, example 3-7: 14 May 2004 16:43 UTC, dut1 -0.463326 s
+    ttt, jdut1, jdut1frac, jdtt, jdttfrac, tut1, dat, dut1 = convtime(2453139.5, (16 * 60 + 43) / 1440.0, -0.463326)
+    assert dat == 32.0
+    assert abs(jdut1 + jdut1frac - 2453140.196522415) < 1.0e-9
+    assert abs(jdtt + jdttfrac - 2453140.197270648) < 1.0e-9
+    assert abs(ttt - 0.043674121031) < 1.0e-12
+    assert 0.0 <= jdut1frac < 1.0 and 0.0 <= jdttfrac < 1.0
+
+
+def test_leap_seconds():
+    # 1 Jan 1999 (MJD 51179) took TAI-UTC from 31 to 32 s, 1 Jan 2017 to 37 s
+    jd = 2400000.5 + np.array([51178.0, 51179.0, 57753.0, 57754.0])
+    dat = convtime(jd, 0.5)[6]
+    assert np.all(dat == [31.0, 32.0, 36.0, 37.0])
+    assert np.all(convtime(jd[0], 0.999999)[6] == 31.0)
+
+
+def test_array_matches_scalar():
+    jd = 2453139.5 + np.arange(3.0)
+    out = convtime(jd, 0.25, [-0.4, -0.41, -0.42])
+    for i in range(3):
+        single = convtime(jd[i], 0.25, [-0.4, -0.41, -0.42][i])
+        assert all(np.asarray(a)[i] == b for a, b in zip(out[:7], single[:7]))
+
+
+def test_before_table_raises():
+    with pytest.raises(ValueError):
+        convtime(2400000.5 + 41000.0)
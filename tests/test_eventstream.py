@@ -0,0 +1,41 @@
+"""Zero crossings from a stream of sampled chunks."""
+
+import numpy as np
+
+from vallado.math.cubicspl1 import cubicspl1
+from vallado.math.eventstream import eventstream
+
+t = np.linspace(0.0, 20.0, 2001)
+f = np.sin(t)
+
+
+def split(size):
+    return ((t[i:i + size], f[i:i + size]) for i in range(0, t.size, size))
+
+
+def test_chunked_matches_whole():
+    whole = list(eventstream([(t, f)]))
+    for size in (7, 100, 333):
+        parts = list(eventstream(split(size)))
+        assert len(parts) == len(whole)
+        assert np.allclose(parts, whole, rtol=0.0, atol=1.0e-12)
+
+
+def test_event_times():
+    events = list(eventstream(split(50)))
+    tevent = np.array([e[0] for e in events])
+    rate = np.array([e[1] for e in events])
+    assert np.allclose(tevent, np.pi * np.arange(1, 7), atol=1.0e-6)
+    assert np.allclose(rate, np.cos(tevent), atol=1.0e-4)
+
+
+def test_cubicspl1_root():
+    # sin sampled every 0.1, crossing zero 0.2 of the way from p2 to p3
+    minfound, rootf, funrate = cubicspl1(*np.sin([-0.12, -0.02, 0.08, 0.18]))
+    assert minfound == 'y'
+    assert abs(rootf - 0.2) < 1.0e-3
+    assert abs(funrate - 0.1) < 1.0e-4
+
+
+def test_cubicspl1_no_root():
+    assert cubicspl1(1.0, 1.2, 1.3, 1.2) == ('n', 0.0, 0.0)
@@ -0,0 +1,48 @@
+"""Bounded cache of the frame rotations."""
+
+import numpy as np
+import pytest
+
+from vallado.frames.framecache import FrameCache
+from vallado.frames.iau06frame import iau06frame
+
+ttt = 0.0426236319
+jdut1 = 2453101.827406783
+
+
+def test_hits_and_misses():
+    cache = FrameCache(maxsize=8, step=0.001)
+    first = cache.frame(ttt, jdut1)
+    assert cache.stats()['misses'] == 1 and cache.hits == 0
+
+    # same epoch, and an epoch moved by less than half a step, share the entry
+    again = cache.frame(ttt, jdut1)
+    near = cache.frame(ttt + 0.0002 / 86400.0 / 36525.0, jdut1 + 0.0002 / 86400.0)
+    assert cache.hits == 2 and cache.misses == 1
+    for a, b, c in zip(first, again, near):
+        assert np.array_equal(a, b) and np.array_equal(a, c)
+
+    # a full step away, or other EOP, is a new entry
+    cache.frame(ttt, jdut1 + 0.001 / 86400.0)
+    cache.frame(ttt, jdut1, xp=1.0e-6)
+    assert cache.misses == 3 and len(cache) == 3
+    assert cache.stats()['hitrate'] == pytest.approx(0.4)
+
+
+def test_stack_counts_repeats_and_evicts():
+    cache = FrameCache(maxsize=2)
+    t = np.array([ttt, ttt, ttt + 1.0e-6, ttt + 2.0e-6])
+    pnb, st, pm = cache.frame(t, jdut1 + (t - ttt) * 36525.0)
+    assert pnb.shape == (4, 3, 3)
+    assert cache.misses == 3 and cache.hits == 1
+    assert cache.evictions == 1 and len(cache) == 2
+    cache.clear()
+    assert len(cache) == 0 and cache.stats()['misses'] == 0
+
+
+def test_matches_iau06frame_at_rounded_epoch():
+    cache = FrameCache(step=1.0)
+    t = np.round(ttt * 36525.0 * 86400.0) / 86400.0 / 36525.0
+    jd = 2451545.0 + np.round((jdut1 - 2451545.0) * 86400.0) / 86400.0
+    for a, b in zip(cache.frame(ttt, jdut1), iau06frame(t, jd)):
+        assert np.max(np.abs(a - b)) < 1.0e-15
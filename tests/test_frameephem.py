@@ -0,0 +1,60 @@
+"""Memory-mapped frame ephemeris."""
+
+import numpy as np
+import pytest
+
+from vallado.frames.eopstore import EOPStore
+from vallado.frames.frameephem import FrameEphem, frameephem
+from vallado.frames.iau06frame import iau06framerates
+
+start = 2460000.5
+
+
+def store(shift=0.0):
+    mjd = start - 2400000.5 + np.arange(-2.0, 3.0)
+    zero = np.zeros(5)
+    return EOPStore(mjd, zero + 1.0e-6 + shift, zero + 2.0e-6, zero - 0.1, zero + 0.001,
+                    zero, zero, zero, zero, zero + 37.0)
+
+
+def test_matches(tmp_path):
+    eop = store()
+    frameephem(tmp_path / 'eop.eph', start, 60.0, 5, eop=eop)
+    frameephem(tmp_path / 'none.eph', start, 60.0, 5)
+    witheop = FrameEphem(tmp_path / 'eop.eph')
+    without = FrameEphem(tmp_path / 'none.eph')
+
+    assert witheop.matches(eop)
+    assert witheop.matches(store())       # same contents, same digest
+    assert not witheop.matches(store(1.0e-9))
+    assert not witheop.matches()
+    assert without.matches()
+    assert not without.matches(eop)
+    assert not without.matches(xp=1.0e-6)
+    assert not without.matches(lod=np.array([0.0, 0.001]))
+
+
+def test_interpolation_error(tmp_path):
+    frameephem(tmp_path / 'grid.eph', start, 60.0, 21, ttmut1=69.184)
+    ephem = FrameEphem(tmp_path / 'grid.eph')
+    jd = start + np.linspace(0.3, 19.7, 37) * 60.0 / 86400.0
+    ttt = (jd + 69.184 / 86400.0 - 2451545.0) / 36525.0
+
+    pnb, trot, tdot = ephem.frame(jd)
+    pnbd, w, wdot, _ = iau06framerates(ttt, jd)
+    pnbt = np.swapaxes(pnbd, -1, -2)
+    assert np.max(np.abs(pnb - pnbd)) < 1.0e-10
+    assert np.max(np.abs(trot - w @ pnbt)) < 1.0e-10
+    assert np.max(np.abs(tdot - wdot @ pnbt)) < 1.0e-11  # 1/s, the rate is 7.3e-5
+
+    # ephem used by the transforms gives the same result
+    assert np.max(np.abs(iau06framerates(ttt, jd, ephem=ephem)[1] - trot @ pnb)) < 1.0e-15
+
+
+def test_outside_span(tmp_path):
+    frameephem(tmp_path / 'grid.eph', start, 60.0, 5)
+    ephem = FrameEphem(tmp_path / 'grid.eph')
+    jd = start + 300.0 / 86400.0
+    assert not ephem.covers(jd)
+    with pytest.raises(ValueError):
+        ephem.frame(jd)
@@ -0,0 +1,35 @@
+"""Fused GCRF - ITRF transforms."""
+
+import numpy as np
+
+from vallado.frames.gcrf2itrf import gcrf2itrf
+from vallado.frames.itrf2gcrf import itrf2gcrf
+
+r = np.array([5102.508958, 6123.011401, 6378.136928])
+v = np.array([-4.743220, 0.790536, 5.533756])
+a = np.array([0.001, 0.002, 0.003])
+ttt = 0.0426236319
+jdut1 = 2453101.827406783
+eop = dict(lod=0.0015563, xp=-0.140682 * np.pi / 648000.0, yp=0.333309 * np.pi / 648000.0)
+
+
+def test_round_trip():
+    for option in ('a', 'b', 'c'):
+        recef, vecef, aecef = gcrf2itrf(r, v, a, ttt, jdut1, option=option, **eop)
+        assert abs(np.linalg.norm(recef) - np.linalg.norm(r)) < 1.0e-8
+        back = itrf2gcrf(recef, vecef, aecef, ttt, jdut1, option=option, **eop)
+        assert np.max(np.abs(back[0] - r)) < 1.0e-8
+        assert np.max(np.abs(back[1] - v)) < 1.0e-11
+        assert np.max(np.abs(back[2] - a)) < 1.0e-14
+
+
+def test_stack_matches_single():
+    dt = np.linspace(0.0, 1.0, 5)
+    tttn = ttt + dt / 36525.0
+    jdn = jdut1 + dt
+    rs, vs, acc = np.tile(r, (5, 1)), np.tile(v, (5, 1)), np.tile(a, (5, 1))
+    stacked = gcrf2itrf(rs, vs, acc, tttn, jdn, **eop)
+    for i in range(5):
+        single = gcrf2itrf(r, v, a, tttn[i], jdn[i], **eop)
+        for s, m in zip(stacked, single):
+            assert np.max(np.abs(s[i] - m)) < 1.0e-9
@@ -0,0 +1,23 @@
+"""Earth rotation angle on a grid."""
+
+import numpy as np
+
+from vallado.frames.iau06era import iau06era, iau06eragrid
+
+
+def test_grid_matches_direct():
+    # a step of 1/1024 day keeps every grid epoch exact as a Julian date
+    step = 86400.0 / 1024.0
+    jdut1 = 2460000.5 + np.arange(5000) * step / 86400.0
+    era, st = iau06era(jdut1)
+    for anchor in (64, 1024):
+        erag, stg = iau06eragrid(2460000.5, step, 5000, anchor)
+        diff = np.abs(erag - era)
+        assert np.max(np.minimum(diff, 2.0 * np.pi - diff)) < 1.0e-10
+        assert np.max(np.abs(stg - st)) < 1.0e-10
+
+
+def test_short_grid():
+    era, st = iau06eragrid(2460000.5, 60.0, 3)
+    assert era.shape == (3,) and st.shape == (3, 3, 3)
+    assert abs(era[0] - iau06era(2460000.5)[0]) < 1.0e-10
@@ -0,0 +1,16 @@
+"""Location of the IAU 2006 data files."""
+
+import os
+import subprocess
+import sys
+
+SRC = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src')
+
+
+def test_series_read_vallado_data(tmp_path):
+    # a fresh interpreter, iau06in keeps the tables of its first call
+    env = dict(os.environ, VALLADO_DATA=str(tmp_path), PYTHONPATH=SRC)
+    run = subprocess.run([sys.executable, '-c', 'import vallado; vallado.iau06xys(0.1, 0.0, 0.0)'],
+                         env=env, capture_output=True, text=True)
+    assert run.returncode != 0
+    assert str(tmp_path) in run.stderr
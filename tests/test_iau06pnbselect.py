@@ -0,0 +1,20 @@
+"""Selection of pnb for the CIRS - GCRF transforms."""
+
+import numpy as np
+import pytest
+
+from vallado.frames.iau06frame import iau06frame, iau06pnbselect
+
+
+def test_unknown_option_raises():
+    with pytest.raises(ValueError):
+        iau06pnbselect(0.1, 'd')
+    with pytest.raises(ValueError):
+        iau06frame(0.1, 2451545.0, option='d')
+
+
+@pytest.mark.parametrize('option', ['a', 'b', 'c'])
+def test_matches_iau06frame(option):
+    ttt = np.linspace(0.0, 0.2, 5)
+    pnb = iau06pnbselect(ttt, option)
+    assert np.max(np.abs(pnb - iau06frame(ttt, 2451545.0 + ttt * 36525.0, option=option)[0])) < 1.0e-15
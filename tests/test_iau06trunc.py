@@ -0,0 +1,41 @@
+"""Truncated IAU 2006 series."""
+
+import numpy as np
+import pytest
+
+from vallado import backend
+
+from vallado.frames.iau06trig import TrigTable
+from vallado.frames.iau06trunc import iau06trunc
+from vallado.frames.iau06xys import iau06xys
+from vallado.frames.iau06pna import iau06pna
+from vallado.frames.fundarg import fundargvec
+
+ttt = np.linspace(-0.2, 0.3, 50)
+
+
+def test_outputs_do_not_depend_on_accuracy():
+    assert len(iau06xys(ttt, 0.0, 0.0)) == len(iau06xys(ttt, 0.0, 0.0, accuracy=1000.0)) == 4
+    assert len(iau06pna(ttt)) == len(iau06pna(ttt, accuracy=1000.0)) == 18
+
+
+def test_error_within_bound():
+    accuracy = 1.0e6
+    full = iau06xys(ttt, 0.0, 0.0)
+    part = iau06xys(ttt, 0.0, 0.0, accuracy=accuracy)
+    convrt = 1.0e-6 * np.pi / (180.0 * 3600.0)
+    for series, a, b in zip('xy', full, part):
+        rows, bound = iau06trunc(series, accuracy)
+        assert rows.size < {'x': 1600, 'y': 1275}[series]
+        assert np.max(np.abs(a - b)) / convrt <= bound
+
+
+@pytest.mark.skipif(backend.compiled('poisson'), reason='the compiled kernel sums without a TrigTable')
+def test_trig_only_for_kept_rows():
+    trig = TrigTable(fundargvec(ttt, '06'))
+    iau06xys(ttt, 0.0, 0.0, accuracy=3.0e6, trig=trig)
+    kept = trig.done.sum()
+
+    full = TrigTable(fundargvec(ttt, '06'))
+    iau06xys(ttt, 0.0, 0.0, trig=full)
+    assert kept < full.done.sum()
@@ -0,0 +1,62 @@
+"""Nested spans of the timeline trace."""
+
+import json
+
+import numpy as np
+import pytest
+
+from vallado import timeline
+from vallado.frames.iau06xys import iau06xys
+from vallado.iod.anglesdr import anglesdr
+
+
+@pytest.fixture
+def tracing():
+    timeline.reset()
+    timeline.enable()
+    yield
+    timeline.disable()
+    timeline.reset()
+
+
+def within(inner, outer):
+    return outer['ts'] <= inner['ts'] and inner['ts'] + inner['dur'] <= outer['ts'] + outer['dur']
+
+
+def test_series_stages_nest_in_call(tracing):
+    iau06xys(np.linspace(0.0, 0.1, 5), 0.0, 0.0)
+    events = timeline.events()
+    call = [e for e in events if e['name'] == 'iau06xys']
+    stages = [e for e in events if e['name'] == 'series sums']
+    assert len(call) == 1 and call[0]['cat'] == 'call'
+    assert stages and all(e['cat'] == 'stage' and within(e, call[0]) for e in stages)
+    assert any(e['name'] == 'fundargvec' and within(e, call[0]) for e in events)
+
+
+def test_double_r_iteration(tracing):
+    t = np.array([-300.0, 0.0, 300.0])
+    u = 0.1 + np.sqrt(398600.4415 / 8000.0 ** 3) * t
+    r = 8000.0 * np.stack((np.cos(u), np.sin(u) * np.cos(0.9), np.sin(u) * np.sin(0.9)), axis=1)
+    rs = 6378.1363 * np.stack((np.cos(0.4) * np.cos(7.292115e-5 * t), np.cos(0.4) * np.sin(7.292115e-5 * t),
+                               np.full(3, np.sin(0.4))), axis=1)
+    rho = r - rs
+    rtasc = np.arctan2(rho[:, 1], rho[:, 0])
+    decl = np.arcsin(rho[:, 2] / np.linalg.norm(rho, axis=1))
+    jd = 2451545.0 + t / 86400.0
+    anglesdr(decl[0], decl[1], decl[2], rtasc[0], rtasc[1], rtasc[2], jd[0], 0.0, jd[1], 0.0, jd[2], 0.0,
+             rs[0], rs[1], rs[2], 6378.1363, 398600.4415)
+
+    events = timeline.events()
+    (call,) = [e for e in events if e['name'] == 'anglesdr']
+    (loop,) = [e for e in events if e['name'] == 'double-r iteration']
+    assert within(loop, call)
+    assert any(e['name'] == 'doubler' and within(e, loop) for e in events)
+
+
+def test_disabled_records_nothing(tmp_path):
+    timeline.reset()
+    iau06xys(0.05, 0.0, 0.0)
+    assert timeline.events() == []
+    timeline.export(str(tmp_path / 'trace.json'))
+    with open(tmp_path / 'trace.json') as f:
+        assert json.load(f)['traceEvents'] == []